@@ -8,7 +8,16 @@ __author__ = ['Patrick J. Burns <patrick@diyclassics.org>',
               'Kyle P. Johnson <kyle@kyle-p-johnson.com>', ]
 __license__ = 'MIT License. See LICENSE.'
 
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
 import re
+import threading
+import unicodedata
+
+from cltk.utils.cltk_data import get_cltk_data_dir
+from cltk.utils.cltk_logger import logger
 
 UPPER = [
     # Perseus-style head words
@@ -363,33 +372,665 @@ PUNCT = [
 ]
 
 
+# characters read from a file at a time when converting it
+CHUNK_SIZE = 64 * 1024
+
+# Most text without a newline that _Tables.iter_convert() holds back before
+# it looks for another place to divide it
+MAX_PENDING = 1024 * 1024
+
+# version of the tables kept on disk; change it when their format changes
+TABLES_VERSION = 1
+
+# directory of the tables kept on disk, within the data directory
+CACHE_DIR = os.path.join('cache', 'beta_to_unicode')
+
+# characters with a meaning in regex patterns, unless escaped
+REGEX_SPECIAL = '.^$*+?{}[]|()'
+
+
+def _literal(pattern):
+    """The text a regex pattern matches, if it matches only one string.
+    :rtype : str
+    :return: The text, or ``None`` if the pattern is not a plain string.
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isalnum():
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in REGEX_SPECIAL:
+            return None
+        else:
+            chars.append(char)
+    if escaped or not chars:
+        return None
+    return ''.join(chars)
+
+
+def _overlaps(keys, outputs):
+    """Whether the result of applying ``keys`` in turn could depend on their
+    order, or on what is next to a replacement, so that they cannot be
+    applied in a single pass. That is, whether a key can match text that
+    starts inside an earlier key and runs past it, or contains the rest of
+    it; or text that overlaps a replacement without lying wholly inside it.
+    :type keys: list
+    :param keys: Strings matched, in order of priority.
+    :type outputs: list
+    :param outputs: ``(replacement, number)`` pairs, for the replacement
+    of key ``number``.
+    :rtype : bool
+    """
+    starts = {}
+    tails = {}
+    for number, key in enumerate(keys):
+        starts.setdefault(key[0], []).append((number, key))
+        for start in range(1, len(key)):
+            tails.setdefault(key[start], []).append((number, key[start:]))
+    for number, key in enumerate(keys):
+        for start in range(1, len(key)):
+            rest = key[start:]
+            for other, other_key in starts.get(rest[0], ()):
+                if other < number and (rest.startswith(other_key) or
+                                       other_key.startswith(rest)):
+                    return True
+    for output, number in outputs:
+        for start in range(len(output)):
+            rest = output[start:]
+            for other, other_key in starts.get(rest[0], ()):
+                if other > number and len(other_key) > len(rest) and \
+                        other_key.startswith(rest):
+                    return True
+        for other, other_rest in tails.get(output[:1], ()):
+            if other > number and (output.startswith(other_rest) or
+                                   other_rest.startswith(output)):
+                return True
+    return False
+
+
+def _live_keys(keys):
+    """Drop keys that can never match, because an earlier key is a prefix of
+    them and is replaced first.
+    :type keys: list
+    :param keys: Strings, in order of priority.
+    :rtype : list
+    """
+    live = []
+    for key in keys:
+        if not any(key.startswith(earlier) for earlier in live):
+            live.append(key)
+    return live
+
+
+def _alternation(keys):
+    """Build a regex matching, at each position, the first of ``keys`` that
+    matches there, as a trie of nested groups so that each character is
+    tested once.
+    :type keys: list
+    :param keys: Strings, in order of priority, none a prefix of a later one.
+    :rtype : str
+    """
+    trie = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def branch(node):
+        """Pattern for the keys below a node of the trie."""
+        alternatives = [re.escape(char) + branch(child)
+                        for char, child in node.items() if char]
+        if '' in node:
+            if not alternatives:
+                return ''
+            alternatives.append('')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:{0})'.format('|'.join(alternatives))
+
+    return branch(trie)
+
+
+class _Tables(object):
+    """What a set of patterns compiles to. One is built for each set of
+    patterns in a process and shared by every ``Replacer`` using them; the
+    single-pass tables are also kept on disk, so that a new process can load
+    them instead of working them out again.
+    """
+
+    def __init__(self, pattern_lists):
+        """
+        :type pattern_lists: list
+        :param pattern_lists: The three lists of ``(pattern, replacement)``
+        pairs.
+        """
+        self.pattern_lists = pattern_lists
+        self.key = _cache_key(pattern_lists)
+        self.single_pass = False
+        self.regex = None
+        self.table = {}
+        self.translation = None
+        self.max_key_length = 0
+        self.newline_safe = False
+        self._state = None
+        self._patterns = None
+        self._lock = threading.Lock()
+
+    @property
+    def patterns(self):
+        """The patterns, compiled at first use, since a single-pass
+        conversion does not need them.
+        :rtype : list
+        """
+        with self._lock:
+            if self._patterns is None:
+                self._patterns = [[(re.compile(regex), repl)
+                                   for (regex, repl) in patterns]
+                                  for patterns in self.pattern_lists]
+        return self._patterns
+
+    def apply_patterns(self, text):
+        """Apply every pattern in turn to the whole of ``text``.
+        :rtype : str
+        """
+        for patterns in self.patterns:
+            for (pattern, repl) in patterns:
+                text = pattern.sub(repl, text)
+        return text
+
+    def build(self):
+        """Work out the single-pass regex and tables, if the patterns allow
+        it.
+        """
+        keys = []
+        outputs = []
+        for patterns in self.patterns:
+            for (pattern, repl) in patterns:
+                key = _literal(pattern.pattern)
+                if key is None:
+                    return
+                if '-' in key:  # hyphens are removed before conversion
+                    continue
+                # a later pattern may go on to change what this one wrote
+                outputs.append((pattern.sub(repl, key), len(keys)))
+                keys.append(key)
+        table = {key: self.apply_patterns(key) for key in keys}
+        outputs.extend((table[key], number) for number, key in enumerate(keys))
+        if _overlaps(keys, outputs):
+            return
+        keys = _live_keys(keys)
+        long_keys = [key for key in keys if len(key) > 1]
+        single = {key: table[key] for key in keys if len(key) == 1}
+        translation = str.maketrans(single)
+        # translate() must leave what the regex wrote alone
+        if all(table[key].translate(translation) == table[key]
+               for key in long_keys):
+            self._load({'keys': long_keys, 'single': single,
+                        'table': {key: table[key] for key in long_keys}})
+        else:
+            self._load({'keys': keys, 'single': None, 'table': table})
+
+    def _load(self, state):
+        """Set up the single-pass conversion from the state written by
+        ``build()`` or kept on disk.
+        :type state: dict
+        :param state: ``keys``, those matched by the regex, in order of
+        priority; ``table``, what each becomes; and ``single``, what the
+        characters left to ``str.translate()`` become, if any.
+        """
+        keys = state['keys']
+        single = state['single']
+        every_key = keys + list(single or ())
+        self.max_key_length = max((len(key) for key in every_key), default=0)
+        # a line end is a safe place to divide a text for streaming
+        self.newline_safe = all('\n' not in key[:-1] for key in every_key)
+        if single is not None:
+            self.translation = str.maketrans(single)
+        if keys:
+            self.regex = re.compile('({0})'.format(_alternation(keys)))
+        self.table = state['table']
+        self.single_pass = True
+        self._state = state
+
+    def convert(self, text):
+        """Convert ``text`` with the single-pass tables, if there are any,
+        else by applying every pattern in turn.
+        :rtype : str
+        """
+        if not self.single_pass:
+            return self.apply_patterns(text)
+        if self.regex is not None:
+            # odd items are the keys found, even ones the text between
+            parts = self.regex.split(text)
+            parts[1::2] = [self.table[key] for key in parts[1::2]]
+            text = ''.join(parts)
+        if self.translation is not None:
+            text = text.translate(self.translation)
+        return text
+
+    def split_point(self, text):
+        """Where ``text`` can be divided, short of a line end, so that
+        converting the parts gives the same result as converting it whole:
+        for a single-pass conversion, after the last key that starts too far
+        from the end to run past it. Patterns applied in turn have no such
+        point.
+        :rtype : int
+        :return: The offset, or 0 if there is none.
+        """
+        if not self.single_pass:
+            return 0
+        if self.regex is None:
+            return len(text)
+        threshold = len(text) - self.max_key_length + 1
+        end = max(threshold, 0)
+        for match in self.regex.finditer(text):
+            if match.start() >= threshold:
+                break
+            end = max(end, match.end())
+        return end
+
+    def iter_convert(self, chunks):
+        """Convert text piece by piece with ``convert()``, holding text back
+        until it can be converted with the same result as the whole: until
+        its line is complete, where line ends are safe to divide at, or,
+        past ``MAX_PENDING`` characters without a newline, until
+        ``split_point()`` finds a place.
+        :type chunks: iterable
+        :param chunks: Strings to convert.
+        :rtype : generator
+        """
+        by_line = not self.single_pass or \
+            (self.newline_safe and self.regex is not None)
+        pending = []
+        size = 0
+        limit = MAX_PENDING
+        for chunk in chunks:
+            end = chunk.rfind('\n') + 1 if by_line else 0
+            if end:
+                pending.append(chunk[:end])
+                yield self.convert(''.join(pending))
+                chunk = chunk[end:]
+                pending = []
+                size = 0
+                limit = MAX_PENDING
+            pending.append(chunk)
+            size += len(chunk)
+            if by_line and size <= limit:
+                continue
+            text = ''.join(pending)
+            end = self.split_point(text)
+            if end:
+                yield self.convert(text[:end])
+                text = text[end:]
+                limit = MAX_PENDING
+            else:
+                # try again once as much text again has come
+                limit = len(text) + MAX_PENDING
+            pending = [text]
+            size = len(text)
+        text = ''.join(pending)
+        if text:
+            yield self.convert(text)
+
+    def cache_path(self):
+        """File keeping these tables on disk.
+        :rtype : str
+        """
+        return os.path.join(get_cltk_data_dir(), CACHE_DIR,
+                            '{0}.json'.format(self.key))
+
+    def read_cache(self):
+        """Load the tables kept on disk, if any.
+        :rtype : bool
+        :return: Whether they were loaded.
+        """
+        try:
+            with open(self.cache_path(), encoding='utf-8') as cache_file:
+                state = json.load(cache_file)
+        except (OSError, ValueError):
+            return False
+        if state.get('key') != self.key:
+            return False
+        if state['single_pass']:
+            self._load(state)
+        return True
+
+    def write_cache(self):
+        """Keep the tables on disk. The file is written to a temporary file
+        and renamed into place, so that processes starting at the same time
+        never read half of one; failure to write it is not an error.
+        """
+        state = {'key': self.key, 'single_pass': self.single_pass}
+        if self.single_pass:
+            state.update(self._state)
+        cache_path = self.cache_path()
+        tmp_path = '{0}.{1}.tmp'.format(cache_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(state, cache_file, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            logger.info("Could not cache beta code tables at '%s': %s",
+                        cache_path, exc)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# tables built in this process, by cache key
+_TABLES = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def _cache_key(pattern_lists):
+    """Key of the tables for a set of patterns, the same in every process.
+    :type pattern_lists: list
+    :param pattern_lists: The three lists of ``(pattern, replacement)``
+    pairs.
+    :rtype : str
+    """
+    data = json.dumps([TABLES_VERSION, pattern_lists], ensure_ascii=False)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def _get_tables(pattern_lists, cache=True):
+    """The tables for a set of patterns: those already built in this
+    process, else those kept on disk, else newly built ones.
+    :type pattern_lists: list
+    :param pattern_lists: The three lists of ``(pattern, replacement)``
+    pairs.
+    :type cache: bool
+    :param cache: Whether to read and write tables kept on disk.
+    :rtype : _Tables
+    """
+    tables = _Tables(pattern_lists)
+    with _TABLES_LOCK:
+        if tables.key in _TABLES:
+            return _TABLES[tables.key]
+        if not (cache and tables.read_cache()):
+            tables.build()
+            if cache:
+                tables.write_cache()
+        _TABLES[tables.key] = tables
+    return tables
+
+
+def _reverse_patterns(tables):
+    """Patterns converting Unicode back to beta code, made from those of
+    ``tables``. Each text the keys convert to is matched, longest first,
+    and given the first key that converts to it, preferring keys without
+    digits, such as ``S`` to ``S1``, since these are the variant forms. Where
+    the key would be read otherwise before the next character, as ``S``
+    before a space is read as a final sigma, the pair is given a key that is
+    not, if there is one.
+    :type tables: _Tables
+    :param tables: Tables of plain-string patterns.
+    :rtype : list
+    :return: ``(pattern, replacement)`` pairs.
+    """
+    keys = []
+    encodings = {}
+    for patterns in tables.pattern_lists:
+        for (regex, _) in patterns:
+            key = _literal(regex)
+            if key is None:
+                raise ValueError('Only patterns of plain strings can be '
+                                 'reversed: {0}'.format(regex))
+            if '-' in key:  # hyphens are removed before conversion
+                continue
+            keys.append(key)
+            text = unicodedata.normalize('NFC', tables.convert(key))
+            # Latin letters, as the ``c`` of S3, are left alone
+            if text == key or (all(ord(char) < 128 for char in text) and
+                               text.isalpha()):
+                continue
+            encodings.setdefault(text, []).append(key)
+    reverse = {text: min(candidates,
+                         key=lambda key: any(char.isdigit() for char in key))
+               for text, candidates in encodings.items()}
+    starting = {}
+    for text, key in reverse.items():
+        starting.setdefault(key[0], []).append(text)
+    for text, key in list(reverse.items()):
+        for longer in keys:
+            if len(longer) <= len(key) or not longer.startswith(key):
+                continue
+            after = longer[len(key)]
+            following = starting.get(after, [])
+            if after not in reverse:  # left as it is
+                following = following + [after]
+            for char in following:
+                if text + char in reverse:
+                    continue
+                encoded = reverse.get(char, char)
+                if tables.convert(key + encoded) == text + char:
+                    continue
+                for other in encodings[text]:
+                    if tables.convert(other + encoded) == text + char:
+                        reverse[text + char] = other + encoded
+                        break
+    return [(re.escape(text), reverse[text].replace('\\', '\\\\'))
+            for text in sorted(reverse, key=len, reverse=True)]
+
+
+def _iter_nfc(chunks):
+    """Normalize text to NFC piece by piece, holding back the last
+    character that combining characters could yet join.
+    :type chunks: iterable
+    :param chunks: Strings.
+    :rtype : generator
+    """
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        end = len(pending)
+        while end and unicodedata.combining(pending[end - 1]):
+            end -= 1
+        if end > 1:
+            yield unicodedata.normalize('NFC', pending[:end - 1])
+            pending = pending[end - 1:]
+    if pending:
+        yield unicodedata.normalize('NFC', pending)
+
+
 class Replacer(object):  # pylint: disable=R0903
-    """Beta match and replace; PUNCT broken?"""
-    def __init__(self, pattern1=None, pattern2=None, pattern3=None):
+    """Beta match and replace.
+
+    The patterns of ``pattern1``, ``pattern2``, and ``pattern3`` are applied
+    in turn, each to the whole of the text. When they are all plain strings
+    that cannot overlap one another in ways that would make the order
+    matter, as is the case for ``UPPER``, ``LOWER``, and ``PUNCT``, they are
+    compiled into a table of what each key becomes, which converts a text in
+    a single pass with the same result: one regex finds the keys of several
+    characters, and ``str.translate()`` does the rest. Other patterns are
+    applied one after another.
+
+    The tables are built once per process for each set of patterns and
+    shared by every ``Replacer`` using them. They are also kept in
+    ``CACHE_DIR`` of the data directory, under a key made from the patterns,
+    from which other processes load them.
+
+    ``unicode_to_beta()`` converts the other way, with tables made from the
+    same patterns, which must be plain strings.
+    """
+    def __init__(self, pattern1=None, pattern2=None, pattern3=None,
+                 cache=True):
+        """
+        :type cache: bool
+        :param cache: Whether to read and write the tables kept on disk.
+        """
         if pattern1 is None:
             pattern1 = UPPER
         if pattern2 is None:
             pattern2 = LOWER
         if pattern3 is None:
             pattern3 = PUNCT
-        self.pattern1 = \
-            [(re.compile(regex), repl) for (regex, repl) in pattern1]
-        self.pattern2 = \
-            [(re.compile(regex), repl) for (regex, repl) in pattern2]
-        self.pattern3 = \
-            [(re.compile(regex), repl) for (regex, repl) in pattern3]
+        pattern_lists = [[(getattr(regex, 'pattern', regex), repl)
+                          for (regex, repl) in patterns]
+                         for patterns in (pattern1, pattern2, pattern3)]
+        self._tables = _get_tables(pattern_lists, cache)
+        self.single_pass = self._tables.single_pass
+        self._cache = cache
+        self._reverse_tables = None
+
+    @property
+    def pattern1(self):
+        """The first list of compiled ``(pattern, replacement)`` pairs."""
+        return self._tables.patterns[0]
+
+    @property
+    def pattern2(self):
+        """The second list of compiled ``(pattern, replacement)`` pairs."""
+        return self._tables.patterns[1]
+
+    @property
+    def pattern3(self):
+        """The third list of compiled ``(pattern, replacement)`` pairs."""
+        return self._tables.patterns[2]
+
+    def _apply_patterns(self, text):
+        """Apply every pattern in turn to the whole of ``text``.
+        :rtype : str
+        """
+        return self._tables.apply_patterns(text)
 
     def beta_code(self, text):
-        """Replace method. Note: re.subn() returns a tuple (new_string,
-        number_of_subs_made).
+        """Convert beta code to Unicode.
+        :type text: str
+        :rtype : str
+        """
+        return self._tables.convert(text.replace('-', ''))
+
+    def _patterns(self):
+        """The pattern lists, as given to ``Replacer()``.
+        :rtype : tuple
         """
-        no_hyph = text.replace('-', '')
-        beta_string = no_hyph
-        for (pattern, repl) in self.pattern1:
-            beta_string = re.subn(pattern, repl, beta_string)[0]
-        for (pattern, repl) in self.pattern2:
-            beta_string = re.subn(pattern, repl, beta_string)[0]
-        # remove third run, if punct list not used
-        for (pattern, repl) in self.pattern3:
-            unicode_string = re.subn(pattern, repl, beta_string)[0]
-        return unicode_string
+        return tuple(self._tables.pattern_lists)
+
+    def iter_beta_code(self, chunks):
+        """Convert beta code piece by piece, such as the chunks of a file.
+        Chunks may break anywhere, even inside a key; text is held back
+        until it can be converted with the same result as the whole, so only
+        a line, or about ``MAX_PENDING`` characters of a longer one, is kept
+        in memory. Patterns that are not applied in a single pass are applied
+        a line at a time, so a line is kept whole however long.
+        :type chunks: iterable
+        :param chunks: Strings of beta code.
+        :rtype : generator
+        """
+        return self._tables.iter_convert(chunk.replace('-', '')
+                                         for chunk in chunks)
+
+    def _reverse(self):
+        """The tables converting Unicode back to beta code, at first use.
+        :rtype : _Tables
+        """
+        if self._reverse_tables is None:
+            self._reverse_tables = _get_tables(
+                [_reverse_patterns(self._tables), [], []], self._cache)
+        return self._reverse_tables
+
+    def unicode_to_beta(self, text):
+        """Convert Unicode to beta code, the reverse of ``beta_code()``.
+        The text may be composed (NFC) or decomposed (NFD). Characters the
+        patterns do not produce are left as they are.
+        :type text: str
+        :rtype : str
+        """
+        return self._reverse().convert(unicodedata.normalize('NFC', text))
+
+    def iter_unicode_to_beta(self, chunks):
+        """Convert Unicode to beta code piece by piece, as
+        ``iter_beta_code()`` does the other way.
+        :type chunks: iterable
+        :param chunks: Strings of Unicode.
+        :rtype : generator
+        """
+        return self._reverse().iter_convert(_iter_nfc(chunks))
+
+    def convert_file(self, input_path, output_path, encoding='latin-1'):
+        """Convert a file of beta code to UTF-8, reading ``CHUNK_SIZE``
+        characters at a time. The output is written to a temporary file and
+        renamed into place.
+        :type input_path: str
+        :param input_path: File of beta code.
+        :type output_path: str
+        :param output_path: File to write.
+        :type encoding: str
+        :param encoding: Encoding of the input.
+        """
+        input_path = os.path.expanduser(input_path)
+        output_path = os.path.expanduser(output_path)
+        tmp_path = output_path + '.tmp'
+        try:
+            with open(input_path, encoding=encoding, newline='') as input_file, \
+                    open(tmp_path, 'w', encoding='utf-8',
+                         newline='') as output_file:
+                chunks = iter(lambda: input_file.read(CHUNK_SIZE), '')
+                output_file.writelines(self.iter_beta_code(chunks))
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def convert_dir(self, input_dir, output_dir, max_workers=None,
+                    encoding='latin-1'):
+        """Convert every file in a directory with ``convert_file()``, in a
+        pool of processes, writing files of the same names to
+        ``output_dir``. Each job makes a ``Replacer`` with these patterns,
+        whose tables are built, or read from the cache, only by the first
+        job in each process, and shared by the rest.
+        :type input_dir: str
+        :param input_dir: Directory of beta code files.
+        :type output_dir: str
+        :param output_dir: Directory to write.
+        :type max_workers: int
+        :param max_workers: Number of processes; defaults to the number of
+        CPUs.
+        :type encoding: str
+        :param encoding: Encoding of the input.
+        :rtype : dict
+        :return: Maps each file name to ``{'status': 'converted' or
+        'failed', 'error': None or str}``.
+        """
+        input_dir = os.path.expanduser(input_dir)
+        output_dir = os.path.expanduser(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+        names = sorted(name for name in os.listdir(input_dir)
+                       if not name.startswith('.') and
+                       os.path.isfile(os.path.join(input_dir, name)))
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(name, executor.submit(_convert_file_job,
+                                              self._patterns(), self._cache,
+                                              os.path.join(input_dir, name),
+                                              os.path.join(output_dir, name),
+                                              encoding))
+                       for name in names]
+            for name, future in futures:
+                try:
+                    future.result()
+                except (OSError, UnicodeError) as exc:
+                    logger.error("Failed to convert file '%s': %s", name, exc)
+                    results[name] = {'status': 'failed', 'error': str(exc)}
+                else:
+                    results[name] = {'status': 'converted', 'error': None}
+        statuses = [result['status'] for result in results.values()]
+        logger.info('Converted %d and failed %d of %d files.',
+                    statuses.count('converted'),
+                    statuses.count('failed'),
+                    len(statuses))
+        return results
+
+
+def _convert_file_job(pattern_lists, cache, input_path, output_path,  # pylint: disable=R0913
+                      encoding):
+    """Convert one file in a ``convert_dir()`` worker process."""
+    replacer = Replacer(*pattern_lists, cache=cache)
+    replacer.convert_file(input_path, output_path, encoding)
@@ -0,0 +1,182 @@
+"""Random access by citation into texts converted by ``tlgu`` with full
+markup (``markup='full'``, the ``-v`` to ``-z`` flags), in which every line
+starts with its citation, its levels joined by ``.``, followed by white
+space and the text, e.g. ``1.1.5  ...``.
+
+Such output does not mark where one work ends and the next begins, so an
+index covers one converted file. For authors of several works, index the
+files of ``divide_works``, one per work, e.g. ``TLG0032.TXT-006.txt`` for
+Xenophon's *Anabasis*.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import mmap
+import os
+import re
+import struct
+
+from cltk.utils.cltk_logger import logger
+
+
+# citation indices: a header, then records of citation, offset of the text
+# of the line in the file, and its length, sorted by citation
+INDEX_SUFFIX = '.cit'
+INDEX_MAGIC = b'CLTKCIT2'
+INDEX_KEY_SIZE = 48
+INDEX_RECORD = struct.Struct('>{0}sQI'.format(INDEX_KEY_SIZE))
+
+# a line of full markup: the citation, white space, and the text
+CITED_LINE = re.compile(rb'[ \t]*(\S+)[ \t]*(.*?)\r?\n?$')
+
+
+def parse_citation(citation):
+    """Split a citation into its levels, e.g. ``'1.1.5'`` into
+    ``('1', '1', '5')``. Levels are compared as a tuple, so that ``'1.1'``
+    comes right after ``'1'`` and is part of it, whatever characters the
+    levels contain.
+    :type citation: str or tuple
+    :rtype : tuple
+    """
+    if isinstance(citation, str):
+        citation = citation.split('.')
+    return tuple(level for level in citation if level)
+
+
+def _read_cited_lines(path):
+    """Yield ``(citation, start, end)`` for each cited line of a converted
+    file, where ``start`` and ``end`` are the offsets of its text.
+    :rtype : generator
+    """
+    with open(path, 'rb') as file:
+        offset = 0
+        for line in file:
+            match = CITED_LINE.match(line)
+            if match is not None:
+                yield (match.group(1).decode('utf-8'),
+                       offset + match.start(2),
+                       offset + match.end(2))
+            offset += len(line)
+
+
+def build_citation_index(path, index_path=None):
+    """Write an index of where each line of a file converted with full
+    markup is, by citation. The index is a sorted table of fixed-size
+    records, so that ``CitationIndex`` can binary-search it through a memory
+    map without loading it.
+    :type path: str
+    :param path: Text converted by ``tlgu`` with ``markup='full'``.
+    :type index_path: str
+    :param index_path: Where to write the index; defaults to ``path`` with
+    ``INDEX_SUFFIX`` appended.
+    :rtype : int
+    :return: Number of lines indexed.
+    """
+    path = os.path.expanduser(path)
+    if index_path is None:
+        index_path = path + INDEX_SUFFIX
+    records = []
+    for citation, start, end in _read_cited_lines(path):
+        levels = parse_citation(citation)
+        key = '.'.join(levels).encode('utf-8')
+        if len(key) > INDEX_KEY_SIZE:
+            logger.warning("Citation '%s' in '%s' is too long to index.",
+                           citation,
+                           path)
+            continue
+        records.append((levels, key, start, end - start))
+    records.sort()
+    with open(index_path + '.tmp', 'wb') as index_file:
+        index_file.write(INDEX_MAGIC)
+        index_file.write(struct.pack('>I', len(records)))
+        for _, key, start, size in records:
+            index_file.write(INDEX_RECORD.pack(key, start, size))
+    os.replace(index_path + '.tmp', index_path)
+    return len(records)
+
+
+class CitationIndex(object):
+    """Look up passages of a file converted with full markup by citation,
+    using an index written by ``build_citation_index()``. Both files are
+    memory-mapped, so a lookup reads only the records and lines it needs.
+    """
+
+    def __init__(self, path, index_path=None):
+        """
+        :type path: str
+        :param path: Text converted by ``tlgu`` with ``markup='full'``.
+        :type index_path: str
+        :param index_path: Its index; defaults to ``path`` with
+        ``INDEX_SUFFIX`` appended.
+        """
+        path = os.path.expanduser(path)
+        if index_path is None:
+            index_path = path + INDEX_SUFFIX
+        with open(path, 'rb') as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(index_path, 'rb') as index_file:
+            self._index = mmap.mmap(index_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+        header_size = len(INDEX_MAGIC) + 4
+        if self._index[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError("'{0}' is not a citation index.".format(
+                index_path))
+        self._count = struct.unpack('>I',
+                                    self._index[len(INDEX_MAGIC):header_size])[0]
+        self._header_size = header_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Release the memory maps."""
+        self._data.close()
+        self._index.close()
+
+    def _record(self, number):
+        """Read record ``number`` of the index.
+        :rtype : (tuple, int, int)
+        :return: The citation's levels, and the offset and size of the text.
+        """
+        offset = self._header_size + number * INDEX_RECORD.size
+        key, start, size = INDEX_RECORD.unpack(
+            self._index[offset:offset + INDEX_RECORD.size])
+        return parse_citation(key.rstrip(b'\x00').decode('utf-8')), start, size
+
+    def lines(self, citation):
+        """Find the lines of a passage. A citation may stop above the lowest
+        level, e.g. ``'1.1.5'`` for a section of the *Anabasis*, and then
+        matches every line within it.
+        :type citation: str or tuple
+        :param citation: E.g. ``'1.1.5'`` or ``('1', '1', '5')``.
+        :rtype : list
+        :return: ``(citation, text)`` for each line, in the order of the
+        text.
+        """
+        prefix = parse_citation(citation)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle)[0] < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        for number in range(low, self._count):
+            levels, start, size = self._record(number)
+            if levels[:len(prefix)] != prefix:
+                break
+            found.append((start, levels, size))
+        found.sort()
+        return [(levels, self._data[start:start + size].decode('utf-8'))
+                for start, levels, size in found]
+
+    def passage(self, citation):
+        """Text of a passage, one line per line of the text.
+        :rtype : str
+        """
+        return '\n'.join(text for _, text in self.lines(citation))
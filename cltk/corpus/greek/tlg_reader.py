@@ -0,0 +1,244 @@
+"""Read TLG and PHI ``.TXT`` files directly, without ``tlgu``.
+
+The files are divided into blocks of 8 KB. Beta code text is plain 7-bit
+ASCII; bytes with the high bit set are ID codes, which set the citation
+levels (author, work, book, line, etc.) of the text that follows. ``0xFE``
+ends a block, the rest of which is padding, and ``0xF0`` ends the file.
+
+The left nybble of an ID byte (ignoring the high bit) selects the level:
+``0``-``5`` are ``z``, ``y``, ``x``, ``w``, ``v``, and ``n``; ``6`` is an
+escape, whose next byte gives the level by number (``0`` is ``a``, the author,
+``1`` is ``b``, the work, and so on). The right nybble says how the level's
+value changes:
+
+* ``0``: increment by one;
+* ``1``-``7``: set to that number;
+* ``8``: set to the 7-bit number in the next byte, ``9`` with a letter after
+  it, ``A`` with a string after it;
+* ``B``: set to the 14-bit number in the next two bytes, ``C`` with a letter
+  after it, ``D`` with a string after it;
+* ``E``: keep the number and set the letter after it;
+* ``F``: set to a string.
+
+Strings are ended by ``0xFF``. Setting a level clears the levels below it.
+
+The reader memory-maps the file and yields lines as it goes, so that even
+the largest author files are read without temporary files or subprocesses.
+Text is returned in beta code; see ``beta_to_unicode.Replacer``.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+from collections import namedtuple
+import itertools
+import mmap
+import os
+import re
+
+
+BLOCK_SIZE = 8192
+END_OF_BLOCK = 0xFE
+END_OF_FILE = 0xF0
+END_OF_STRING = 0xFF
+# levels of the left nybble of an ID byte, then of the byte after an escape
+LEVELS = 'zyxwvn'
+ESCAPE_LEVELS = 'abcdefghijklmnopqrstuvwxyz'
+# citation levels, from highest to lowest
+CITATION_LEVELS = 'vwxyz'
+# levels cleared when a level is set
+LOWER_LEVELS = {'a': 'bcdnvwxyz',
+                'b': 'cdnvwxyz',
+                'n': 'vwxyz',
+                'v': 'wxyz',
+                'w': 'xyz',
+                'x': 'yz',
+                'y': 'z'}
+
+TEXT_RUN = re.compile(rb'[\x01-\x7f]+')
+
+Line = namedtuple('Line', ['author', 'work', 'citation', 'text'])
+Line.__doc__ = """A line of text, with the author and work numbers and the
+values of the citation levels ``v`` to ``z`` that are in use, highest first,
+e.g. ``('1', '12')`` for book 1, line 12."""
+
+Work = namedtuple('Work', ['author', 'work', 'lines'])
+Work.__doc__ = """A work and the list of its ``Line``s."""
+
+
+class _Levels(object):
+    """Current value of each ID level: a number, a suffix, or both."""
+
+    def __init__(self):
+        self.numbers = {}
+        self.suffixes = {}
+
+    def value(self, level):
+        """Value of a level as a string, or None if it is not set.
+        :rtype : str
+        """
+        if level not in self.numbers and level not in self.suffixes:
+            return None
+        number = self.numbers.get(level)
+        return ('' if number is None else str(number)) + \
+            self.suffixes.get(level, '')
+
+    def citation(self):
+        """Values of the citation levels in use.
+        :rtype : tuple
+        """
+        return tuple(value for value in (self.value(level)
+                                         for level in CITATION_LEVELS)
+                     if value is not None)
+
+    def set(self, level, number, suffix=''):
+        """Set a level, clearing those below it."""
+        for lower in LOWER_LEVELS.get(level, ''):
+            self.numbers.pop(lower, None)
+            self.suffixes.pop(lower, None)
+        self.numbers[level] = number
+        self.suffixes[level] = suffix
+
+
+def _read_string(block, pos):
+    """Read a string ending with ``0xFF``, or at the end of the block.
+    :rtype : (str, int)
+    :return: The string and the position after it.
+    """
+    end = block.find(bytes([END_OF_STRING]), pos)
+    if end == -1:
+        end = len(block)
+    string = bytes(byte & 0x7F for byte in block[pos:end]).decode('ascii')
+    return string, end + 1
+
+
+def _read_id_code(block, pos, levels, block_start=0):
+    """Apply the ID code starting at ``pos`` to ``levels``.
+    :rtype : int
+    :return: Position after the code.
+    :raises ValueError: If the code is cut off by the end of the block or
+    names no level.
+    """
+    code_start = block_start + pos
+
+    def code_byte(pos):
+        """A byte of the code after the first, without its high bit."""
+        if pos >= len(block):
+            raise ValueError('ID code at offset {0} is cut off by the end '
+                             'of its block.'.format(code_start))
+        return block[pos] & 0x7F
+    left = (block[pos] >> 4) & 0x07
+    right = block[pos] & 0x0F
+    pos += 1
+    if left == 6:
+        escape = code_byte(pos)
+        if escape >= len(ESCAPE_LEVELS):
+            raise ValueError('ID code at offset {0} has unknown level '
+                             '{1}.'.format(code_start, escape))
+        level = ESCAPE_LEVELS[escape]
+        pos += 1
+    else:
+        level = LEVELS[left]
+    number = levels.numbers.get(level)
+    suffix = ''
+    if right == 0:
+        number = (number or 0) + 1
+    elif right < 8:
+        number = right
+    elif right < 11:
+        number = code_byte(pos)
+        pos += 1
+    elif right < 14:
+        number = code_byte(pos) << 7 | code_byte(pos + 1)
+        pos += 2
+    elif right == 15:
+        number = None
+    if right in (9, 12, 14):
+        suffix = chr(code_byte(pos))
+        pos += 1
+    elif right in (10, 13, 15):
+        suffix, pos = _read_string(block, pos)
+    levels.set(level, number, suffix)
+    return pos
+
+
+def _read_block(block, levels, block_start=0):
+    """Parse one block into lines. A line is the text between two runs of
+    ID codes, and is cited by the levels in force where it starts.
+    :type block_start: int
+    :param block_start: Offset of the block in the file, for errors.
+    :rtype : (list, bool)
+    :return: The lines and whether the file ends in this block.
+    """
+    lines = []
+    text = []
+    citation = None
+    pos = 0
+    end_of_file = False
+    while pos < len(block):
+        byte = block[pos]
+        if byte < 0x80:
+            match = TEXT_RUN.match(block, pos)
+            if match is None:  # null padding
+                pos += 1
+                continue
+            if not text:
+                citation = (levels.value('a'), levels.value('b'),
+                            levels.citation())
+            text.append(match.group())
+            pos = match.end()
+            continue
+        if text:
+            lines.append(Line(citation[0], citation[1], citation[2],
+                              b''.join(text).decode('ascii')))
+            text = []
+        if byte == END_OF_BLOCK:
+            break
+        if byte == END_OF_FILE:
+            end_of_file = True
+            break
+        if byte >> 4 == 0x0F:  # stray string terminator
+            pos += 1
+            continue
+        pos = _read_id_code(block, pos, levels, block_start)
+    if text:
+        lines.append(Line(citation[0], citation[1], citation[2],
+                          b''.join(text).decode('ascii')))
+    return lines, end_of_file
+
+
+def read_lines(path):
+    """Yield the lines of a TLG or PHI ``.TXT`` file.
+    :type path: str
+    :param path: File to read, e.g. ``~/cltk_data/originals/tlg/TLG0012.TXT``.
+    :rtype : generator
+    :return: ``Line`` tuples of ``(author, work, citation, text)``.
+    :raises ValueError: If the file has a malformed ID code.
+    """
+    path = os.path.expanduser(path)
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            levels = _Levels()
+            for start in range(0, len(data), BLOCK_SIZE):
+                try:
+                    lines, end_of_file = _read_block(
+                        data[start:start + BLOCK_SIZE], levels, start)
+                except ValueError as exc:
+                    raise ValueError("'{0}': {1}".format(path, exc))
+                yield from lines
+                if end_of_file:
+                    break
+
+
+def read_works(path):
+    """Yield the works of a TLG or PHI ``.TXT`` file, one at a time.
+    :type path: str
+    :param path: File to read.
+    :rtype : generator
+    :return: ``Work`` tuples of ``(author, work, lines)``.
+    """
+    for (author, work), lines in itertools.groupby(
+            read_lines(path), key=lambda line: (line.author, line.work)):
+        yield Work(author, work, list(lines))
@@ -2,20 +2,33 @@
 
 Original software at: ``http://tlgu.carmen.gr/``.
 
-TODO: the arguments to ``convert_corpus()`` need some rationalization, and
-``divide_works()`` should be incorporated into it.
+``convert_corpus()`` converts a whole TLG or PHI corpus, in one or more
+variants (plaintext, full markup, divided works, ...). Each variant is a
+tlgu run of its own, but the runs for a file follow one another, so that the
+original is read from disk only once.
 """
 
 __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>',
               'Stephen Margheim <stephen.margheim@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 
 from cltk.utils.cltk_logger import logger
+from cltk.corpus.greek.citation_index import build_citation_index
+from cltk.corpus.greek.citation_index import INDEX_SUFFIX
 from cltk.corpus.utils.importer import CorpusImporter
+from cltk.corpus.utils.packed_works import PackedWorks
+from cltk.utils.cltk_data import get_cltk_data_dir
+from cltk.utils.file_operations import file_sha256
 
 
 # this currently not in use
@@ -38,6 +51,71 @@ ARGS = {
     'split_works': '-W'
 }
 
+# characters read at a time by ``iter_convert()`` when not reading lines
+CHUNK_SIZE = 64 * 1024
+# kept in each output directory; records the input and flags each file there
+# was converted from, so that unchanged files are not converted again
+MANIFEST_FILE_NAME = '.tlgu_manifest.json'
+# through which ``iter_convert()`` has tlgu write to a pipe
+DEV_STDOUT = '/dev/stdout'
+# the keys a variant of ``convert_corpus()`` may have
+VARIANT_OPTIONS = {'markup', 'break_lines', 'divide_works', 'latin',
+                   'extra_args', 'name', 'pack'}
+
+
+class TLGUError(Exception):
+    """Raised when ``tlgu`` fails to convert a file."""
+
+
+class _Output(object):
+    """Where one variant of a conversion goes: a directory of files or, with
+    ``compression``, a ``PackedWorks`` container. With ``index_dir``, the
+    citations of each file are indexed there.
+    """
+
+    def __init__(self, path, tlgu_flags, compression=None, index_dir=None):
+        self.path = path
+        self.tlgu_flags = tlgu_flags
+        self.index_dir = index_dir
+        self.pack = None
+        if compression:
+            self.work_dir = os.path.dirname(path)
+            self.manifest_path = path + '.manifest.json'
+            os.makedirs(self.work_dir, exist_ok=True)
+            self.pack = PackedWorks(path, 'a', compression)
+        else:
+            self.work_dir = path
+            self.manifest_path = os.path.join(path, MANIFEST_FILE_NAME)
+            os.makedirs(path, exist_ok=True)
+        if index_dir is not None:
+            os.makedirs(index_dir, exist_ok=True)
+
+    @property
+    def name(self):
+        """Name of the directory or container."""
+        return os.path.basename(self.path)
+
+    def has(self, name):
+        """Check whether an output file is there.
+        :rtype : bool
+        """
+        if self.pack is not None:
+            return name in self.pack
+        return os.path.isfile(os.path.join(self.path, name))
+
+    def store(self, file_path):
+        """Move a finished output file into place."""
+        if self.pack is not None:
+            self.pack.add_file(file_path)
+        else:
+            os.replace(file_path,
+                       os.path.join(self.path, os.path.basename(file_path)))
+
+    def close(self):
+        """Finish writing a container."""
+        if self.pack is not None:
+            self.pack.close()
+
 
 class TLGU(object):
     """Check, install, and call TLGU."""
@@ -49,8 +127,8 @@ class TLGU(object):
     @staticmethod
     def _check_import_source():
         """Check if tlgu imported, if not import it."""
-        path_rel = '~/cltk_data/greek/software/tlgu/tlgu.h'
-        path = os.path.expanduser(path_rel)
+        path = os.path.join(get_cltk_data_dir(), 'greek', 'software', 'tlgu',
+                            'tlgu.h')
         if not os.path.isfile(path):
             try:
                 corpus_importer = CorpusImporter('greek')
@@ -70,8 +148,8 @@ class TLGU(object):
             if not subprocess.check_output(['which', 'gcc']):
                 logger.error('GCC seems not to be installed.')
             else:
-                tlgu_path_rel = '~/cltk_data/greek/software/tlgu'
-                tlgu_path = os.path.expanduser(tlgu_path_rel)
+                tlgu_path = os.path.join(get_cltk_data_dir(), 'greek',
+                                         'software', 'tlgu')
                 try:
                     p_out = subprocess.call('cd {0} && make install'.format(tlgu_path), shell=True)
                     if p_out == 0:
@@ -88,6 +166,49 @@ class TLGU(object):
                         logger.error('TLGU install with sudo failed.')
                         sys.exit(1)
 
+    @staticmethod
+    def _tlgu_flags(markup=None, break_lines=False, divide_works=False,
+                    latin=False, extra_args=None):
+        """Translate the options of ``convert()`` into tlgu flags.
+        :rtype : list
+        :return: Flags such as ``['-W', '-r']``, sorted and without
+        duplicates.
+        """
+        tlgu_options = []
+        if markup == 'full':
+            tlgu_options.extend(['v', 'w', 'x', 'y', 'z'])
+        if break_lines:
+            tlgu_options.append('N')
+        if divide_works:
+            tlgu_options.append('W')
+        if latin:
+            tlgu_options.append('r')
+        if extra_args is not None:
+            try:
+                tlgu_options.extend(list(extra_args))
+            except Exception as exc:
+                logger.error("Argument 'extra_args' must be a list: %s.", exc)
+                sys.exit(1)
+        return ['-' + option for option in sorted(set(tlgu_options))]
+
+    @staticmethod
+    def _call_tlgu(input_path, output_path, tlgu_flags):
+        """Run tlgu on one file. Arguments are passed as a list, not through
+        a shell, so that paths need no quoting.
+        """
+        tlgu_call = ['tlgu'] + tlgu_flags + [input_path, output_path]
+        logger.info(' '.join(tlgu_call))
+        try:
+            process = subprocess.Popen(tlgu_call, stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.PIPE)
+        except OSError as exc:
+            raise TLGUError(exc)
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            raise TLGUError('tlgu exited with status {0}: {1}'.format(
+                process.returncode,
+                stderr.decode('utf-8', 'replace').strip()))
+
     def convert(self, input_path=None, output_path=None, markup=None,
                 break_lines=False, divide_works=False, latin=False,
                 extra_args=None):
@@ -112,67 +233,382 @@ class TLGU(object):
         # setup file paths
         input_path = os.path.expanduser(input_path)
         output_path = os.path.expanduser(output_path)
-        # setup tlgu flags
-        tlgu_options = []
-        if markup == 'full':
-            full_args = ['v', 'w', 'x', 'y', 'z']
-            [tlgu_options.append(x) for x in full_args]  # pylint: disable=W0106
-        if break_lines:
-            tlgu_options.append('N')
-        if divide_works:
-            tlgu_options.append('W')
-        if latin:
-            tlgu_options.append('r')
-        # setup extra args
-        if extra_args is None:
-            extra_args = []
-        else:
-            try:
-                extra_args = list(extra_args)
-            except Exception as exc:
-                logger.error("Argument 'extra_args' must be a list: %s.", exc)
-                sys.exit(1)
-        tlgu_options = tlgu_options + extra_args
-        # assemble all tlgu flags
-        tlgu_options = list(set(tlgu_options))
-        if tlgu_options:
-            tlgu_flags = '-' + ' -'.join(tlgu_options)
-        else:
-            tlgu_flags = ''
-        # make tlgu call
-        tlgu_call = 'tlgu {0} {1} {2}'.format(tlgu_flags,
-                                              input_path,
-                                              output_path)
-        logger.info(tlgu_call)
+        tlgu_flags = self._tlgu_flags(markup, break_lines, divide_works, latin,
+                                      extra_args)
         try:
-            p_out = subprocess.call(tlgu_call, shell=True)
-            if p_out == 1:
-                logger.error('Failed to convert %s to %s.',
-                             input_path,
-                             output_path)
-                sys.exit(1)
-        except Exception as exc:
+            self._call_tlgu(input_path, output_path, tlgu_flags)
+        except TLGUError as exc:
             logger.error('Failed to convert %s to %s: %s',
                          input_path,
                          output_path,
                          exc)
             sys.exit(1)
 
-    def convert_corpus(self, corpus, markup=None, break_lines=False, divide_works=False, latin=None, extra_args=None):  # pylint: disable=W0613
+    @staticmethod
+    def _input_key(input_path, checksum=False):
+        """Describe the input a conversion depends on, by size and
+        modification time or, with ``checksum``, by content hash. The
+        effective tlgu flags are added under ``flags``.
+        :rtype : dict
+        """
+        stat = os.stat(input_path)
+        key = {'size': stat.st_size,
+               'mtime_ns': stat.st_mtime_ns}
+        if checksum:
+            key['sha256'] = file_sha256(input_path)
+        return key
+
+    @staticmethod
+    def _is_current(entry, key, output):
+        """Check a manifest entry against the current input key, and that
+        the outputs it lists still exist.
+        :rtype : bool
+        """
+        if not entry or entry.get('flags') != key['flags'] or \
+                entry.get('size') != key['size']:
+            return False
+        if 'sha256' in key:
+            if entry.get('sha256') != key['sha256']:
+                return False
+        elif entry.get('mtime_ns') != key['mtime_ns']:
+            return False
+        return bool(entry.get('outputs')) and \
+            all(output.has(name) for name in entry['outputs'])
+
+    def _convert_file(self, input_path, output):
+        """Convert one file into an ``_Output``. tlgu writes into a private
+        temporary directory, from which each output (several with ``-W``) is
+        moved into place, so that an interrupted run never leaves a
+        truncated file behind.
+        :rtype : list
+        :return: Names of the files written.
+        """
+        name = os.path.basename(input_path)
+        tmp_dir = os.path.join(output.work_dir, '.{0}.tmp'.format(name))
+        os.makedirs(tmp_dir, exist_ok=True)
+        try:
+            self._call_tlgu(input_path, os.path.join(tmp_dir, name),
+                            output.tlgu_flags)
+            names = sorted(os.listdir(tmp_dir))
+            for output_name in names:
+                output.store(os.path.join(tmp_dir, output_name))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return names
+
+    @staticmethod
+    def _index_outputs(output, names, force=False):
+        """Build the citation index of each of the files ``names`` of an
+        output, converted with full markup, unless it is newer than the
+        file already.
+        """
+        for name in names:
+            text_path = os.path.join(output.path, name)
+            index_path = os.path.join(output.index_dir, name + INDEX_SUFFIX)
+            try:
+                if not force and os.path.getmtime(index_path) >= \
+                        os.path.getmtime(text_path):
+                    continue
+            except OSError:
+                pass
+            try:
+                build_citation_index(text_path, index_path)
+            except Exception as exc:  # pylint: disable=W0703
+                logger.error("Failed to index citations of '%s': %s",
+                             text_path,
+                             exc)
+
+    def _convert_job(self, input_path, outputs, entries, checksum=False,  # pylint: disable=R0913
+                     force=False):
+        """Convert one original into each of ``outputs``, ``_Output``s with
+        their tlgu flags, unless its manifest entry there shows that
+        it is up to date, and index the citations of those that have an
+        index directory. Doing every variant of a file together means the
+        original is read from disk once, and from the page cache after that.
+        :rtype : list
+        :return: ``(status, manifest entry, error)`` for each output.
+        """
+        try:
+            input_key = self._input_key(input_path, checksum)
+        except OSError as exc:
+            return [('failed', None, str(exc))] * len(outputs)
+        done = []
+        for output, entry in zip(outputs, entries):
+            key = dict(input_key, flags=output.tlgu_flags)
+            if not force and self._is_current(entry, key, output):
+                done.append(('skipped', entry, None))
+            else:
+                try:
+                    key['outputs'] = self._convert_file(input_path, output)
+                except (TLGUError, OSError) as exc:
+                    logger.error("Failed to convert file '%s' into '%s': %s",
+                                 input_path,
+                                 output.path,
+                                 exc)
+                    done.append(('failed', None, str(exc)))
+                    continue
+                entry = key
+                done.append(('converted', key, None))
+            if output.index_dir is not None:
+                self._index_outputs(output, entry['outputs'], force)
+        return done
+
+    def iter_convert(self, input_path, markup=None, break_lines=False,
+                     latin=False, extra_args=None, lines=True):
+        """Convert a file and yield its text as tlgu writes it, instead of
+        saving it to disk. tlgu writes to its standard output through a
+        pipe, so a whole corpus may be converted and processed in one
+        streaming pass. Options are as for ``convert()``, except
+        ``divide_works``, which needs output files.
+
+        tlgu only takes an output path, so the pipe is reached through
+        ``/dev/stdout``, which Linux, the BSDs, and OS X have. Elsewhere the
+        file is converted into a temporary file first, which is then read.
+        :type lines: bool
+        :param lines: Yield one line at a time; otherwise yield chunks of up
+        to ``CHUNK_SIZE`` characters.
+        :rtype : generator
+        :raises TLGUError: If tlgu cannot be run or fails.
+        """
+        input_path = os.path.expanduser(input_path)
+        tlgu_flags = self._tlgu_flags(markup, break_lines, False, latin,
+                                      extra_args)
+        if '-W' in tlgu_flags:
+            raise TLGUError("Option 'W' (divide_works) writes files and "
+                            "cannot be streamed.")
+        if os.path.exists(DEV_STDOUT):
+            stream = self._iter_tlgu_pipe(input_path, tlgu_flags)
+        else:
+            stream = self._iter_tlgu_file(input_path, tlgu_flags)
+        try:
+            for text in stream:
+                if lines:
+                    yield from text
+                else:
+                    yield from iter(lambda: text.read(CHUNK_SIZE), '')
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _iter_tlgu_pipe(input_path, tlgu_flags):
+        """Run tlgu writing to a pipe, and yield the pipe, as text, once.
+        Its messages go to a temporary file rather than a second pipe,
+        which, left unread while the output is, could fill up and block
+        tlgu.
+        :rtype : generator
+        """
+        tlgu_call = ['tlgu'] + tlgu_flags + [input_path, DEV_STDOUT]
+        logger.info(' '.join(tlgu_call))
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(tlgu_call, stdout=subprocess.PIPE,
+                                           stderr=stderr)
+            except OSError as exc:
+                raise TLGUError(exc)
+            try:
+                yield io.TextIOWrapper(process.stdout, encoding='utf-8',
+                                       newline='')
+                if process.wait() != 0:
+                    stderr.seek(0)
+                    raise TLGUError('tlgu exited with status {0}: {1}'.format(
+                        process.returncode,
+                        stderr.read().decode('utf-8', 'replace').strip()))
+            finally:
+                # the consumer may stop early
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+    def _iter_tlgu_file(self, input_path, tlgu_flags):
+        """Run tlgu writing to a temporary file, and yield the file, as text,
+        once.
+        :rtype : generator
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            output_path = os.path.join(tmp_dir, os.path.basename(input_path))
+            self._call_tlgu(input_path, output_path, tlgu_flags)
+            with open(output_path, encoding='utf-8', newline='') as text:
+                yield text
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _read_manifest(manifest_path):
+        """Read the conversion manifest of an output.
+        :rtype : dict
+        """
+        try:
+            with open(manifest_path) as manifest_file:
+                return json.load(manifest_file)
+        except (IOError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_manifest(manifest_path, manifest):
+        """Atomically write the conversion manifest of an output."""
+        with open(manifest_path + '.tmp', 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    def _convert_files(self, input_paths, outputs, max_workers=None,  # pylint: disable=R0913
+                       checksum=False, force=False):
+        """Convert files into each of ``outputs``, ``_Output``s with their
+        tlgu flags, in a pool of ``max_workers`` threads, each waiting on
+        its own tlgu process. Files that the manifest in an output directory
+        shows to be converted already, from the same input with the same
+        flags, are skipped. The outputs are closed at the end. The largest
+        inputs are started first, so that a single huge author file does not
+        hold up the end of the run. A failure is recorded for its own file
+        and does not stop the others.
+        :rtype : dict
+        :return: Maps each input file name to ``{'status': 'converted',
+        'skipped', or 'failed', 'error': None or str, 'variants': {output
+        name: status}}``.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        manifests = [self._read_manifest(output.manifest_path)
+                     for output in outputs]
+
+        def input_size(input_path):
+            """Size of an input; an unreadable one is left for last."""
+            try:
+                return os.path.getsize(input_path)
+            except OSError:
+                return 0
+        input_paths = sorted(input_paths, key=input_size, reverse=True)
+        results = {}
+        try:
+            self._run_jobs(input_paths, outputs, manifests, results,
+                           max_workers, checksum, force)
+        finally:
+            for output in outputs:
+                output.close()
+            # the members of a container are only there once it is closed
+            for output, manifest in zip(outputs, manifests):
+                if output.pack is not None:
+                    self._write_manifest(output.manifest_path, manifest)
+        statuses = [result['status'] for result in results.values()]
+        logger.info('Converted %d, skipped %d, and failed %d of %d files.',
+                    statuses.count('converted'),
+                    statuses.count('skipped'),
+                    statuses.count('failed'),
+                    len(statuses))
+        return results
+
+    def _run_jobs(self, input_paths, outputs, manifests, results,  # pylint: disable=R0913,R0914
+                  max_workers, checksum, force):
+        """Run the jobs of ``_convert_files()``, updating ``manifests`` and
+        ``results`` as they finish. The manifest of an output directory is
+        rewritten, atomically, as each job completes, so that an interrupted
+        run loses no more than the files being converted at the time.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for input_path in input_paths:
+                name = os.path.basename(input_path)
+                entries = [manifest.get(name) for manifest in manifests]
+                futures[executor.submit(self._convert_job, input_path,
+                                        outputs, entries, checksum,
+                                        force)] = name
+            for future in as_completed(futures):
+                name = futures[future]
+                done = future.result()
+                variants = {}
+                errors = []
+                for output, manifest, (status, entry, error) in \
+                        zip(outputs, manifests, done):
+                    variants[output.name] = status
+                    if entry is None:
+                        manifest.pop(name, None)
+                    else:
+                        manifest[name] = entry
+                    if output.pack is None and status != 'skipped':
+                        self._write_manifest(output.manifest_path, manifest)
+                    if error and error not in errors:
+                        errors.append(error)
+                statuses = set(variants.values())
+                if 'failed' in statuses:
+                    status = 'failed'
+                elif 'converted' in statuses:
+                    status = 'converted'
+                else:
+                    status = 'skipped'
+                results[name] = {'status': status,
+                                 'error': '; '.join(errors) or None,
+                                 'variants': variants}
+
+    @staticmethod
+    def _variant_dir_name(markup=None, break_lines=False, divide_works=False,
+                          extra_args=None):
+        """Name of the directory a conversion variant is written to, e.g.
+        ``plaintext``, ``full``, or ``individual_works``.
+        :rtype : str
+        """
+        name = 'plaintext' if markup is None else str(markup)
+        if divide_works:
+            if markup is None:
+                name = 'individual_works'
+            else:
+                name += '_individual_works'
+        if break_lines:
+            name += '_break_lines'
+        if extra_args:
+            name += '_' + ''.join(sorted(extra_args))
+        return name
+
+    def convert_corpus(self, corpus, markup=None, break_lines=False, divide_works=False, latin=None, extra_args=None,  # pylint: disable=R0913,R0914
+                       max_workers=None, checksum=False, force=False,
+                       variants=None, citation_index=False):
         """Look for imported TLG or PHI files and convert them all to
-        ``~/cltk_data/greek/text/tlg/<plaintext>``.
+        ``~/cltk_data/greek/text/tlg/<plaintext>``. The output directory is
+        named after the options, e.g. ``plaintext``, ``full`` (for
+        ``markup='full'``), or ``individual_works``.
         TODO: Should this and/or convert() be static?
-        TODO: Add markup options to input.
-        TODO: Do something with break_lines, divide_works, and extra_args or rm them
+        :param markup: As for ``convert()``.
+        :param break_lines: As for ``convert()``.
+        :param divide_works: As for ``convert()``.
+        :param latin: For the PHI7, write to the ``latin`` directory and
+        convert as Latin text.
+        :param extra_args: As for ``convert()``.
+        :type max_workers: int
+        :param max_workers: Number of files converted at once; defaults to
+        the number of CPUs.
+        :type checksum: bool
+        :param checksum: Tell whether an original changed since it was last
+        converted by its hash, rather than its modification time.
+        :type force: bool
+        :param force: Convert every file, even those already up to date.
+        :type variants: list
+        :param variants: Produce several outputs, instead of the one given by
+        ``markup``, ``break_lines``, ``divide_works``, and ``extra_args``.
+        Each variant is a dict of those options, or ``latin`` to override the
+        corpus default, optionally with a ``name`` for its directory and a
+        ``pack`` compression (``'zlib'`` or ``'lzma'``) to write its files
+        into one ``PackedWorks`` container, ``<name>.zip``, instead, e.g.
+        ``[{}, {'markup': 'full'}, {'divide_works': True, 'pack': 'zlib'}]``.
+        tlgu is run once per variant for each file, one run after another,
+        so that the original is read from disk once and from the page cache
+        after that.
+        :type citation_index: bool
+        :param citation_index: Also index where each citation is in the
+        files of every variant with full markup, in a ``citation_index``
+        directory beside the outputs, for lookups with
+        ``citation_index.CitationIndex``. If no variant has full markup, one
+        with ``markup='full'`` is added. Packed variants are not indexed.
+        :rtype : dict
+        :return: Maps each file name to ``{'status': 'converted', 'skipped',
+        or 'failed', 'error': None or str, 'variants': {directory name:
+        status}}``.
         """
-        orig_path_rel = '~/cltk_data/originals'
-        orig_path = os.path.expanduser(orig_path_rel)
-        target_path_rel = '~/cltk_data'
-        target_path = os.path.expanduser(target_path_rel)
+        target_path = get_cltk_data_dir()
+        orig_path = os.path.join(target_path, 'originals')
         if corpus in ['tlg', 'phi5', 'phi7']:
             orig_path = os.path.join(orig_path, corpus)
             if corpus in ['tlg', 'phi7']:
-                if 'phi7' and latin is True:
+                if corpus == 'phi7' and latin is True:
                     latin = True
                     target_path = os.path.join(target_path, 'latin', 'text', corpus)
                 else:
@@ -190,50 +626,53 @@ class TLGU(object):
             logger.error("Failed to find TLG files: %s", exception)
             sys.exit(1)
         # make a list of files to be converted
-        txts = []
-        [txts.append(x) for x in corpus_files if x.endswith('TXT')]  # pylint: disable=W0106
-        # loop through list and convert one at a time
-        for txt in txts:
-            orig_txt_path = os.path.join(orig_path, txt)
-            if markup is None:
-                target_txt_dir = os.path.join(target_path, 'plaintext')
-            else:
-                target_txt_dir = os.path.join(target_path, str(markup))
-            if not os.path.isdir(target_txt_dir):
-                os.makedirs(target_txt_dir)
-            target_txt_path = os.path.join(target_txt_dir, txt)
-            try:
-                self.convert(orig_txt_path, target_txt_path, markup=None,
-                             break_lines=False, divide_works=False, latin=latin,
-                             extra_args=None)
-            except Exception as exception:
-                logger.error("Failed to convert file '%s' to '%s': %s", orig_txt_path, target_txt_path, exception)
-
-    def divide_works(self, corpus):
-        """Use the work-breaking option.
-        TODO: Incorporate this into ``convert_corpus()``
-        """
-        if corpus == 'tlg':
-            orig_dir_path_rel = '~/cltk_data/originals/tlg'
-            works_dir_rel = '~/cltk_data/greek/text/tlg/individual_works'
-        elif corpus == 'phi5':
-            orig_dir_path_rel = '~/cltk_data/originals/phi5'
-            works_dir_rel = '~/cltk_data/latin/text/phi5/individual_works'
-        orig_dir_path = os.path.expanduser(orig_dir_path_rel)
-
-        tlg_files = os.listdir(orig_dir_path)
-        texts = [x for x in tlg_files if x.endswith('.TXT') and x.startswith('TLG')]
-
-        for file in texts:
-            orig_file_path = os.path.join(orig_dir_path, file)
-
-            works_dir = os.path.expanduser(works_dir_rel)
-            if not os.path.isdir(works_dir):
-                os.makedirs(works_dir)
-            new_file_path = os.path.join(works_dir_rel, file)
+        txts = [x for x in corpus_files if x.endswith('TXT')]
+        input_paths = [os.path.join(orig_path, txt) for txt in txts]
+        if variants is None:
+            variants = [{'markup': markup,
+                         'break_lines': break_lines,
+                         'divide_works': divide_works,
+                         'extra_args': extra_args}]
+        if citation_index and not any(variant.get('markup') == 'full' and
+                                      not variant.get('pack')
+                                      for variant in variants):
+            variants = list(variants) + [{'markup': 'full'}]
+        outputs = []
+        for variant in variants:
+            unknown = set(variant) - VARIANT_OPTIONS
+            if unknown:
+                logger.error("Unknown variant options %s; expected some of "
+                             "%s.", sorted(unknown), sorted(VARIANT_OPTIONS))
+                sys.exit(1)
+            options = dict(variant)
+            pack = options.pop('pack', None)
+            variant_latin = options.pop('latin', latin)
+            name = options.pop('name', None) or \
+                self._variant_dir_name(**options)
+            if pack:
+                name += '.zip'
+            tlgu_flags = self._tlgu_flags(latin=variant_latin, **options)
+            index_dir = None
+            if citation_index and not pack and \
+                    options.get('markup') == 'full':
+                index_dir = os.path.join(target_path, 'citation_index', name)
+            outputs.append(_Output(os.path.join(target_path, name), tlgu_flags,
+                                   pack, index_dir))
+        return self._convert_files(input_paths, outputs, max_workers,
+                                   checksum, force)
 
-            try:
-                self.convert(orig_file_path, new_file_path, divide_works=True)
-                logger.info('Writing files at %s to %s.', orig_file_path, new_file_path)
-            except Exception as err:
-                logger.error('Failed to convert files: %s.', err)
+    def divide_works(self, corpus, max_workers=None, checksum=False,
+                     force=False, pack=None):
+        """Use the work-breaking option, writing to
+        ``~/cltk_data/greek/text/tlg/individual_works``. Same as
+        ``convert_corpus(corpus, divide_works=True)``.
+        :type pack: str
+        :param pack: Compress the works, with ``'zlib'`` or ``'lzma'``, into
+        one container, ``individual_works.zip``, instead of writing a file
+        for each. Read them with ``PackedWorks``.
+        :rtype : dict
+        """
+        return self.convert_corpus(corpus, max_workers=max_workers,
+                                   checksum=checksum, force=force,
+                                   variants=[{'divide_works': True,
+                                              'pack': pack}])
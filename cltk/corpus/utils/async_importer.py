@@ -0,0 +1,165 @@
+"""Import CLTK corpora from asyncio code.
+Requests, tarfile, and shutil all block, so each import is handed to a pool
+of worker threads, leaving the event loop free while corpora download and
+unpack. The catalog, ``cltk_data`` layout, and connection pool are those of
+``CorpusImporter``.
+
+The methods return ``asyncio.Future`` objects rather than being coroutines,
+so that they can be used alike with ``yield from`` (Python 3.4), ``await``,
+or ``loop.run_until_complete()``.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+from cltk.corpus.utils.importer import CorpusImporter
+from cltk.utils.cltk_logger import logger
+
+
+class AsyncCorpusImporter():
+    """Import CLTK corpora without blocking an event loop."""
+
+    def __init__(self, language, max_concurrency=4, progress=None,
+                 store=None, loop=None):
+        """
+        :type language: str
+        :param language: Language of the corpora to import.
+        :type max_concurrency: int
+        :param max_concurrency: Most imports running at once; further calls
+        wait their turn.
+        :type progress: callable
+        :param progress: Called on the event loop's thread as
+        ``progress(corpus_name, stage, detail)``, with the stages of
+        ``CorpusImporter``, plus ``'queued'`` when an import is waiting for a
+        free slot.
+        :type store: str
+        :param store: Directory of a shared ``CorpusStore``, as for
+        ``CorpusImporter``.
+        :type loop: asyncio.AbstractEventLoop
+        :param loop: Event loop to run on; defaults to the current one.
+        """
+        self.max_concurrency = max_concurrency
+        self.progress = progress
+        self._importer = CorpusImporter(language, store=store,
+                                        progress=self._report_threadsafe)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._given_loop = loop
+        self._loop = loop
+        self._running = 0
+
+    @property
+    def language(self):
+        """Language of the corpora imported."""
+        return self._importer.language
+
+    @property
+    def list_corpora(self):
+        """Show corpora available for the CLTK to download."""
+        return self._importer.list_corpora
+
+    def _report_threadsafe(self, corpus_name, stage, detail=None):
+        """Hand a stage reported from a worker thread to the event loop."""
+        if self.progress is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self.progress, corpus_name, stage,
+                                            detail)
+
+    def _bind_loop(self):
+        """The loop to run on: the one given, else the current one.
+        :rtype : asyncio.AbstractEventLoop
+        """
+        self._loop = self._given_loop or asyncio.get_event_loop()
+        return self._loop
+
+    def _finished(self, corpus_name, future):
+        """Report the end of an import, on the event loop's thread."""
+        self._running -= 1
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Failed to import corpus '%s': %s", corpus_name, exc)
+            if self.progress is not None:
+                self.progress(corpus_name, 'failed', exc)
+        elif self.progress is not None:
+            self.progress(corpus_name, 'imported', None)
+
+    def import_corpus(self, corpus_name, path=None, **options):
+        """Download a remote or load local corpus into dir ``~/cltk_data``.
+        Unlike ``CorpusImporter.import_corpus()``, a failure raises
+        ``CorpusImportError`` instead of exiting.
+        :type corpus_name: str
+        :param corpus_name: The name of an available corpus.
+        :param path: str
+        :param path: A filepath, required when importing local corpora.
+        :param options: Keyword arguments as for
+        ``CorpusImporter.import_corpus()``.
+        :rtype : asyncio.Future
+        :return: Done when the corpus has been imported.
+        """
+        loop = self._bind_loop()
+        if self._running >= self.max_concurrency and \
+                self.progress is not None:
+            self.progress(corpus_name, 'queued', None)
+        self._running += 1
+        future = loop.run_in_executor(
+            self._executor,
+            functools.partial(self._importer._import_corpus, corpus_name,  # pylint: disable=W0212
+                              path, **options))
+        future.add_done_callback(functools.partial(self._finished,
+                                                   corpus_name))
+        return future
+
+    def import_corpora(self, corpora, **options):
+        """Import several corpora concurrently, at most ``max_concurrency``
+        at a time. A failure is recorded for its own corpus and does not stop
+        the others.
+        :type corpora: list
+        :param corpora: Corpus names, or ``(name, path)`` tuples for local
+        corpora.
+        :param options: Keyword arguments as for ``import_corpus()``.
+        :rtype : asyncio.Future
+        :return: Its result maps each corpus name to ``{'status': 'imported'
+        or 'failed', 'error': None or str}``.
+        """
+        jobs = []
+        for corpus in corpora:
+            if isinstance(corpus, str):
+                jobs.append((corpus, None))
+            else:
+                jobs.append(tuple(corpus))
+        loop = self._bind_loop()
+        results = asyncio.Future(loop=loop)
+        if not jobs:
+            results.set_result({})
+            return results
+        gathered = asyncio.gather(
+            *[self.import_corpus(name, path, **options)
+              for name, path in jobs],
+            return_exceptions=True)
+
+        def collect(gathered):
+            """Map the outcome of each import to its corpus."""
+            if results.cancelled():
+                return
+            if gathered.cancelled():
+                results.cancel()
+                return
+            outcomes = {}
+            for (name, _), outcome in zip(jobs, gathered.result()):
+                if isinstance(outcome, BaseException):
+                    outcomes[name] = {'status': 'failed',
+                                      'error': str(outcome)}
+                else:
+                    outcomes[name] = {'status': 'imported', 'error': None}
+            results.set_result(outcomes)
+
+        gathered.add_done_callback(collect)
+        return results
+
+    def close(self):
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
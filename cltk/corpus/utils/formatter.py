@@ -9,11 +9,15 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>',
               'Stephen Margheim <stephen.margheim@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
+import json
 import os
 import re
 import sys
+import unicodedata
 
 from cltk.corpus.greek.tlg_indices import TLG_INDEX
+from cltk.corpus.utils.packed_works import PackedWorks
+from cltk.utils.cltk_data import get_cltk_data_dir
 from cltk.utils.cltk_logger import logger
 
 
@@ -23,88 +27,320 @@ def remove_non_ascii(input_string):
     return no_ascii
 
 
+# Patterns of cleanup_tlg_txt(), applied in this order. None matches across a
+# newline, so text may be cleaned a line at a time.
+TLG_ESCAPE = re.compile(r'\\.')
+TLG_BOOK_TITLE = re.compile(r'@1 \{1.+?\}1 @')
+TLG_SQUARE_BRACKETS = re.compile(r'\[.+?\]')
+# Single characters to replace or remove, in one pass once the patterns are
+# done. Since every '+' becomes 'ϊ', the old 'ί+' -> 'ΐ' rule could never
+# match and is dropped.
+TLG_CHARACTERS = str.maketrans({'ι': 'ϊ',
+                                '+': 'ϊ',
+                                '@': None,
+                                '%': None,
+                                '\x00': None,
+                                '—': ' — '})
+TLG_CHARACTERS.update(dict.fromkeys(ord(digit) for digit in '0123456789'))
+# Most text without a newline that iter_cleanup_tlg_txt() holds back before
+# it looks for another place to break it, as in output of tlgu -N
+MAX_PENDING = 1024 * 1024
+
+
 def cleanup_tlg_txt(tlg_str):
     """"Remove all non–Greek characters from a TLG corpus."""
     # fix beta code transliteration problems
-    tlg_str = re.sub(r'ι|\+', 'ϊ', tlg_str)
-    tlg_str = re.sub(r'ί\+', 'ΐ', tlg_str)
-    tlg_str = re.sub(r'\\.', '.', tlg_str)
+    tlg_str = TLG_ESCAPE.sub('.', tlg_str)
     # fix tlg markup
-    tlg_str = re.sub(r'@1 \{1.+?\}1 @', '', tlg_str)  # rm book titles
-    tlg_str = re.sub(r'\[.+?\]', '', tlg_str)  # rm words in square brackets
-    tlg_str = re.sub(r'[0-9]', '', tlg_str)
-    tlg_str = re.sub(r'@|%|\x00', '', tlg_str)
-    tlg_str = re.sub('—', ' — ', tlg_str)
-    return tlg_str
+    tlg_str = TLG_BOOK_TITLE.sub('', tlg_str)  # rm book titles
+    tlg_str = TLG_SQUARE_BRACKETS.sub('', tlg_str)  # rm words in square brackets
+    return tlg_str.translate(TLG_CHARACTERS)
 
 
-def build_corpus_index(corpus, authtab_path=None):
-    """Build index for TLG or PHI5. ``authtab_path`` for testing only.
-    TODO: Add a test flag argument and rm authtab_path
-    :param corpus:
-    :return: dict
+def _is_closed(tlg_str):
+    """Check that no pattern of ``cleanup_tlg_txt()`` is left open at the end
+    of text ending in white space, so that it may be cleaned apart from the
+    text after it.
+    :rtype : bool
     """
-    if corpus == 'tlg':
-        if not authtab_path:
-            authtab_path = '~/cltk_data/originals/tlg/AUTHTAB.DIR'
-        slice_start = 1
-        slice_end = -6
-        file_name_match = 'TLG[\d].{4}'
-        pattern_author_regex = '&1|&l|l$|&|1$|\x83|\[2|\]2'
-    elif corpus == 'phi5':
-        if not authtab_path:
-            authtab_path = '~/cltk_data/originals/phi5/AUTHTAB.DIR'
-        slice_start = 1
-        slice_end = -21
-        file_name_match = 'LAT[\d].{4}'
-        pattern_author_regex = '&1|&l|l$|&|1$|\x83'
-    else:
-        logger.warning("Corpus %s not available. Choose from 'tlg' or 'phi5'.", corpus)
+    tlg_str = TLG_ESCAPE.sub('.', tlg_str)
+    start = tlg_str.rfind('@1 {1')
+    if tlg_str.endswith('@1 ') or \
+            (start != -1 and tlg_str.find('}1 @', start + 6) == -1):
+        return False
+    tlg_str = TLG_BOOK_TITLE.sub('', tlg_str)
+    start = tlg_str.rfind('[')
+    return start == -1 or tlg_str.find(']', start + 2) != -1
+
+
+def iter_cleanup_tlg_txt(chunks):
+    """Clean text as ``cleanup_tlg_txt()`` does, piece by piece, such as the
+    lines of a file or the output of ``TLGU.iter_convert()``. Chunks may break
+    anywhere; text is held back until its line is complete, or, past
+    ``MAX_PENDING`` characters without a newline, until a space or tab where
+    no pattern is left open, so the output joins to exactly that of
+    ``cleanup_tlg_txt()`` on the whole text.
+    :type chunks: iterable
+    :param chunks: Strings of text.
+    :rtype : generator
+    """
+    pending = []
+    size = 0
+    limit = MAX_PENDING
+    for chunk in chunks:
+        end = chunk.rfind('\n') + 1
+        if end:
+            pending.append(chunk[:end])
+            yield cleanup_tlg_txt(''.join(pending))
+            pending = [chunk[end:]]
+            size = len(chunk) - end
+            limit = MAX_PENDING
+            continue
+        pending.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            tlg_str = ''.join(pending)
+            end = max(tlg_str.rfind(' '), tlg_str.rfind('\t')) + 1
+            if end and _is_closed(tlg_str[:end]):
+                yield cleanup_tlg_txt(tlg_str[:end])
+                tlg_str = tlg_str[end:]
+                limit = MAX_PENDING
+            else:
+                # try again once as much text again has come
+                limit = len(tlg_str) + MAX_PENDING
+            pending = [tlg_str]
+            size = len(tlg_str)
+    tlg_str = ''.join(pending)
+    if tlg_str:
+        yield cleanup_tlg_txt(tlg_str)
+
+
+def cleanup_tlg_file(input_path, output_path, encoding='utf-8'):
+    """Clean a converted TLG file with ``cleanup_tlg_txt()`` a line at a time,
+    without reading all of it into memory.
+    :type input_path: str
+    :param input_path: File to clean.
+    :type output_path: str
+    :param output_path: File to write.
+    """
+    input_path = os.path.expanduser(input_path)
+    output_path = os.path.expanduser(output_path)
+    with open(input_path, encoding=encoding, newline='\n') as input_file, \
+            open(output_path, 'w', encoding=encoding,
+                 newline='\n') as output_file:
+        output_file.writelines(iter_cleanup_tlg_txt(input_file))
+
+
+# Per corpus, the prefix of its file codes (e.g. 'TLG0012') and the markup to
+# strip from author names in AUTHTAB.DIR. PHI7 mixes several prefixes (CIV,
+# DDP, INS, ...) and languages, whose codes may follow the '\x83'.
+AUTHTAB_CORPORA = {'tlg': ('TLG', r'&1|&l|l$|&|1$|\x83|\[2|\]2'),
+                   'phi5': ('LAT', r'&1|&l|l$|&|1$|\x83'),
+                   'phi7': ('[A-Z]{3}', r'&1|&l|&|\x83[a-z]?$|\x83|\[2|\]2')}
+AUTHOR_INDEX_SUFFIX = '.index.json'
+AUTHOR_INDEX_VERSION = 1
+WORKS_INDEX_SUFFIX = '.works_index.json'
+
+
+class AuthorIndex(object):
+    """Authors of a corpus by file code, as read from its AUTHTAB.DIR."""
+
+    def __init__(self, authors):
+        """
+        :type authors: dict
+        :param authors: File code (e.g. ``'TLG0012'``) to author name.
+        """
+        self.authors = authors
+        self._prefixes = None
+
+    def __getitem__(self, file_code):
+        return self.authors[file_code]
+
+    def __contains__(self, file_code):
+        return file_code in self.authors
+
+    def __len__(self):
+        return len(self.authors)
+
+    @staticmethod
+    def normalize(name):
+        """Lower-case a name and strip its accents and punctuation.
+        :rtype : str
+        """
+        name = unicodedata.normalize('NFKD', name.lower())
+        name = ''.join(char for char in name
+                       if not unicodedata.combining(char))
+        return ' '.join(re.findall(r'\w+', name))
+
+    def author(self, file_code):
+        """Look up an author by file code, or ``None`` if not listed.
+        :rtype : str
+        """
+        return self.authors.get(file_code)
+
+    def search(self, prefix):
+        """Find authors any word of whose name, normalized, starts with
+        ``prefix``; e.g. ``'acc'`` finds 'Lucius Accius'. The first search
+        builds a table of every such prefix, so each is one lookup.
+        :rtype : list
+        :return: Sorted file codes.
+        """
+        if self._prefixes is None:
+            prefixes = {}
+            for file_code, name in self.authors.items():
+                name = self.normalize(name)
+                starts = [0] + [match.end() for match in re.finditer(' ', name)]
+                for start in starts:
+                    for end in range(start + 1, len(name) + 1):
+                        prefixes.setdefault(name[start:end], set()).add(
+                            file_code)
+            self._prefixes = prefixes
+        return sorted(self._prefixes.get(self.normalize(prefix), ()))
+
+
+def _parse_authtab(corpus, index_path):
+    """Read the authors of a corpus from its AUTHTAB.DIR.
+    :rtype : dict
+    """
+    code_prefix, author_markup = AUTHTAB_CORPORA[corpus]
+    # code 9999 is the corpus canon, not an author
+    pattern_record = re.compile(r'({0}(?!9999)\d{{4}}).(.*)'.format(
+        code_prefix), re.DOTALL)
+    pattern_author = re.compile(author_markup)
+    with open(index_path, 'rb') as index_file:
+        records = index_file.read().decode('latin-1').split('\xff')
+    file_author = {}
+    for record in records:
+        match = pattern_record.match(record)
+        if match:
+            author_name = pattern_author.sub('', match.group(2))
+            file_author[match.group(1)] = author_name.replace('\x80', ', ')
+    return file_author
+
+
+def load_author_index(corpus, authtab_path=None, cache=True):
+    """Build an ``AuthorIndex`` for the TLG, PHI5, or PHI7. The parsed index
+    is saved next to AUTHTAB.DIR (as ``AUTHTAB.DIR.index.json``) and reused
+    until AUTHTAB.DIR changes size or modification time.
+    :type corpus: str
+    :param corpus: ``'tlg'``, ``'phi5'``, or ``'phi7'``.
+    :type authtab_path: str
+    :param authtab_path: AUTHTAB.DIR, if not that of the imported corpus.
+    :type cache: bool
+    :param cache: Read and write the saved index.
+    :rtype : AuthorIndex
+    """
+    if corpus not in AUTHTAB_CORPORA:
+        logger.warning("Corpus %s not available. Choose from 'tlg', 'phi5', or 'phi7'.", corpus)
         sys.exit(1)
+    if not authtab_path:
+        authtab_path = os.path.join(get_cltk_data_dir(), 'originals', corpus,
+                                    'AUTHTAB.DIR')
     index_path = os.path.expanduser(authtab_path)
     if not os.path.isfile(index_path):
         logger.info("Failed to locate original %s index at '%s'. Please import first.", corpus, index_path)
         sys.exit(1)
-    with open(index_path, 'rb') as f:
-        r = f.read()
-    index_all = r.decode('latin-1').split('\xff')[slice_start:slice_end]
-    index = [x for x in index_all if x]
-    file_author = {}
-    for x in index:
-        # file name
-        pattern_file = re.compile(file_name_match)
-        m = pattern_file.match(x)
-        file_name = m.group()[:-1]# + '.TXT'
-
-        # author name
-        author_name = pattern_file.split(x)[-1]
-        pattern_author = re.compile(pattern_author_regex)
-        author_name = pattern_author.sub('', author_name)
-        pattern_comma = re.compile('\x80')
-        author_name = pattern_comma.sub(', ', author_name)
-        file_author[file_name] = author_name
+    stat = os.stat(index_path)
+    key = {'version': AUTHOR_INDEX_VERSION,
+           'corpus': corpus,
+           'size': stat.st_size,
+           'mtime': stat.st_mtime_ns}
+    cache_path = index_path + AUTHOR_INDEX_SUFFIX
+    if cache:
+        try:
+            with open(cache_path) as cache_file:
+                cached = json.load(cache_file)
+            if cached['key'] == key:
+                return AuthorIndex(cached['authors'])
+        except (IOError, ValueError, KeyError, TypeError):
+            pass
+    authors = _parse_authtab(corpus, index_path)
+    if cache:
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as cache_file:
+                json.dump({'key': key, 'authors': authors}, cache_file)
+            os.replace(tmp_path, cache_path)
+        except OSError as os_error:
+            logger.info("Could not save %s index at '%s': %s", corpus, cache_path, os_error)
+    return AuthorIndex(authors)
 
-    return file_author
+
+def build_corpus_index(corpus, authtab_path=None):
+    """Build index for TLG, PHI5, or PHI7. ``authtab_path`` for testing only.
+    See ``load_author_index()``, which this wraps.
+    :param corpus:
+    :return: dict
+    """
+    return dict(load_author_index(corpus, authtab_path).authors)
 
 
-def index_from_files():
+def index_from_files(path=None, cache=True):
     """This uses the TLG author index and makes  new index including the file
-    names of TLG works. The TLGU().make_individual_works() must be run first
+    names of TLG works. The TLGU().divide_works() must be run first
     to create the files to look for.
+
+    Files are grouped by author in one pass over their names. The result is
+    saved (as ``.works_index.json`` in the directory, or beside a packed
+    container) and on later calls only files added or removed since are
+    looked at.
     TODO: Remove this once a good TLG index has been finalized.
+    :type path: str
+    :param path: Directory of individual works, or a ``PackedWorks``
+    container of them.
+    :type cache: bool
+    :param cache: Read and write the saved index.
+    :rtype : dict
     """
-    path_rel = '~/cltk_data/greek/text/tlg/individual_works/'
-    path = os.path.expanduser(path_rel)
-    individual_works = os.listdir(path)
+    if path is None:
+        path = os.path.join(get_cltk_data_dir(), 'greek', 'text', 'tlg',
+                            'individual_works')
+    path = os.path.expanduser(path)
+    if os.path.isfile(path):
+        with PackedWorks(path) as pack:
+            individual_works = pack.names()
+        cache_path = path + WORKS_INDEX_SUFFIX
+    elif os.path.isdir(path):
+        individual_works = os.listdir(path)
+        cache_path = os.path.join(path, WORKS_INDEX_SUFFIX)
+    else:
+        logger.info("Failed to locate individual works at '%s'. Please run TLGU().divide_works() first.", path)
+        sys.exit(1)
+    files = set(individual_works)
+    indexed_files = set()
+    author_works = {}
+    if cache:
+        try:
+            with open(cache_path) as cache_file:
+                cached = json.load(cache_file)
+            indexed_files = set(cached['files'])
+            author_works = cached['works']
+        except (IOError, ValueError, KeyError, TypeError):
+            pass
+    changed = set()
+    for file_name in indexed_files - files:
+        works = author_works.get(file_name[:7], [])
+        if file_name[8:-4] in works:
+            works.remove(file_name[8:-4])
+            changed.add(file_name[:7])
+    for file_name in files - indexed_files:
+        author_code = file_name[:7]
+        if author_code in TLG_INDEX:
+            author_works.setdefault(author_code, []).append(file_name[8:-4])
+            changed.add(author_code)
+    for author_code in changed:
+        author_works[author_code].sort()
+    if cache and files != indexed_files:
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as cache_file:
+                json.dump({'files': sorted(files), 'works': author_works},
+                          cache_file)
+            os.replace(tmp_path, cache_path)
+        except OSError as os_error:
+            logger.info("Could not save works index at '%s': %s", cache_path, os_error)
     new_dict = {}
     for author_code in TLG_INDEX:
-        author_name = TLG_INDEX[author_code[:7]]
-        works = []
-        comp = re.compile(author_code + r'.*')
-        for y in individual_works:
-            match = comp.match(y)
-            if match:
-                work = match.group()[8:-4]
-                works.append(work)
-        new_dict[author_code] = {'name': author_name, 'works': works}
+        new_dict[author_code] = {'name': TLG_INDEX[author_code],
+                                 'works': author_works.get(author_code, [])}
     return new_dict
@@ -7,30 +7,191 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>',
               'Stephen Margheim <stephen.margheim@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
+from concurrent.futures import ThreadPoolExecutor
 import errno
+import hashlib
+import io
+import json
 import os
 import shutil
 import ssl
 import sys
+import tarfile
+import threading
+import time
 from urllib.parse import urlsplit
 
 from cltk.corpus.greek.corpora import GREEK_CORPORA
 from cltk.corpus.latin.corpora import LATIN_CORPORA
+from cltk.corpus.utils.store import CorpusStore
+from cltk.utils.archive_index import build_archive_index
+from cltk.utils.archive_index import INDEX_FILE_NAME
+from cltk.utils.cltk_data import get_cltk_data_dir
 from cltk.utils.cltk_logger import logger
+from cltk.utils.file_operations import sync_dir
 import requests
 from requests_toolbelt import SSLAdapter
 
 
 AVAILABLE_LANGUAGES = ['greek', 'latin']
-CLTK_DATA_DIR = '~/cltk_data'
+# bytes read from the network and written to disk at a time
+CHUNK_SIZE = 64 * 1024
+# size of the connection pool shared by concurrent downloads
+POOL_SIZE = 10
+# bytes asked for by the first request of a segmented download, which finds
+# out whether the server accepts ranges and how large the archive is
+SEGMENT_PROBE_SIZE = 1024 * 1024
+
+
+class CorpusImportError(Exception):
+    """Raised when a corpus cannot be downloaded, copied, or unpacked.
+    ``status_code`` is the HTTP status of a failed request, if any.
+    """
+
+    def __init__(self, *args, status_code=None):
+        super().__init__(*args)
+        self.status_code = status_code
+
+
+class _ResponseReader(object):
+    """Read-only file object over a streamed response, for ``tarfile``'s
+    stream mode. Everything read is hashed and, optionally, copied to
+    ``tee_path``.
+    """
+
+    def __init__(self, dl_object, tee_path=None):
+        self._dl_object = dl_object
+        self._chunks = dl_object.iter_content(chunk_size=CHUNK_SIZE)
+        self._buffer = bytearray()
+        self._tee = open(tee_path, 'wb') if tee_path else None
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def _fill(self):
+        """Pull the next chunk off the network; False at end of stream."""
+        for chunk in self._chunks:
+            if chunk:
+                self.sha256.update(chunk)
+                self.size += len(chunk)
+                if self._tee:
+                    self._tee.write(chunk)
+                self._buffer.extend(chunk)
+                return True
+        return False
+
+    def read(self, size=-1):
+        """Return up to ``size`` bytes, or everything left if negative."""
+        while (size < 0 or len(self._buffer) < size) and self._fill():
+            pass
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def drain(self):
+        """Consume what ``tarfile`` left unread, such as end-of-archive
+        padding, so that the hash and the copy cover the whole archive."""
+        while self._fill():
+            self._buffer.clear()
+
+    def close(self):
+        """Close the response and the copy."""
+        self._dl_object.close()
+        if self._tee:
+            self._tee.close()
+
+
+class _FileSlice(object):
+    """Read-only file object over ``size`` bytes of an open file, starting
+    at its current position."""
+
+    def __init__(self, file, size):
+        self._file = file
+        self._remaining = size
+
+    def read(self, size=-1):
+        """Return up to ``size`` bytes, never reading past the slice."""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def _is_within(path, directory):
+    """Whether ``path`` is ``directory`` or below it, judging by their
+    names alone.
+    :rtype : bool
+    """
+    path = os.path.abspath(path)
+    directory = os.path.abspath(directory)
+    return path == directory or path.startswith(directory + os.sep)
+
+
+def _checked_members(tar, target_dir):
+    """Yield the members of a tar archive that can be safely extracted into
+    ``target_dir``. An archive with a member that would be written outside
+    of it, through an absolute path, ``..``, or a link pointing out of it,
+    or with a device file, is refused.
+    :type tar: tarfile.TarFile
+    :param tar: Archive, which may be open in stream mode.
+    :type target_dir: str
+    :param target_dir: Directory to extract into.
+    :rtype : generator
+    """
+    target = os.path.abspath(target_dir)
+    for member in tar:
+        path = os.path.join(target, member.name)
+        unsafe = os.path.isabs(member.name) or \
+            not _is_within(path, target) or member.isdev()
+        if member.issym():
+            unsafe = unsafe or os.path.isabs(member.linkname) or \
+                not _is_within(os.path.join(os.path.dirname(path),
+                                            member.linkname), target)
+        elif member.islnk():
+            unsafe = unsafe or \
+                not _is_within(os.path.join(target, member.linkname), target)
+        if unsafe:
+            raise CorpusImportError("Refusing to extract '{0}' outside of "
+                                    "'{1}'.".format(member.name, target))
+        yield member
 
 
 class CorpusImporter():
     """Import CLTK corpora."""
 
-    def __init__(self, language):
+    def __init__(self, language, store=None, progress=None):
+        """
+        :type language: str
+        :param language: Language of the corpora to import.
+        :type store: str
+        :param store: Directory of a shared ``CorpusStore``; defaults to the
+        ``CLTK_STORE`` environment variable. Remote corpora are then kept in
+        the store and appear in ``cltk_data`` as trees of symlinks, and a
+        corpus already in the store is linked instead of downloaded.
+        :type progress: callable
+        :param progress: Called as ``progress(corpus_name, stage, detail)``
+        as an import goes along, from whichever thread is doing it. Stages
+        are ``'downloading'`` (the URL), ``'downloaded'`` (the size),
+        ``'unchanged'``, ``'unpacking'`` (the target directory),
+        ``'copying'`` (the source directory), ``'synced'`` (counts of files
+        ``copied``, ``unchanged``, and ``removed``), ``'imported'``, and
+        ``'failed'`` (the error).
+        """
         self.language = language.lower()
+        self.progress = progress
         self._setup_language_variables()
+        self._session = None
+        self._session_lock = threading.Lock()
+        if store is None:
+            store = os.environ.get('CLTK_STORE')
+        self.store = CorpusStore(store) if store else None
+
+    def _report(self, corpus_name, stage, detail=None):
+        """Pass a stage of an import to the ``progress`` callback, if any."""
+        if self.progress is not None:
+            self.progress(corpus_name, stage, detail)
 
     def _setup_language_variables(self):
         """Check for availability of corpora for a language.
@@ -54,12 +215,11 @@ class CorpusImporter():
 
     def _make_dirs(self, corpus_type, corpus_name):
         """Make directories for an incoming corpus."""
-        home_rel = CLTK_DATA_DIR
-        home = os.path.expanduser(home_rel)
+        home = get_cltk_data_dir()
         # make originals dir for saving downloaded file
         originals_dir = os.path.join(home, 'originals')
         if not os.path.isdir(originals_dir):
-            os.makedirs(originals_dir)
+            os.makedirs(originals_dir, exist_ok=True)
             logger.info("Wrote directory at '%s'.", originals_dir)
         else:
             logger.info("Directory already exists at: '%s'.", originals_dir)
@@ -67,33 +227,339 @@ class CorpusImporter():
         unpack_dir = os.path.join(home, self.language, corpus_type,
                                   corpus_name)
         if not os.path.isdir(unpack_dir):
-            os.makedirs(unpack_dir)
+            os.makedirs(unpack_dir, exist_ok=True)
             logger.info("Wrote directories at '%s'.", unpack_dir)
         else:
             logger.info("Directories already exist at '%s'.", unpack_dir)
         return originals_dir, unpack_dir
 
     @staticmethod
-    def _save_untar(url, dl_object, originals_dir, unpack_dir, corpus_name):
-        """Write downloaded tar object and unpack."""
-        # get filename from URL
-        file_name = urlsplit(url).path.split('/')[-1]
-        file_path_originals = os.path.join(originals_dir, file_name)
-        # save into originals file
+    def _manifest_path(file_path):
+        """Path of the manifest kept beside a downloaded archive."""
+        return file_path + '.manifest.json'
+
+    def _read_manifest(self, file_path):
+        """Read the manifest of a previous download, if any.
+        :rtype : dict
+        """
+        try:
+            with open(self._manifest_path(file_path)) as manifest_file:
+                return json.load(manifest_file)
+        except (IOError, ValueError):
+            return {}
+
+    def _write_manifest(self, file_path, manifest):
+        """Atomically write the manifest of a download."""
+        manifest_path = self._manifest_path(file_path)
+        with open(manifest_path + '.tmp', 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    @staticmethod
+    def _file_is_current(file_path, manifest):
+        """Check that a downloaded file has not changed since its manifest was
+        written.
+        :rtype : bool
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return stat.st_size == manifest.get('size') and \
+            stat.st_mtime_ns == manifest.get('mtime_ns')
+
+    def _request_headers(self, file_path, manifest):
+        """Build conditional and range headers from what is already on disk.
+        A complete, unchanged archive is revalidated with its ``ETag`` or
+        ``Last-Modified``; a ``.part`` file left by an interrupted transfer is
+        resumed with ``Range``, guarded by ``If-Range``.
+        :rtype : dict
+        """
+        headers = {}
+        unpacked_only = manifest.get('archive_kept') is False and \
+            manifest.get('unpacked')
+        if self._file_is_current(file_path, manifest) or unpacked_only:
+            if manifest.get('etag'):
+                headers['If-None-Match'] = manifest['etag']
+            if manifest.get('last_modified'):
+                headers['If-Modified-Since'] = manifest['last_modified']
+        partial = manifest.get('partial', {})
+        validator = partial.get('etag') or partial.get('last_modified')
+        part_path = file_path + '.part'
+        if validator and os.path.isfile(part_path):
+            headers['Range'] = 'bytes={0}-'.format(os.path.getsize(part_path))
+            headers['If-Range'] = validator
+        return headers
+
+    @staticmethod
+    def _stream_to_file(dl_object, file_path, resume=False):
+        """Write a streamed response to ``file_path`` in chunks of
+        ``CHUNK_SIZE``, so that memory use stays constant regardless of the
+        size of the download. Data goes first to a ``.part`` file, which is
+        renamed into place only once the transfer has finished.
+        :type dl_object: requests.Response
+        :param dl_object: Response opened with ``stream=True``.
+        :type file_path: str
+        :param file_path: Final location of the downloaded file.
+        :type resume: bool
+        :param resume: Append to an existing ``.part`` file.
+        :rtype : (int, str)
+        :return: Size and sha256 hex digest of the complete file.
+        """
+        file_path_part = file_path + '.part'
+        sha256 = hashlib.sha256()
+        bytes_written = 0
+        mode = 'wb'
+        if resume:
+            mode = 'ab'
+            with open(file_path_part, 'rb') as part_file:
+                for chunk in iter(lambda: part_file.read(CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+                    bytes_written += len(chunk)
+        bytes_resumed = bytes_written
+        start = time.time()
+        try:
+            with open(file_path_part, mode) as new_file:
+                for chunk in dl_object.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        new_file.write(chunk)
+                        sha256.update(chunk)
+                        bytes_written += len(chunk)
+        finally:
+            dl_object.close()
+        os.replace(file_path_part, file_path)
+        elapsed = max(time.time() - start, 1e-6)
+        logger.info("Downloaded %d bytes in %.2f seconds (%.0f bytes/sec).",
+                    bytes_written - bytes_resumed,
+                    elapsed,
+                    (bytes_written - bytes_resumed) / elapsed)
+        return bytes_written, sha256.hexdigest()
+
+    def _save_download(self, url, dl_object, file_path, manifest,
+                       expected_sha256=None):
+        """Write a downloaded archive to ``originals``, resuming a ``.part``
+        file when the server answered a range request, then verify its size
+        and checksum and record them in the manifest.
+        :rtype : dict
+        :return: The new manifest.
+        """
+        resume = dl_object.status_code == 206
+        manifest = {'url': url,
+                    'etag': dl_object.headers.get('ETag'),
+                    'last_modified': dl_object.headers.get('Last-Modified'),
+                    'partial': manifest.get('partial', {}) if resume else {}}
+        if not resume:
+            manifest['partial'] = {'etag': manifest['etag'],
+                                   'last_modified': manifest['last_modified']}
+        self._write_manifest(file_path, manifest)
+        expected_size = None
+        content_range = dl_object.headers.get('Content-Range', '')
+        if resume and '/' in content_range:
+            expected_size = content_range.rsplit('/', 1)[1]
+        elif not resume:
+            expected_size = dl_object.headers.get('Content-Length')
+        try:
+            size, sha256 = self._stream_to_file(dl_object, file_path,
+                                                resume=resume)
+        except Exception as except_write:  # pylint: disable=W0703
+            logger.error("Failed to write file '%s': '%s'",
+                         file_path,
+                         except_write)
+            raise CorpusImportError(except_write)
+        self._verify_download(url, file_path, size, sha256, expected_size,
+                              expected_sha256)
+        logger.info("Wrote file '%s' (%d bytes, sha256 %s).",
+                    file_path,
+                    size,
+                    sha256)
+        del manifest['partial']
+        manifest['size'] = size
+        manifest['sha256'] = sha256
+        manifest['mtime_ns'] = os.stat(file_path).st_mtime_ns
+        manifest['unpacked'] = False
+        self._write_manifest(file_path, manifest)
+        return manifest
+
+    def _save_segments(self, url, corpus_name, dl_object, file_path,
+                       segments, expected_sha256=None):
+        """Write an archive fetched as ``segments`` byte ranges in parallel,
+        each over its own connection, into a preallocated ``.part`` file.
+        ``dl_object`` is the ``206`` answer to the first, probing range; the
+        rest of the file is split evenly between the other requests, which
+        are pinned to the same version of the file with ``If-Range``. The
+        stitched file is then verified like any other download. A file with
+        holes cannot be resumed, so no ``partial`` entry is recorded.
+        :rtype : dict
+        :return: The new manifest.
+        """
+        manifest = {'url': url,
+                    'etag': dl_object.headers.get('ETag'),
+                    'last_modified': dl_object.headers.get('Last-Modified')}
+        validator = manifest['etag'] or manifest['last_modified']
+        total = dl_object.headers.get('Content-Range', '').rsplit('/', 1)[-1]
+        if not validator or not total.isdigit():
+            dl_object.close()
+            raise CorpusImportError("Server gave no validator or size for "
+                                    "'{0}'.".format(url))
+        total = int(total)
+        self._write_manifest(file_path, manifest)
+        probe_end = min(SEGMENT_PROBE_SIZE, total)
+        step = -(-(total - probe_end) // segments)
+        ranges = [(start, min(start + step, total) - 1)
+                  for start in range(probe_end, total, step or 1)]
+        file_path_part = file_path + '.part'
+        with open(file_path_part, 'wb') as part_file:
+            part_file.truncate(total)
+
+        def fetch(start, end, response=None):
+            """Write bytes ``start`` to ``end`` of the file. A failure of
+            the connection or the disk is raised as ``CorpusImportError``,
+            so that the download falls back to a single stream.
+            """
+            try:
+                fetch_range(start, end, response)
+            except (requests.RequestException, OSError) as exc:
+                raise CorpusImportError(exc)
+
+        def fetch_range(start, end, response=None):
+            """Do the work of ``fetch()``."""
+            if response is None:
+                headers = {'Range': 'bytes={0}-{1}'.format(start, end),
+                           'If-Range': validator}
+                response = self._download_file(url, corpus_name, headers)
+            expected_range = 'bytes {0}-{1}/'.format(start, end)
+            try:
+                if response.status_code != 206 or not response.headers.get(
+                        'Content-Range', '').startswith(expected_range):
+                    raise CorpusImportError("Server did not send bytes "
+                                            "{0}-{1} of '{2}'.".format(
+                                                start, end, url))
+                written = 0
+                with open(file_path_part, 'r+b') as part_file:
+                    part_file.seek(start)
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        part_file.write(chunk)
+                        written += len(chunk)
+            finally:
+                response.close()
+            if written != end - start + 1:
+                raise CorpusImportError("Received {0} of bytes {1}-{2} of "
+                                        "'{3}'.".format(written, start, end,
+                                                        url))
+
+        start_time = time.time()
+        try:
+            with ThreadPoolExecutor(max_workers=segments + 1) as executor:
+                futures = [executor.submit(fetch, 0, probe_end - 1, dl_object)]
+                futures.extend(executor.submit(fetch, start, end)
+                               for start, end in ranges)
+                for future in futures:
+                    future.result()
+        except Exception:
+            if os.path.isfile(file_path_part):
+                os.remove(file_path_part)
+            raise
+        elapsed = max(time.time() - start_time, 1e-6)
+        logger.info("Downloaded %d bytes in %d segments in %.2f seconds "
+                    "(%.0f bytes/sec).",
+                    total,
+                    len(futures),
+                    elapsed,
+                    total / elapsed)
+        size, sha256 = 0, hashlib.sha256()
+        with open(file_path_part, 'rb') as part_file:
+            for chunk in iter(lambda: part_file.read(CHUNK_SIZE), b''):
+                sha256.update(chunk)
+                size += len(chunk)
+        sha256 = sha256.hexdigest()
+        self._verify_download(url, file_path_part, size, sha256, str(total),
+                              expected_sha256)
+        os.replace(file_path_part, file_path)
+        logger.info("Wrote file '%s' (%d bytes, sha256 %s).",
+                    file_path,
+                    size,
+                    sha256)
+        manifest['size'] = size
+        manifest['sha256'] = sha256
+        manifest['mtime_ns'] = os.stat(file_path).st_mtime_ns
+        manifest['unpacked'] = False
+        self._write_manifest(file_path, manifest)
+        return manifest
+
+    @staticmethod
+    def _verify_download(url, file_path, size, sha256, expected_size=None,
+                         expected_sha256=None):
+        """Check a finished download against the size announced by the
+        server and an optional known checksum. On mismatch the file is
+        removed.
+        """
+        error = None
+        if expected_size and expected_size != '*' and \
+                int(expected_size) != size:
+            error = "Downloaded {0} bytes from '{1}', expected {2}.".format(
+                size, url, expected_size)
+        elif expected_sha256 and expected_sha256 != sha256:
+            error = "Checksum mismatch for '{0}': expected {1}, got {2}.".format(
+                url, expected_sha256, sha256)
+        if error:
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            raise CorpusImportError(error)
+
+    def _stream_unpack(self, url, dl_object, file_path, unpack_dir,
+                       corpus_name, expected_sha256=None, keep_archive=True):
+        """Extract tar members while the response is still arriving, rather
+        than writing the whole archive to ``originals`` and reading it back.
+        With ``keep_archive`` the bytes are also copied to ``originals`` as
+        they pass through. Note that the size and checksum can only be
+        verified once extraction has finished.
+        :rtype : dict
+        :return: The new manifest.
+        """
+        manifest = {'url': url,
+                    'etag': dl_object.headers.get('ETag'),
+                    'last_modified': dl_object.headers.get('Last-Modified'),
+                    'archive_kept': keep_archive}
+        file_path_part = file_path + '.part'
+        reader = _ResponseReader(dl_object,
+                                 file_path_part if keep_archive else None)
         try:
-            with open(file_path_originals, 'wb') as new_file:
-                new_file.write(dl_object.content)
-                logger.info("Wrote file '%s' to '%s'.",
-                            file_name,
-                            originals_dir)
+            with tarfile.open(fileobj=reader, mode='r|*') as tar:
+                for member in _checked_members(tar, unpack_dir):
+                    tar.extract(member, unpack_dir)
+            reader.drain()
         except Exception as except_write:  # pylint: disable=W0703
-            logger.error("Failed to write file '%s' to '%s': '%s'",
-                         file_name,
-                         originals_dir,
+            logger.error("Failed to uncompress corpus '%s' to '%s': '%s'",
+                         corpus_name,
+                         unpack_dir,
                          except_write)
-        # unpack into new dir
+            raise CorpusImportError(except_write)
+        finally:
+            reader.close()
+        sha256 = reader.sha256.hexdigest()
+        self._verify_download(url, file_path_part, reader.size, sha256,
+                              dl_object.headers.get('Content-Length'),
+                              expected_sha256)
+        logger.info("Finished unpacking corpus '%s' to '%s' while "
+                    "downloading (%d bytes, sha256 %s).",
+                    corpus_name,
+                    unpack_dir,
+                    reader.size,
+                    sha256)
+        manifest['size'] = reader.size
+        manifest['sha256'] = sha256
+        manifest['unpacked'] = True
+        if keep_archive:
+            os.replace(file_path_part, file_path)
+            manifest['mtime_ns'] = os.stat(file_path).st_mtime_ns
+        self._write_manifest(file_path, manifest)
+        return manifest
+
+    @staticmethod
+    def _unpack(file_path, unpack_dir, corpus_name):
+        """Unpack a downloaded archive."""
         try:
-            shutil.unpack_archive(file_path_originals, unpack_dir)
+            shutil.unpack_archive(file_path, unpack_dir)
             logger.info("Finished unpacking corpus '%s' to '%s'.",
                         corpus_name,
                         unpack_dir)
@@ -102,11 +568,28 @@ class CorpusImporter():
                          corpus_name,
                          unpack_dir,
                          except_write)
+            raise CorpusImportError(except_write)
 
-    @staticmethod
-    def _download_file(url, corpus_name):
-        """Download file with SSL. Note: SSL GitHub connections require a
-        extra TLSv1 extension to the ``requests`` library's connection.
+    @property
+    def session(self):
+        """One ``requests.Session`` per importer, so that its connection
+        pool is reused by every download, including concurrent ones. Note: SSL
+        GitHub connections require a extra TLSv1 extension to the
+        ``requests`` library's connection.
+        :rtype : requests.Session
+        """
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = SSLAdapter(ssl.PROTOCOL_TLSv1,
+                                     pool_connections=POOL_SIZE,
+                                     pool_maxsize=POOL_SIZE)
+                session.mount('https://', adapter)
+                self._session = session
+        return self._session
+
+    def _download_file(self, url, corpus_name, headers=None):
+        """Download file with SSL over the shared session.
         TODO: Maybe up max_retries
         http://docs.python-requests.org/en/latest/api/?highlight=max_retries#requests.adapters.HTTPAdapter
         http://stackoverflow.com/a/21371922
@@ -115,30 +598,165 @@ class CorpusImporter():
                     corpus_name,
                     url)
         try:
-            session = requests.Session()
-            session.mount(url, SSLAdapter(ssl.PROTOCOL_TLSv1))
-            downloaded_object = session.get(url, stream=True)
+            downloaded_object = self.session.get(url, stream=True,
+                                                 headers=headers)
+            downloaded_object.raise_for_status()
             logger.info("Downloaded file at '%s'.", url)
         except Exception as except_req:  # pylint: disable=W0703
             logger.error("Failed to download file at '%s': '%s'",
                          url,
                          except_req)
-            sys.exit(1)
+            response = getattr(except_req, 'response', None)
+            raise CorpusImportError(
+                except_req,
+                status_code=getattr(response, 'status_code', None))
         return downloaded_object
 
-    def _download_corpus(self, corpus_type, corpus_name, url):
-        """Download and save incoming data.
+    def _download_corpus(self, corpus_type, corpus_name, url,
+                         expected_sha256=None, stream_unpack=False,
+                         keep_archive=True, lazy=False, segments=1):
+        """Download and save incoming data. A corpus whose archive is
+        unchanged on the server (``304 Not Modified``) and already unpacked is
+        left alone.
         :type corpus_type: str
         :param corpus_type: Type of corpus to be downloaded.
         :type corpus_name: str
         :param corpus_name: Name of corpus to be downloaded.
         :type url: str
         :param url: URL from which to fetch ``tar.gz`` file.
+        :type expected_sha256: str
+        :param expected_sha256: Optional checksum the archive must match.
+        :type stream_unpack: bool
+        :param stream_unpack: Extract the archive while it downloads.
+        :type keep_archive: bool
+        :param keep_archive: With ``stream_unpack``, whether to also save the
+        archive in ``originals``.
+        :type lazy: bool
+        :param lazy: Index the archive instead of extracting it, so that
+        single files are read from it on demand. Takes precedence over
+        ``stream_unpack``.
+        :type segments: int
+        :param segments: Fetch the archive as this many byte ranges in
+        parallel. Falls back to a single stream if the server does not
+        support ranges, and is ignored with ``stream_unpack`` or when
+        resuming a ``.part`` file.
         """
-        downloaded_object = self._download_file(url, corpus_name)
+        if lazy:
+            stream_unpack = False
         originals_dir, unpack_dir = self._make_dirs(corpus_type, corpus_name)
-        self._save_untar(url, downloaded_object, originals_dir, unpack_dir,
-                         corpus_name)
+        # get filename from URL
+        file_name = urlsplit(url).path.split('/')[-1]
+        file_path = os.path.join(originals_dir, file_name)
+        manifest = self._read_manifest(file_path)
+        headers = self._request_headers(file_path, manifest)
+        if stream_unpack and 'Range' in headers:
+            # extraction has to start from the first byte
+            del headers['Range'], headers['If-Range']
+        segmented = segments > 1 and not stream_unpack and \
+            'Range' not in headers
+        if segmented:
+            headers['Range'] = 'bytes=0-{0}'.format(SEGMENT_PROBE_SIZE - 1)
+        self._report(corpus_name, 'downloading', url)
+        try:
+            downloaded_object = self._download_file(url, corpus_name, headers)
+        except CorpusImportError as exc:
+            # any other failure may be transient, so the ``.part`` file is
+            # kept for the next attempt
+            if 'Range' not in headers or segmented or exc.status_code != 416:
+                raise
+            # a stale or already complete ``.part`` file; start over
+            os.remove(file_path + '.part')
+            del headers['Range'], headers['If-Range']
+            downloaded_object = self._download_file(url, corpus_name, headers)
+        if downloaded_object.status_code == 304:
+            downloaded_object.close()
+            logger.info("Corpus '%s' is unchanged at '%s'.", corpus_name, url)
+            if manifest.get('unpacked') and os.listdir(unpack_dir) and \
+                    manifest.get('lazy', False) == lazy:
+                self._report(corpus_name, 'unchanged')
+                return
+            if not os.path.isfile(file_path):
+                downloaded_object = self._download_file(url, corpus_name)
+        if stream_unpack and downloaded_object.status_code != 304:
+            self._report(corpus_name, 'unpacking', unpack_dir)
+            manifest = self._stream_unpack(url, downloaded_object, file_path,
+                                           unpack_dir, corpus_name,
+                                           expected_sha256, keep_archive)
+            self._report(corpus_name, 'downloaded', manifest['size'])
+            return
+        if segmented and downloaded_object.status_code == 206:
+            try:
+                manifest = self._save_segments(url, corpus_name,
+                                               downloaded_object, file_path,
+                                               segments, expected_sha256)
+            except CorpusImportError as exc:
+                logger.warning("Segmented download of '%s' failed, "
+                               "retrying as a single stream: %s",
+                               url,
+                               exc)
+                downloaded_object = self._download_file(url, corpus_name)
+            else:
+                downloaded_object = None
+        # a server that ignores ``Range`` answers the probe of a segmented
+        # download with the whole file, which is then saved as usual
+        if downloaded_object is not None and \
+                downloaded_object.status_code != 304:
+            manifest = self._save_download(url, downloaded_object, file_path,
+                                           manifest, expected_sha256)
+        if 'size' in manifest:
+            self._report(corpus_name, 'downloaded', manifest['size'])
+        self._report(corpus_name, 'unpacking', unpack_dir)
+        if lazy:
+            try:
+                build_archive_index(file_path, unpack_dir)
+            except Exception as except_index:  # pylint: disable=W0703
+                logger.error("Failed to index corpus '%s': '%s'",
+                             corpus_name,
+                             except_index)
+                raise CorpusImportError(except_index)
+            # only the plain tar is kept
+            manifest['archive_kept'] = False
+        else:
+            self._unpack(file_path, unpack_dir, corpus_name)
+            index_path = os.path.join(unpack_dir, INDEX_FILE_NAME)
+            if os.path.isfile(index_path):
+                os.remove(index_path)
+        manifest['unpacked'] = True
+        manifest['lazy'] = lazy
+        self._write_manifest(file_path, manifest)
+
+    def _corpus_dir(self, corpus_type, corpus_name):
+        """Directory into which a remote corpus is unpacked.
+        :rtype : str
+        """
+        return os.path.join(get_cltk_data_dir(), self.language,
+                            corpus_type, corpus_name)
+
+    def _link_from_store(self, corpus_type, corpus_name):
+        """Build the view of a corpus already in the store, if it is there.
+        Otherwise clear any stale view, so that unpacking never writes
+        through its symlinks into the store.
+        :rtype : bool
+        """
+        corpus_dir = self._corpus_dir(corpus_type, corpus_name)
+        tree = self.store.get_ref(self.language, corpus_type, corpus_name)
+        if tree is None:
+            if os.path.isdir(corpus_dir):
+                shutil.rmtree(corpus_dir)
+            return False
+        self.store.link_tree(tree, corpus_dir)
+        logger.info("Linked corpus '%s' from store '%s'.",
+                    corpus_name,
+                    self.store.root)
+        return True
+
+    def _add_to_store(self, corpus_type, corpus_name):
+        """Move a freshly unpacked corpus into the store and replace it with
+        a view."""
+        corpus_dir = self._corpus_dir(corpus_type, corpus_name)
+        tree = self.store.add_tree(corpus_dir)
+        self.store.set_ref(self.language, corpus_type, corpus_name, tree)
+        self.store.link_tree(tree, corpus_dir)
 
     @staticmethod
     def _copy_dir_recursive(src_rel, dst_rel):
@@ -173,38 +791,260 @@ class CorpusImporter():
         elif self.language == 'latin':
             corpora = LATIN_CORPORA
         else:
-            logger.error("Corpora not available for '%s' language.", self.language)
-            sys.exit(1)
+            raise CorpusImportError("Corpora not available for '{0}' "
+                                    "language.".format(self.language))
         corpus_properties = None
         for corpus in corpora:
             if corpus['name'] == corpus_name:
                 corpus_properties = corpus
         if not corpus_properties:
-            logger.info("Corpus '%s' not available for the '%s' language.",
-                        corpus_name,
-                        self.language)
-            sys.exit(1)
+            raise CorpusImportError("Corpus '{0}' not available for the '{1}' "
+                                    "language.".format(corpus_name,
+                                                       self.language))
         return corpus_properties
 
-    def import_corpus(self, corpus_name, path=None):  # pylint: disable=R0912
+    def _corpus_paths(self, corpus_properties):
+        """List what an import of a corpus left in ``cltk_data``, relative
+        to it: its directory (which for the TLG and PHI also holds texts
+        converted by TLGU) and its files in ``originals``.
+        :rtype : list
+        """
+        data_dir = get_cltk_data_dir()
+        corpus_name = corpus_properties['name']
+        paths = [os.path.join(self.language, corpus_properties['type'],
+                              corpus_name)]
+        if corpus_properties['location'] == 'remote':
+            file_name = urlsplit(corpus_properties['path']).path.split('/')[-1]
+            stem = os.path.splitext(file_name)[0]
+            if not stem.endswith('.tar'):
+                stem += '.tar'
+            # the archive, its manifest, and the plain tar of a lazy import
+            for name in (file_name, file_name + '.manifest.json', stem):
+                paths.append(os.path.join('originals', name))
+        else:
+            paths.append(os.path.join('originals', corpus_name))
+        return [path for path in paths
+                if os.path.exists(os.path.join(data_dir, path))]
+
+    def export_bundle(self, corpus_names, bundle_path):
+        """Write imported corpora to one bundle file, from which
+        ``import_bundle()`` can provision another machine without network
+        access. The bundle is an uncompressed tar holding ``manifest.json``
+        and then one ``.tar.gz`` per corpus, with everything the corpus has in
+        ``cltk_data``. Symlinks into a ``CorpusStore`` are followed.
+        :type corpus_names: list
+        :param corpus_names: Names of imported corpora of this language.
+        :type bundle_path: str
+        :param bundle_path: File to write.
+        :rtype : dict
+        :return: The bundle's manifest.
+        """
+        data_dir = get_cltk_data_dir()
+        bundle_path = os.path.expanduser(bundle_path)
+        entries = []
+        for corpus_name in corpus_names:
+            corpus_properties = self._check_corpus_availability(corpus_name)
+            paths = self._corpus_paths(corpus_properties)
+            if not paths:
+                raise CorpusImportError("Corpus '{0}' has not been "
+                                        "imported.".format(corpus_name))
+            # tar keeps mtimes only to the second, too coarse for the
+            # manifests of downloaded archives, which record them exactly
+            mtimes = {path: os.stat(os.path.join(data_dir, path)).st_mtime_ns
+                      for path in paths
+                      if os.path.isfile(os.path.join(data_dir, path))}
+            entries.append({'name': corpus_name,
+                            'language': self.language,
+                            'type': corpus_properties['type'],
+                            'member': 'corpora/{0}/{1}.tar.gz'.format(
+                                self.language, corpus_name),
+                            'paths': paths,
+                            'mtime_ns': mtimes})
+        manifest = {'cltk_bundle': 1, 'corpora': entries}
+        manifest_bytes = json.dumps(manifest, indent=2).encode('utf-8')
+        tmp_path = bundle_path + '.tmp'
+        with tarfile.open(tmp_path, 'w') as bundle:
+            info = tarfile.TarInfo('manifest.json')
+            info.size = len(manifest_bytes)
+            info.mtime = time.time()
+            bundle.addfile(info, io.BytesIO(manifest_bytes))
+            for entry in entries:
+                inner_path = bundle_path + '.corpus.tmp'
+                with tarfile.open(inner_path, 'w:gz',
+                                  dereference=True) as inner:
+                    for path in entry['paths']:
+                        inner.add(os.path.join(data_dir, path), arcname=path)
+                bundle.add(inner_path, arcname=entry['member'])
+                os.remove(inner_path)
+                logger.info("Added corpus '%s' to bundle '%s'.",
+                            entry['name'],
+                            bundle_path)
+        os.replace(tmp_path, bundle_path)
+        return manifest
+
+    def import_bundle(self, bundle_path, max_workers=4):
+        """Unpack a bundle written by ``export_bundle()`` into
+        ``cltk_data``, leaving it as though its corpora had been imported
+        here. The bundle's headers are read once, front to back; the corpora
+        are then extracted in parallel, each worker reading its own byte
+        range of the bundle.
+        :type bundle_path: str
+        :param bundle_path: Bundle file to read.
+        :type max_workers: int
+        :param max_workers: Number of corpora extracted at once.
+        :rtype : dict
+        :return: Maps each corpus name to ``{'status': 'imported' or
+        'failed', 'error': None or str}``.
+        """
+        data_dir = get_cltk_data_dir()
+        bundle_path = os.path.expanduser(bundle_path)
+        try:
+            with tarfile.open(bundle_path, 'r:') as bundle:
+                members = {member.name: member for member in bundle}
+                manifest = json.loads(
+                    bundle.extractfile('manifest.json').read().decode('utf-8'))
+        except Exception as except_read:  # pylint: disable=W0703
+            logger.error("Failed to read bundle '%s': '%s'",
+                         bundle_path,
+                         except_read)
+            raise CorpusImportError(except_read)
+        os.makedirs(data_dir, exist_ok=True)
+
+        def extract(entry):
+            """Extract one corpus from its slice of the bundle."""
+            member = members[entry['member']]
+            with open(bundle_path, 'rb') as bundle_file:
+                bundle_file.seek(member.offset_data)
+                reader = _FileSlice(bundle_file, member.size)
+                with tarfile.open(fileobj=reader, mode='r|gz') as inner:
+                    for inner_member in _checked_members(inner, data_dir):
+                        inner.extract(inner_member, data_dir)
+            for path, mtime_ns in entry.get('mtime_ns', {}).items():
+                path = os.path.join(data_dir, path)
+                if _is_within(path, data_dir) and os.path.isfile(path):
+                    os.utime(path, ns=(mtime_ns, mtime_ns))
+            logger.info("Imported corpus '%s' from bundle '%s'.",
+                        entry['name'],
+                        bundle_path)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(entry['name'], executor.submit(extract, entry))
+                       for entry in manifest['corpora']]
+            for name, future in futures:
+                try:
+                    future.result()
+                    results[name] = {'status': 'imported', 'error': None}
+                except Exception as exc:  # pylint: disable=W0703
+                    logger.error("Failed to import corpus '%s' from bundle: %s",
+                                 name,
+                                 exc)
+                    results[name] = {'status': 'failed', 'error': str(exc)}
+        return results
+
+    def import_corpus(self, corpus_name, path=None, stream_unpack=False,  # pylint: disable=R0913
+                      keep_archive=True, sync=False, sync_checksum=False,
+                      hardlink=False, lazy=False, segments=1):
         """Download a remote or load local corpus into dir ``~/cltk_data``.
-        TODO: Move some if/else logic into own methods.
         :type corpus_name: str
         :param corpus_name: The name of an available corpus.
         :param path: str
         :param path: A filepath, required when importing local corpora.
+        :type stream_unpack: bool
+        :param stream_unpack: Extract a remote corpus while it downloads,
+        instead of saving the archive and then unpacking it.
+        :type keep_archive: bool
+        :param keep_archive: With ``stream_unpack``, also save the archive in
+        ``originals``.
+        :type sync: bool
+        :param sync: For a local corpus, update ``originals/<corpus_name>`` by
+        copying only changed files, in parallel, instead of deleting it and
+        copying everything again.
+        :type sync_checksum: bool
+        :param sync_checksum: With ``sync``, also compare file hashes.
+        :type hardlink: bool
+        :param hardlink: With ``sync``, hard link files when the source is on
+        the same filesystem.
+        :type lazy: bool
+        :param lazy: For a remote corpus, keep it as an indexed archive
+        instead of extracting it; ``open_pickle()`` reads files out of it on
+        first use.
+        :type segments: int
+        :param segments: For a remote corpus, download the archive as this
+        many byte ranges in parallel, if the server supports it.
+        """
+        try:
+            self._import_corpus(corpus_name, path, stream_unpack, keep_archive,
+                                sync, sync_checksum, hardlink, lazy,
+                                segments)
+        except CorpusImportError as exc:
+            logger.error("Failed to import corpus '%s': %s", corpus_name, exc)
+            self._report(corpus_name, 'failed', exc)
+            sys.exit(1)
+        self._report(corpus_name, 'imported')
+
+    def import_corpora(self, corpora, max_workers=4, **options):
+        """Import several corpora at once, in a pool of ``max_workers``
+        threads sharing one connection pool. A failure is recorded for its
+        own corpus and does not stop the others.
+        :type corpora: list
+        :param corpora: Corpus names, or ``(name, path)`` tuples for local
+        corpora.
+        :type max_workers: int
+        :param max_workers: Number of corpora downloaded and unpacked at once.
+        :param options: Keyword arguments as for ``import_corpus()``.
+        :rtype : dict
+        :return: Maps each corpus name to ``{'status': 'imported' or
+        'failed', 'error': None or str}``.
+        """
+        jobs = []
+        for corpus in corpora:
+            if isinstance(corpus, str):
+                jobs.append((corpus, None))
+            else:
+                jobs.append(tuple(corpus))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(name, executor.submit(self._import_corpus, name, path,
+                                              **options))
+                       for name, path in jobs]
+            for name, future in futures:
+                try:
+                    future.result()
+                    results[name] = {'status': 'imported', 'error': None}
+                    self._report(name, 'imported')
+                except Exception as exc:  # pylint: disable=W0703
+                    logger.error("Failed to import corpus '%s': %s", name, exc)
+                    results[name] = {'status': 'failed', 'error': str(exc)}
+                    self._report(name, 'failed', exc)
+        return results
+
+    def _import_corpus(self, corpus_name, path=None, stream_unpack=False,  # pylint: disable=R0912,R0913
+                       keep_archive=True, sync=False, sync_checksum=False,
+                       hardlink=False, lazy=False, segments=1):
+        """Do the work of ``import_corpus()``, raising ``CorpusImportError``
+        on failure.
+        TODO: Move some if/else logic into own methods.
         """
         corpus_properties = self._check_corpus_availability(corpus_name)
         location = corpus_properties['location']
         corpus_type = corpus_properties['type']
         if location == 'remote':
+            use_store = self.store is not None and not lazy
+            if use_store and self._link_from_store(corpus_type, corpus_name):
+                return
             path = corpus_properties['path']
-            self._download_corpus(corpus_type, corpus_name, path)
+            self._download_corpus(corpus_type, corpus_name, path,
+                                  corpus_properties.get('sha256'),
+                                  stream_unpack, keep_archive, lazy,
+                                  segments)
+            if use_store:
+                self._add_to_store(corpus_type, corpus_name)
         elif location == 'local':
             logger.info("Incoming path: '%s'", path)
             if not path:
-                logger.info("'path' argument required for local corpora.")
-                sys.exit(1)
+                raise CorpusImportError("'path' argument required for local "
+                                        "corpora.")
             if corpus_name in ('phi5', 'phi7', 'tlg'):
                 if corpus_name == 'phi5':
                     # normalize path for checking dir
@@ -212,34 +1052,50 @@ class CorpusImporter():
                         path = path[:-1]
                     # check for right corpus dir
                     if os.path.split(path)[1] != 'PHI5':
-                        logger.info("Directory must be named 'PHI5'.")
-                        sys.exit(1)
+                        raise CorpusImportError("Directory must be named "
+                                                "'PHI5'.")
                 if corpus_name == 'phi7':
                     # normalize path for checking dir
                     if path.endswith('/'):
                         path = path[:-1]
                     # check for right corpus dir
                     if os.path.split(path)[1] != 'PHI7':
-                        logger.info("Directory must be named 'PHI7'.")
-                        sys.exit(1)
+                        raise CorpusImportError("Directory must be named "
+                                                "'PHI7'.")
                 if corpus_name == 'tlg':
                     # normalize path for checking dir
                     if path.endswith('/'):
                         path = path[:-1]
                     # check for right corpus dir
                     if os.path.split(path)[1] != 'TLG_E':
-                        logger.info("Directory must be named 'TLG_E'.")
-                        sys.exit(1)
+                        raise CorpusImportError("Directory must be named "
+                                                "'TLG_E'.")
                 # move the dir-checking commands into a function
-                data_dir = os.path.expanduser(CLTK_DATA_DIR)
+                data_dir = get_cltk_data_dir()
                 originals_dir = os.path.join(data_dir, 'originals')
                 # check for `originals` dir; if not present mkdir
                 if not os.path.isdir(originals_dir):
-                    os.makedirs(originals_dir)
+                    os.makedirs(originals_dir, exist_ok=True)
                     logger.info("Wrote directory at '%s'.", originals_dir)
                 tlg_originals_dir = os.path.join(data_dir,
                                                  'originals',
                                                  corpus_name)
+                self._report(corpus_name, 'copying', path)
+                if sync:
+                    if not os.path.isdir(path):
+                        raise CorpusImportError("Cannot sync from '{0}', which "
+                                                "is not a directory.".format(path))
+                    try:
+                        counts = sync_dir(path, tlg_originals_dir,
+                                          checksum=sync_checksum,
+                                          hardlink=hardlink)
+                    except OSError as exc:
+                        raise CorpusImportError("Failed to sync '{0}' to '{1}': "
+                                                "{2}".format(path,
+                                                             tlg_originals_dir,
+                                                             exc))
+                    self._report(corpus_name, 'synced', counts)
+                    return
                 # check for `originals/<corpus_name>`; if pres, delete
                 if os.path.isdir(tlg_originals_dir):
                     shutil.rmtree(tlg_originals_dir)
@@ -0,0 +1,184 @@
+"""Keep many small text files, such as the individual works written by
+``TLGU.divide_works()``, in one compressed container.
+
+The container is a zip file: each work is compressed on its own (with zlib
+or lzma), and the central directory at the end is a table of their offsets,
+so any one work can be read without touching the others. One file per
+corpus saves thousands of inodes and directory scans, and takes much less
+disk.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import copy
+import os
+import struct
+import threading
+import warnings
+import zipfile
+
+
+COMPRESSION = {'zlib': zipfile.ZIP_DEFLATED,
+               'lzma': zipfile.ZIP_LZMA}
+# size of the fixed part of a zip member's local header
+LOCAL_HEADER_SIZE = 30
+# bytes copied at a time when carrying works over
+COPY_SIZE = 1024 * 1024
+
+
+class PackedWorks(object):
+    """Read and add works in a container. Works are added to a new container
+    in a temporary file beside the old one, which replaces it, with the works
+    not added again carried over, when it is closed. An interrupted run thus
+    leaves the old container as it was. Works are carried over as they are,
+    still compressed, so closing costs a copy of the old container, not
+    compressing it again.
+    """
+
+    def __init__(self, path, mode='r', compression='zlib'):
+        """
+        :type path: str
+        :param path: Container file.
+        :type mode: str
+        :param mode: ``'r'`` to read, ``'a'`` to add works (creating the
+        container if need be).
+        :type compression: str
+        :param compression: ``'zlib'`` or ``'lzma'``, for works added.
+        """
+        if compression not in COMPRESSION:
+            raise ValueError("Compression must be one of: {0}.".format(
+                ', '.join(sorted(COMPRESSION))))
+        if mode not in ('r', 'a'):
+            raise ValueError("Mode must be 'r' or 'a'.")
+        self.path = os.path.expanduser(path)
+        self._zip = None
+        if mode == 'r' or os.path.isfile(self.path):
+            self._zip = zipfile.ZipFile(self.path)
+        self._new = None
+        self._tmp_path = None
+        self._added = set()
+        if mode == 'a':
+            self._tmp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+            self._new = zipfile.ZipFile(self._tmp_path, 'w',
+                                        compression=COMPRESSION[compression])
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, name):
+        if name in self._added:
+            return True
+        if self._zip is None:
+            return False
+        try:
+            self._zip.getinfo(name)
+        except KeyError:
+            return False
+        return True
+
+    def names(self):
+        """Names of the works in the container, sorted.
+        :rtype : list
+        """
+        names = set(self._added)
+        if self._zip is not None:
+            names.update(self._zip.namelist())
+        return sorted(names)
+
+    def read(self, name, encoding='utf-8'):
+        """Read one work. Works added are readable once the container has
+        been closed.
+        :type name: str
+        :param name: E.g. ``'TLG0012.TXT-001.txt'``.
+        :rtype : str
+        """
+        if name in self._added or self._zip is None:
+            raise KeyError("There is no work named '{0}' in the container "
+                           "yet.".format(name))
+        with self._lock:
+            data = self._zip.read(name)
+        return data.decode(encoding)
+
+    def add_file(self, file_path, name=None):
+        """Compress a file into the container. A work added again under the
+        same name replaces the old one.
+        :type file_path: str
+        :param file_path: File to add.
+        :type name: str
+        :param name: Name in the container; defaults to the file's name.
+        """
+        if self._new is None:
+            raise ValueError('The container was opened for reading.')
+        if name is None:
+            name = os.path.basename(file_path)
+        with self._lock, warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # duplicate name
+            self._new.write(file_path, name)
+            self._added.add(name)
+
+    def _carry_over(self):
+        """Copy the works of the old container that were not added again
+        into the new one: their local headers and compressed data byte for
+        byte, and their entries in the central directory. zipfile has no way
+        to add a member that is already compressed, so the new container's
+        list of members and its file are updated directly.
+        """
+        if self._zip is None:
+            return
+        new = self._new
+        with open(self.path, 'rb') as old_file:
+            for name in sorted(set(self._zip.namelist()) - self._added):
+                info = self._zip.getinfo(name)
+                if info.flag_bits & 0x08:
+                    # sizes follow the data; never written by zipfile to a
+                    # file, so simply compressed again
+                    new.writestr(info, self._zip.read(info))
+                    continue
+                old_file.seek(info.header_offset)
+                header = old_file.read(LOCAL_HEADER_SIZE)
+                name_size, extra_size = struct.unpack('<HH', header[26:30])
+                if hasattr(new, 'start_dir'):  # Python 3.5+
+                    new.fp.seek(new.start_dir)
+                copied = copy.copy(info)
+                copied.header_offset = new.fp.tell()
+                new.fp.write(header)
+                remaining = name_size + extra_size + info.compress_size
+                while remaining:
+                    data = old_file.read(min(remaining, COPY_SIZE))
+                    if not data:
+                        raise zipfile.BadZipFile(
+                            "Work '{0}' is cut off in '{1}'.".format(
+                                name, self.path))
+                    new.fp.write(data)
+                    remaining -= len(data)
+                new.filelist.append(copied)
+                new.NameToInfo[name] = copied
+                new._didModify = True
+                if hasattr(new, 'start_dir'):
+                    new.start_dir = new.fp.tell()
+
+    def close(self):
+        """Close the container. Any works added are written, with those of
+        the old container, to the new one, which then replaces the old.
+        """
+        complete = False
+        try:
+            if self._added:
+                self._carry_over()
+            complete = True
+        finally:
+            if self._new is not None:
+                self._new.close()
+            if self._zip is not None:
+                self._zip.close()
+            if self._tmp_path is not None:
+                if complete and self._added:
+                    os.replace(self._tmp_path, self.path)
+                else:
+                    os.remove(self._tmp_path)
+                self._tmp_path = None
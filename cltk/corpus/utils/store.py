@@ -0,0 +1,160 @@
+"""A content-addressed store for imported corpora, which can be shared
+read-only by many users and machines, e.g. on a network filesystem.
+
+Layout of a store::
+
+    blobs/ab/cdef...    one read-only file per distinct content (sha256)
+    trees/<sha256>.json a corpus: maps relative paths to blob hashes
+    refs/<language>/<type>/<name>.json  points a corpus name at a tree
+
+A corpus is used through a view: an ordinary directory tree, e.g. inside
+``~/cltk_data``, whose files are symlinks into ``blobs``. Identical files are
+stored once, however many corpora, users, or nodes use them.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import uuid
+
+from cltk.utils.cltk_logger import logger
+from cltk.utils.file_operations import file_sha256
+
+
+class CorpusStore(object):
+    """Add directory trees to, and build views from, a store at ``root``."""
+
+    def __init__(self, root):
+        """Create the store's directories if needed.
+        :type root: str
+        :param root: Directory of the store; may be on a shared filesystem.
+        """
+        self.root = os.path.abspath(os.path.expanduser(root))
+        for sub_dir in ('blobs', 'trees', 'refs'):
+            os.makedirs(os.path.join(self.root, sub_dir), exist_ok=True)
+
+    def _write_atomic(self, path, data):
+        """Write ``data`` to ``path`` through a uniquely named temporary
+        file, so that concurrent writers on other nodes cannot collide."""
+        tmp = '{0}.{1}.tmp'.format(path, uuid.uuid4().hex)
+        with open(tmp, 'w') as tmp_file:
+            tmp_file.write(data)
+        os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmp, path)
+
+    def blob_path(self, digest):
+        """Location of the blob with sha256 ``digest``.
+        :rtype : str
+        """
+        return os.path.join(self.root, 'blobs', digest[:2], digest[2:])
+
+    def add_file(self, path):
+        """Copy a file into the store, unless its content is already there.
+        :type path: str
+        :param path: File to add.
+        :rtype : str
+        :return: The file's sha256, by which it is stored.
+        """
+        digest = file_sha256(path)
+        blob = self.blob_path(digest)
+        if not os.path.isfile(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            tmp = '{0}.{1}.tmp'.format(blob, uuid.uuid4().hex)
+            shutil.copyfile(path, tmp)
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, blob)
+        return digest
+
+    def add_tree(self, src_dir):
+        """Add every file under ``src_dir`` to the store, along with a tree
+        manifest recording where each belongs.
+        :type src_dir: str
+        :param src_dir: Directory to add.
+        :rtype : str
+        :return: Hash of the tree manifest.
+        """
+        src_dir = os.path.expanduser(src_dir)
+        files = {}
+        for root, _, names in os.walk(src_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                files[os.path.relpath(path, src_dir)] = self.add_file(path)
+        manifest = json.dumps(files, sort_keys=True)
+        tree = self.add_tree_manifest(manifest)
+        logger.info("Added %d files from '%s' to store '%s' as tree %s.",
+                    len(files),
+                    src_dir,
+                    self.root,
+                    tree)
+        return tree
+
+    def add_tree_manifest(self, manifest):
+        """Store a tree manifest, serialized as JSON.
+        :rtype : str
+        :return: Hash of the manifest.
+        """
+        tree = hashlib.sha256(manifest.encode('utf-8')).hexdigest()
+        tree_path = os.path.join(self.root, 'trees', tree + '.json')
+        if not os.path.isfile(tree_path):
+            self._write_atomic(tree_path, manifest)
+        return tree
+
+    def read_tree(self, tree):
+        """Load a tree manifest.
+        :rtype : dict
+        """
+        with open(os.path.join(self.root, 'trees', tree + '.json')) as tree_file:
+            return json.load(tree_file)
+
+    def _ref_path(self, language, corpus_type, corpus_name):
+        """Location of the ref naming a corpus."""
+        return os.path.join(self.root, 'refs', language, corpus_type,
+                            corpus_name + '.json')
+
+    def set_ref(self, language, corpus_type, corpus_name, tree):
+        """Point a corpus name at a tree."""
+        ref_path = self._ref_path(language, corpus_type, corpus_name)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        self._write_atomic(ref_path, json.dumps({'tree': tree}))
+
+    def get_ref(self, language, corpus_type, corpus_name):
+        """Return the tree a corpus name points at, or None.
+        :rtype : str
+        """
+        try:
+            with open(self._ref_path(language, corpus_type,
+                                     corpus_name)) as ref_file:
+                return json.load(ref_file)['tree']
+        except (IOError, ValueError, KeyError):
+            return None
+
+    def link_tree(self, tree, dst_dir):
+        """Build a view of a tree at ``dst_dir``: real directories holding
+        symlinks to the blobs. An existing ``dst_dir`` is replaced only once
+        the new view is complete.
+        :type tree: str
+        :param tree: Hash of a tree manifest.
+        :type dst_dir: str
+        :param dst_dir: Where the view should appear.
+        """
+        dst_dir = os.path.expanduser(dst_dir).rstrip(os.sep)
+        tmp_dir = '{0}.{1}.tmp'.format(dst_dir, uuid.uuid4().hex)
+        for rel_path, digest in self.read_tree(tree).items():
+            link_path = os.path.join(tmp_dir, rel_path)
+            os.makedirs(os.path.dirname(link_path), exist_ok=True)
+            os.symlink(self.blob_path(digest), link_path)
+        os.makedirs(tmp_dir, exist_ok=True)
+        old_dir = None
+        if os.path.lexists(dst_dir):
+            old_dir = '{0}.{1}.old'.format(dst_dir, uuid.uuid4().hex)
+            os.rename(dst_dir, old_dir)
+        os.makedirs(os.path.dirname(dst_dir), exist_ok=True)
+        os.rename(tmp_dir, dst_dir)
+        if old_dir:
+            shutil.rmtree(old_dir)
+        logger.info("Linked tree %s into '%s'.", tree, dst_dir)
@@ -6,7 +6,10 @@ __license__ = 'MIT License. See LICENSE.'
 import importlib.machinery
 import os
 import re
+import types
 
+from cltk.utils.archive_index import read_member
+from cltk.utils.cltk_data import get_cltk_data_dir
 from cltk.utils.cltk_logger import logger
 
 
@@ -30,13 +33,22 @@ class LemmaReplacer(object):  # pylint: disable=R0903
         assert self.language in AVAILABLE_LANGUAGES, \
             'Corpora not available for {0} language.'.format(self.language)
         if self.language == 'latin':
-            rel_path = os.path.join('~/cltk_data',
-                                    self.language,
-                                    'trained_model/cltk_linguistic_data/lemmata/lemma_list.py')  # pylint: disable=C0301
-            path = os.path.expanduser(rel_path)
+            path = os.path.join(get_cltk_data_dir(),
+                                self.language,
+                                'trained_model/cltk_linguistic_data/lemmata/lemma_list.py')  # pylint: disable=C0301
             logger.info('Loading lemmata. This may take a minute.')
-            loader = importlib.machinery.SourceFileLoader('lemma_list', path)
-            module = loader.load_module()
+            if os.path.isfile(path):
+                loader = importlib.machinery.SourceFileLoader('lemma_list',
+                                                              path)
+                module = loader.load_module()
+            else:
+                # the corpus may be kept as an indexed archive
+                source = read_member(path)
+                assert source is not None, \
+                    'CLTK linguistics data not available for {0}.'.format(
+                        self.language)
+                module = types.ModuleType('lemma_list')
+                exec(compile(source, path, 'exec'), module.__dict__)  # pylint: disable=W0122
             patterns = module.REPLACEMENT_PATTERNS
         return [(re.compile(regex), repl) for (regex, repl) in patterns]
 
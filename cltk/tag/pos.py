@@ -5,6 +5,8 @@ __license__ = 'MIT License. See LICENSE.'
 
 import os
 
+from cltk.utils.archive_index import member_exists
+from cltk.utils.cltk_data import get_cltk_data_dir
 from cltk.utils.file_operations import open_pickle
 
 from nltk.tokenize import wordpunct_tokenize
@@ -43,14 +45,13 @@ class POSTag():
         """
         assert lang in TAGGERS.keys(), \
             'POS tagger not available for {0} language.'.format(lang)
-        rel_path = os.path.join('~/cltk_data',
-                                lang,
-                                'trained_model/cltk_linguistic_data/taggers/pos')  # pylint: disable=C0301
-        path = os.path.expanduser(rel_path)
+        path = os.path.join(get_cltk_data_dir(),
+                            lang,
+                            'trained_model/cltk_linguistic_data/taggers/pos')
         tagger_paths = {}
         for tagger_key, tagger_val in TAGGERS[lang].items():
             tagger_path = os.path.join(path, tagger_val)
-            assert os.path.isfile(tagger_path), \
+            assert os.path.isfile(tagger_path) or member_exists(tagger_path), \
                 'CLTK linguistics data not available for {0}.'.format(tagger_val)
             tagger_paths[tagger_key] = tagger_path
         return tagger_paths
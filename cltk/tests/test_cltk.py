@@ -5,17 +5,47 @@ TODO: Write test for copy_dir_contents
 __author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
 __license__ = 'MIT License. See LICENSE.'
 
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+import hashlib
+import io
+import json
 import os
+import pickle
+import shutil
+import tarfile
+import tempfile
+import threading
+import unicodedata
 import unittest
+from unittest import mock
+import zipfile
 
 from cltk.corpus.utils.formatter import build_corpus_index
+from cltk.corpus.greek import beta_to_unicode
 from cltk.corpus.greek.beta_to_unicode import Replacer
+from cltk.corpus.greek import citation_index
+from cltk.corpus.greek import tlg_reader
+from cltk.corpus.greek.tlg_indices import TLG_INDEX
+from cltk.corpus.greek.tlg_indices import TLG_MASTER_INDEX
+from cltk.corpus.greek.tlg_indices import TLG_WORKS_INDEX
 
 from cltk.corpus.greek.tlgu import TLGU
+from cltk.utils import archive_index
 from cltk.utils.file_operations import open_pickle
+from cltk.utils.mapped_index import MappedIndex
+from cltk.utils.mapped_index import write_mapped_index
+from cltk.corpus.utils.formatter import cleanup_tlg_file
 from cltk.corpus.utils.formatter import cleanup_tlg_txt
+from cltk.corpus.utils.formatter import index_from_files
+from cltk.corpus.utils.formatter import iter_cleanup_tlg_txt
+from cltk.corpus.utils.formatter import load_author_index
 from cltk.corpus.utils.formatter import remove_non_ascii
+from cltk.corpus.utils import importer
+from cltk.corpus.utils.async_importer import AsyncCorpusImporter
 from cltk.corpus.utils.importer import CorpusImporter
+from cltk.corpus.utils.packed_works import PackedWorks
 from cltk.stem.latin.j_v import JVReplacer
 from cltk.stem.lemma import LemmaReplacer
 from cltk.stem.latin.stem import Stemmer
@@ -191,6 +221,34 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         valid = """πολλὰ ἔτϊ πάνυ παραλείπω· τὸ δὲ μέγϊστον εἴρηταϊ πλὴν αἱ τάξεϊσ τοῦ φόρου· τοῦτο δὲ γίγνεταϊ ὡσ τὰ πολλὰ δῐ ἔτουσ πέμπτου. φέρε δὴ τοίνυν, ταῦτα οὐκ οἴεσθαϊ  χρῆναϊ δϊαδϊκάζεϊν ἅπαντα; εἰπάτω γάρ τϊσ ὅ τϊ οὐ χρῆν αὐτόθϊ δϊαδϊκάζεσθαϊ. εἰ δ’ αὖ ὁμολογεῖν δεῖ ἅπαντα χρῆναϊ δϊαδϊκάζεϊν, ἀνάγκη δῐ ἐνϊαυτοῦ· ὡσ οὐδὲ νῦν δῐ ἐνϊαυτοῦ δϊκάζοντεσ ὑπάρχουσϊν ὥστε παύεϊν τοὺσ ἀδϊκοῦντασ ὑπὸ τοῦ πλήθουσ τῶν ἀνθρώπων."""
         self.assertEqual(clean_str, valid)
 
+    def test_formatter_cleanup_tlg_streaming(self):
+        """Test cleaning TLG text in chunks that break mid-line and mid-markup,
+        and a file a line at a time, to match cleaning it whole."""
+        unclean_str = 'μῆνιν @1 {1ΙΛΙΑΔΟΣ Α}1 @ ἄειδε\\. [2θεὰ]2 12 —\nπηληϊάδεω% ἀχιλῆος+\n'  # pylint: disable=C0301
+        valid = cleanup_tlg_txt(unclean_str)
+        self.assertEqual(valid, 'μῆνϊν  ἄεϊδε.    — \nπηληϊάδεω ἀχϊλῆοςϊ\n')
+        chunks = [unclean_str[i:i + 5] for i in range(0, len(unclean_str), 5)]
+        self.assertEqual(''.join(iter_cleanup_tlg_txt(chunks)), valid)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        input_path = os.path.join(tmp_dir, 'in.txt')
+        output_path = os.path.join(tmp_dir, 'out.txt')
+        with open(input_path, 'w') as input_file:
+            input_file.write(unclean_str * 3)
+        cleanup_tlg_file(input_path, output_path)
+        with open(output_path) as output_file:
+            self.assertEqual(output_file.read(), valid * 3)
+
+    def test_formatter_cleanup_tlg_no_newlines(self):
+        """Test that text without newlines is cleaned a piece at a time,
+        never breaking it inside markup."""
+        unclean_str = 'μῆνιν @1 {1ΙΛΙΑΔΟΣ Α}1 @ ἄειδε\\ [2θεὰ πηληϊάδεω]2 12 ' * 20
+        chunks = [unclean_str[i:i + 5] for i in range(0, len(unclean_str), 5)]
+        with mock.patch('cltk.corpus.utils.formatter.MAX_PENDING', 10):
+            cleaned = list(iter_cleanup_tlg_txt(chunks))
+        self.assertEqual(''.join(cleaned), cleanup_tlg_txt(unclean_str))
+        self.assertGreater(len(cleaned), 20)
+
     def test_lemmatizer_latin(self):
         """Test the Latin lemmatizer."""
         replacer = LemmaReplacer('latin')
@@ -243,6 +301,102 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         target_unicode = 'ὅπως οὖν μὴ ταὐτὸ '
         self.assertEqual(unicode, target_unicode)
 
+    def test_greek_betacode_single_pass(self):
+        """Test that the single-pass conversion matches applying each
+        pattern in turn, and that other patterns fall back to that."""
+        replacer = Replacer()
+        self.assertTrue(replacer.single_pass)
+        beta_example = r"""*)/ANDRA MOI E)/NNEPE, MOU=SA, *S3 S3 I/+ W)=| TW=N A'S:"""
+        self.assertEqual(replacer.beta_code(beta_example),
+                         replacer._apply_patterns(beta_example.replace('-', '')))  # pylint: disable=W0212
+        self.assertEqual(replacer.beta_code('MH=NIN A)/EIDE QEA/'),
+                         'μῆνιν ἄειδε θεά')
+        no_punct = Replacer(pattern3=[])
+        self.assertEqual(no_punct.beta_code('LO/GOS:'), 'λόγος·')
+        regex = Replacer(pattern1=[], pattern2=[(r'[AE]', 'α')], pattern3=[])
+        self.assertFalse(regex.single_pass)
+        self.assertEqual(regex.beta_code('AEB'), 'ααB')
+
+    def test_greek_betacode_streaming(self):
+        """Test converting beta code in chunks that break inside keys, and
+        whole files and directories."""
+        replacer = Replacer()
+        beta_example = 'O(/PWS OU)=N MH\\ TAU)TO\\\n*)/ANDRA MOI E)/NNEPE, MOU=SA:\n' * 20  # pylint: disable=C0301
+        target = replacer.beta_code(beta_example)
+        for size in (1, 2, 5, 64):
+            chunks = [beta_example[i:i + size]
+                      for i in range(0, len(beta_example), size)]
+            self.assertEqual(''.join(replacer.iter_beta_code(chunks)), target)
+        one_line = beta_example.replace('\n', ' ')
+        chunks = [one_line[i:i + 3] for i in range(0, len(one_line), 3)]
+        self.assertEqual(''.join(replacer.iter_beta_code(chunks)),
+                         replacer.beta_code(one_line))
+        regex = Replacer(pattern1=[], pattern2=[(r'[AE]', 'α')], pattern3=[])
+        chunks = [one_line[i:i + 5] for i in range(0, len(one_line), 5)]
+        with mock.patch('cltk.corpus.greek.beta_to_unicode.MAX_PENDING', 10):
+            converted = list(replacer.iter_beta_code(chunks))
+            self.assertEqual(''.join(regex.iter_beta_code(chunks)),
+                             regex.beta_code(one_line))
+        self.assertEqual(''.join(converted), replacer.beta_code(one_line))
+        self.assertGreater(len(converted), 20)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        input_dir = os.path.join(tmp_dir, 'beta')
+        os.makedirs(input_dir)
+        for name in ('TLG0001.TXT', 'TLG0002.TXT'):
+            with open(os.path.join(input_dir, name), 'w',
+                      encoding='latin-1') as beta_file:
+                beta_file.write(beta_example)
+        output_dir = os.path.join(tmp_dir, 'unicode')
+        results = replacer.convert_dir(input_dir, output_dir, max_workers=2)
+        self.assertEqual(results['TLG0002.TXT'],
+                         {'status': 'converted', 'error': None})
+        with open(os.path.join(output_dir, 'TLG0001.TXT'),
+                  encoding='utf-8') as unicode_file:
+            self.assertEqual(unicode_file.read(), target)
+
+    def test_greek_betacode_shared_tables(self):
+        """Test that Replacers share their tables within a process, and load
+        them from the disk cache, keyed by their patterns, in another."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': tmp_dir}), \
+                mock.patch.object(beta_to_unicode, '_TABLES', {}):
+            replacer = Replacer()
+            self.assertIs(Replacer()._tables, replacer._tables)  # pylint: disable=W0212
+            no_punct = Replacer(pattern3=[])
+            self.assertIsNot(no_punct._tables, replacer._tables)  # pylint: disable=W0212
+            cache_dir = os.path.join(tmp_dir, beta_to_unicode.CACHE_DIR)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            beta_to_unicode._TABLES.clear()  # pylint: disable=W0212
+            with mock.patch.object(beta_to_unicode._Tables, 'build') as build:  # pylint: disable=W0212
+                cached = Replacer()
+                self.assertFalse(build.called)
+            self.assertTrue(cached.single_pass)
+            self.assertEqual(cached.beta_code('MH=NIN A)/EIDE QEA/'),
+                             'μῆνιν ἄειδε θεά')
+            self.assertEqual(Replacer(pattern3=[]).beta_code('LO/GOS:'),
+                             'λόγος·')
+
+    def test_greek_unicode_to_betacode(self):
+        """Test converting Unicode back to beta code, composed or
+        decomposed, whole or in chunks."""
+        replacer = Replacer()
+        beta_example = r"""*)/ANDRA MOI E)/NNEPE, *MOU=SA, O(/PWS OU)=N MH\ TAU)TO\ """
+        text = replacer.beta_code(beta_example)
+        self.assertEqual(replacer.unicode_to_beta(text), beta_example)
+        decomposed = unicodedata.normalize('NFD', text)
+        self.assertNotEqual(decomposed, text)
+        self.assertEqual(replacer.unicode_to_beta(decomposed), beta_example)
+        chunks = [decomposed[i:i + 3] for i in range(0, len(decomposed), 3)]
+        self.assertEqual(''.join(replacer.iter_unicode_to_beta(chunks)),
+                         beta_example)
+        self.assertEqual(replacer.unicode_to_beta('σ ς'), 'S1 S2')
+        self.assertEqual(replacer.beta_code('S1 S2'), 'σ ς')
+        with self.assertRaises(ValueError):
+            Replacer(pattern1=[], pattern2=[(r'[AE]', 'α')],
+                     pattern3=[]).unicode_to_beta('α')
+
     def test_latin_stemmer(self):
         """Test Latin stemmer."""
         sentence = 'Est interdum praestare mercaturis rem quaerere, nisi tam periculosum sit, et item foenerari, si tam honestum.'  # pylint: disable=C0301
@@ -378,6 +532,240 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
 """
         self.assertEqual(new_text, target)
 
+    def test_tlgu_convert_corpus(self):
+        """Test converting a corpus in parallel, with a bad file reported
+        without stopping the others."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        in_test = os.path.abspath('cltk/tests/tlgu_test_text_beta_code.txt')
+        for name in ('TLG0001.TXT', 'TLG0002.TXT'):
+            shutil.copy(in_test, os.path.join(orig_dir, name))
+        os.symlink(os.path.join(orig_dir, 'missing'),
+                   os.path.join(orig_dir, 'TLG0003.TXT'))
+        tlgu = TLGU()
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}):
+            results = tlgu.convert_corpus(corpus='tlg', max_workers=2)
+        self.assertEqual(results['TLG0001.TXT']['status'], 'converted')
+        self.assertEqual(results['TLG0002.TXT']['status'], 'converted')
+        self.assertEqual(results['TLG0003.TXT']['status'], 'failed')
+        out_path = os.path.join(data_dir, 'greek', 'text', 'tlg', 'plaintext',
+                                'TLG0001.TXT')
+        self.assertTrue(os.path.isfile(out_path))
+
+    def test_tlgu_convert_corpus_incremental(self):
+        """Test that converting a corpus again only converts new or changed
+        files."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        in_test = os.path.abspath('cltk/tests/tlgu_test_text_beta_code.txt')
+        shutil.copy(in_test, os.path.join(orig_dir, 'TLG0001.TXT'))
+        tlgu = TLGU()
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}):
+            tlgu.convert_corpus(corpus='tlg')
+            shutil.copy(in_test, os.path.join(orig_dir, 'TLG0002.TXT'))
+            results = tlgu.convert_corpus(corpus='tlg')
+        self.assertEqual(results['TLG0001.TXT']['status'], 'skipped')
+        self.assertEqual(results['TLG0002.TXT']['status'], 'converted')
+        out_dir = os.path.join(data_dir, 'greek', 'text', 'tlg', 'plaintext')
+        self.assertEqual(sorted(os.listdir(out_dir)),
+                         ['.tlgu_manifest.json', 'TLG0001.TXT', 'TLG0002.TXT'])
+
+    def test_tlgu_convert_corpus_interrupted(self):
+        """Test that the manifest records the files converted before a run is
+        interrupted."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        for name, size in (('TLG0001.TXT', 20), ('TLG0002.TXT', 10)):
+            with open(os.path.join(orig_dir, name), 'w') as orig_file:
+                orig_file.write('a' * size)
+
+        def call_tlgu(input_path, output_path, tlgu_flags):
+            """Convert the larger file, then stop, as if killed."""
+            if input_path.endswith('TLG0002.TXT'):
+                raise KeyboardInterrupt
+            shutil.copy(input_path, output_path)
+        tlgu = TLGU.__new__(TLGU)
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}), \
+                mock.patch.object(TLGU, '_call_tlgu', side_effect=call_tlgu):
+            with self.assertRaises(KeyboardInterrupt):
+                tlgu.convert_corpus(corpus='tlg', max_workers=1)
+        out_dir = os.path.join(data_dir, 'greek', 'text', 'tlg', 'plaintext')
+        with open(os.path.join(out_dir, '.tlgu_manifest.json')) as manifest:
+            self.assertEqual(list(json.load(manifest)), ['TLG0001.TXT'])
+
+    def test_tlgu_convert_corpus_variants(self):
+        """Test converting a corpus into several variants at once."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        in_test = os.path.abspath('cltk/tests/tlgu_test_text_beta_code.txt')
+        shutil.copy(in_test, os.path.join(orig_dir, 'TLG0001.TXT'))
+        tlgu = TLGU()
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}):
+            results = tlgu.convert_corpus(corpus='tlg',
+                                          variants=[{}, {'markup': 'full'}])
+        self.assertEqual(results['TLG0001.TXT']['variants'],
+                         {'plaintext': 'converted', 'full': 'converted'})
+        text_dir = os.path.join(data_dir, 'greek', 'text', 'tlg')
+        with open(os.path.join(text_dir, 'plaintext', 'TLG0001.TXT')) as file:
+            plaintext = file.read()
+        with open(os.path.join(text_dir, 'full', 'TLG0001.TXT')) as file:
+            full = file.read()
+        self.assertNotEqual(plaintext, full)
+
+    def test_tlgu_convert_corpus_variant_latin(self):
+        """Test that a variant may override ``latin``, and that unknown
+        variant options are refused."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        with open(os.path.join(orig_dir, 'TLG0001.TXT'), 'w') as orig_file:
+            orig_file.write('a')
+        flags = []
+
+        def call_tlgu(input_path, output_path, tlgu_flags):
+            """Record the flags and copy the input."""
+            flags.append(tlgu_flags)
+            shutil.copy(input_path, output_path)
+        tlgu = TLGU.__new__(TLGU)
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}), \
+                mock.patch.object(TLGU, '_call_tlgu', side_effect=call_tlgu):
+            results = tlgu.convert_corpus(
+                corpus='tlg', variants=[{}, {'latin': True, 'name': 'roman'}])
+            self.assertEqual(results['TLG0001.TXT']['variants'],
+                             {'plaintext': 'converted', 'roman': 'converted'})
+            with self.assertRaises(SystemExit):
+                tlgu.convert_corpus(corpus='tlg', variants=[{'mark': 'full'}])
+        self.assertEqual(sorted(flags), [[], ['-r']])
+
+    def test_tlgu_iter_convert(self):
+        """Test streaming the output of TLGU instead of writing a file."""
+        in_test = os.path.abspath('cltk/tests/tlgu_test_text_beta_code.txt')
+        tlgu = TLGU()
+        lines = list(tlgu.iter_convert(in_test))
+        target = """
+βλλον δ' ἀλλλους χαλκρεσιν ἐγχεῃσιν.
+"""
+        self.assertEqual(''.join(lines), target)
+        self.assertEqual(len(lines), 2)
+
+    def test_tlgu_iter_convert_messages(self):
+        """Test streaming from a tlgu that writes more messages than a pipe
+        holds, and falling back to a temporary file without /dev/stdout."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        in_path = os.path.join(tmp_dir, 'TLG0001.TXT')
+        with open(in_path, 'w') as in_file:
+            in_file.write('μῆνιν ἄειδε\n' * 1000)
+        tlgu_path = os.path.join(tmp_dir, 'tlgu')
+        with open(tlgu_path, 'w') as tlgu_file:
+            tlgu_file.write('#!/bin/sh\n'
+                            'yes warning | head -c 1000000 >&2\n'
+                            'cat "$1" > "$2"\n')
+        os.chmod(tlgu_path, 0o755)
+        path = tmp_dir + os.pathsep + os.environ.get('PATH', '')
+        tlgu = TLGU.__new__(TLGU)
+        with mock.patch.dict(os.environ, {'PATH': path}):
+            self.assertEqual(len(list(tlgu.iter_convert(in_path))), 1000)
+            with mock.patch('cltk.corpus.greek.tlgu.DEV_STDOUT',
+                            os.path.join(tmp_dir, 'missing')):
+                chunks = list(tlgu.iter_convert(in_path, lines=False))
+        self.assertEqual(''.join(chunks), 'μῆνιν ἄειδε\n' * 1000)
+
+    def test_tlgu_divide_works_packed(self):
+        """Test dividing works into a compressed container."""
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        in_test = os.path.abspath('cltk/tests/tlgu_test_text_beta_code.txt')
+        shutil.copy(in_test, os.path.join(orig_dir, 'TLG0001.TXT'))
+        tlgu = TLGU()
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}):
+            results = tlgu.divide_works('tlg', pack='lzma')
+            self.assertEqual(results['TLG0001.TXT']['status'], 'converted')
+            results = tlgu.divide_works('tlg', pack='lzma')
+            self.assertEqual(results['TLG0001.TXT']['status'], 'skipped')
+        pack_path = os.path.join(data_dir, 'greek', 'text', 'tlg',
+                                 'individual_works.zip')
+        with PackedWorks(pack_path) as pack:
+            names = pack.names()
+            self.assertTrue(names)
+            self.assertIn('χαλκρεσιν', ''.join(pack.read(name)
+                                                for name in names))
+
+    def test_packed_works(self):
+        """Test adding works to a container and reading them back."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        work_path = os.path.join(tmp_dir, 'TLG0001.TXT-001.txt')
+        with open(work_path, 'w') as work_file:
+            work_file.write('μῆνιν ἄειδε θεὰ\n' * 100)
+        pack_path = os.path.join(tmp_dir, 'works.zip')
+        for compression in ('zlib', 'lzma'):
+            with PackedWorks(pack_path, 'a', compression) as pack:
+                pack.add_file(work_path)
+                pack.add_file(work_path, 'TLG0001.TXT-002.txt')
+        self.assertLess(os.path.getsize(pack_path),
+                        os.path.getsize(work_path))
+        with PackedWorks(pack_path) as pack:
+            self.assertEqual(pack.names(), ['TLG0001.TXT-001.txt',
+                                            'TLG0001.TXT-002.txt'])
+            self.assertIn('TLG0001.TXT-002.txt', pack)
+            self.assertNotIn('TLG0001.TXT-003.txt', pack)
+            self.assertEqual(pack.read('TLG0001.TXT-002.txt'),
+                             'μῆνιν ἄειδε θεὰ\n' * 100)
+
+    def test_packed_works_replace(self):
+        """Test that a work added again replaces the old one without the
+        container growing, and only once the container is closed."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        work_path = os.path.join(tmp_dir, 'TLG0001.TXT-001.txt')
+        pack_path = os.path.join(tmp_dir, 'works.zip')
+        with open(work_path, 'w') as work_file:
+            work_file.write('ἄειδε\n' * 1000)
+        with PackedWorks(pack_path, 'a') as pack:
+            pack.add_file(work_path)
+            pack.add_file(work_path, 'TLG0001.TXT-002.txt')
+        size = os.path.getsize(pack_path)
+        with open(work_path, 'w') as work_file:
+            work_file.write('θεὰ\n' * 1000)
+        pack = PackedWorks(pack_path, 'a')
+        pack.add_file(work_path)
+        with PackedWorks(pack_path) as old_pack:
+            self.assertEqual(old_pack.read('TLG0001.TXT-001.txt'),
+                             'ἄειδε\n' * 1000)
+        pack.close()
+        # works carried over are copied, not compressed again
+        with mock.patch.object(zipfile.ZipFile, 'writestr',
+                               side_effect=AssertionError):
+            for _ in range(2):
+                with PackedWorks(pack_path, 'a', 'lzma') as pack:
+                    pack.add_file(work_path)
+        self.assertLess(os.path.getsize(pack_path), size * 1.5)
+        self.assertEqual(sorted(os.listdir(tmp_dir)),
+                         ['TLG0001.TXT-001.txt', 'works.zip'])
+        with PackedWorks(pack_path) as pack:
+            self.assertEqual(pack.names(), ['TLG0001.TXT-001.txt',
+                                            'TLG0001.TXT-002.txt'])
+            self.assertEqual(pack.read('TLG0001.TXT-001.txt'),
+                             'θεὰ\n' * 1000)
+            self.assertEqual(pack.read('TLG0001.TXT-002.txt'),
+                             'ἄειδε\n' * 1000)
+        with zipfile.ZipFile(pack_path) as pack_zip:
+            self.assertIsNone(pack_zip.testzip())
+            self.assertEqual(pack_zip.getinfo('TLG0001.TXT-002.txt')
+                             .compress_type, zipfile.ZIP_DEFLATED)
+
     def test_tlgu_convert_fail(self):
         """Test the TLGU to fail when importing a corpus that doesn't exist."""
         tlgu = TLGU()
@@ -420,7 +808,712 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         with self.assertRaises(SystemExit):
             build_corpus_index('unsupported_corpus')
 
+    def test_author_index_cache(self):
+        """Test that an author index is saved, reused, and rebuilt when
+        AUTHTAB.DIR changes."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        authtab_path = os.path.join(tmp_dir, 'AUTHTAB.DIR')
+        shutil.copy('cltk/tests/tlg_fake_authtab_for_testing.txt',
+                    authtab_path)
+        index = load_author_index('tlg', authtab_path)
+        self.assertEqual(index.author('TLG0116'), 'Abydenus Hist.')
+        self.assertIsNone(index.author('TLG9999'))
+        self.assertEqual(index.search('ZOS'), ['TLG1832', 'TLG4084'])
+        self.assertEqual(index.search('hist'), ['TLG0116', 'TLG4084'])
+        self.assertTrue(os.path.isfile(authtab_path + '.index.json'))
+        with mock.patch('cltk.corpus.utils.formatter._parse_authtab') as parse:
+            self.assertEqual(len(load_author_index('tlg', authtab_path)), 4)
+            self.assertFalse(parse.called)
+        with open(authtab_path, 'rb') as authtab_file:
+            authtab = authtab_file.read()
+        with open(authtab_path, 'wb') as authtab_file:
+            authtab_file.write(authtab.replace(b'\xffTLG4084', b'\xff'))
+        self.assertEqual(build_corpus_index('tlg', authtab_path),
+                         {'TLG0116': 'Abydenus Hist.',
+                          'TLG2064': 'Acacius Theol.',
+                          'TLG1832': 'Zosimus Alchem.'})
+
+    def test_index_from_files(self):
+        """Test indexing works by author, updating the saved index as works
+        are added and removed, and from a packed container."""
+        works_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, works_dir)
+        for name in ['TLG0012.TXT-002.txt', 'TLG0012.TXT-001.txt',
+                     'TLG0001.TXT-001.txt', 'notes.txt']:
+            open(os.path.join(works_dir, name), 'w').close()
+        index = index_from_files(works_dir)
+        self.assertEqual(index['TLG0012'], {'name': 'Homerus Epic., Homer',
+                                            'works': ['TXT-001', 'TXT-002']})
+        self.assertEqual(index['TLG0001']['works'], ['TXT-001'])
+        self.assertEqual(index['TLG0002']['works'], [])
+        self.assertTrue(os.path.isfile(os.path.join(works_dir,
+                                                    '.works_index.json')))
+        open(os.path.join(works_dir, 'TLG0012.TXT-003.txt'), 'w').close()
+        os.remove(os.path.join(works_dir, 'TLG0001.TXT-001.txt'))
+        index = index_from_files(works_dir)
+        self.assertEqual(index['TLG0012']['works'],
+                         ['TXT-001', 'TXT-002', 'TXT-003'])
+        self.assertEqual(index['TLG0001']['works'], [])
+        pack_path = os.path.join(works_dir, 'individual_works.zip')
+        with PackedWorks(pack_path, 'a') as pack:
+            pack.add_file(os.path.join(works_dir, 'TLG0012.TXT-001.txt'))
+        index = index_from_files(pack_path)
+        self.assertEqual(index['TLG0012']['works'], ['TXT-001'])
+
+    def test_mapped_index(self):
+        """Test writing a mapping and looking it up through a memory map."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        index_path = os.path.join(tmp_dir, 'test.map')
+        mapping = {'TLG0012': 'Homerus Epic., Homer',
+                   'TLG0001': {'works': ['TXT-001'] * 50, 'name': 'Ἀπολλώνιος'},
+                   'Ἀ': None}
+        self.assertEqual(write_mapped_index(index_path, mapping), 3)
+        index = MappedIndex(index_path)
+        self.addCleanup(index.close)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(list(index), sorted(mapping))
+        self.assertEqual(dict(index.items()), mapping)
+        self.assertIn('Ἀ', index)
+        self.assertNotIn('TLG0002', index)
+        with self.assertRaises(KeyError):
+            index['TLG0002']  # pylint: disable=W0104
+        self.assertEqual(index.get('TLG0002', 'missing'), 'missing')
+
+    def test_tlg_indices(self):
+        """Test looking up the TLG indices shipped with the CLTK."""
+        self.assertEqual(TLG_INDEX['TLG0012'], 'Homerus Epic., Homer')
+        self.assertEqual(len(TLG_INDEX), 1823)
+        self.assertEqual(TLG_WORKS_INDEX['TLG0012']['name'],
+                         'Homerus Epic., Homer')
+        self.assertEqual(TLG_MASTER_INDEX['Oracula Sibyllina']['tlg_id'],
+                         'TLG1551')
+
+    def test_author_index_phi7(self):
+        """Test building a PHI7 index, whose file codes have several
+        prefixes."""
+        index = load_author_index('phi7',
+                                  'cltk/tests/phi5_fake_authtab_for_testing.txt',
+                                  cache=False)
+        self.assertEqual(index['CIV0002'], 'Septuagint')
+        self.assertEqual(index['COP0001'], 'Coptic New Testament')
+        self.assertEqual(index['LAT0400'], 'Lucius Accius')
+        self.assertNotIn('LAT9999', index)
+
+
+def make_tar_gz(members):
+    """Build an in-memory ``.tar.gz`` from a dict of name: bytes."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+        for name, data in sorted(members.items()):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class CorpusRequestHandler(BaseHTTPRequestHandler):
+    """Stand-in for GitHub, serving the archives in ``files``. Supports
+    ``ETag`` revalidation and ``Range`` requests, unless ``accept_ranges``
+    is unset, and records the headers of every request in ``requests``.
+    Range requests are answered with ``range_error``, if it is set.
+    """
+    files = {}
+    requests = []
+    accept_ranges = True
+    range_error = None
+
+    def do_GET(self):  # pylint: disable=C0103
+        """Send a whole file, a byte range of it, 304, or 404."""
+        self.requests.append(dict(self.headers))
+        body = self.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = '"{0}"'.format(hashlib.md5(body).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        byte_range = self.headers.get('Range')
+        if byte_range and self.range_error:
+            self.send_error(self.range_error)
+            return
+        if byte_range and self.accept_ranges and \
+                self.headers.get('If-Range', etag) == etag:
+            start, end = byte_range.split('=')[1].split('-')
+            start = int(start)
+            if start >= len(body):
+                self.send_error(416)
+                return
+            end = min(int(end or len(body) - 1), len(body) - 1)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {0}-{1}/{2}'.format(
+                start, end, len(body)))
+            body = body[start:end + 1]
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        if self.accept_ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=W0221
+        """Keep test output quiet."""
+        pass
+
+
+class TestLocalImport(unittest.TestCase):  # pylint: disable=R0904
+    """Test downloading corpora from a local HTTP server into a temporary
+    ``cltk_data``."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the HTTP server in a background thread."""
+        cls.server = HTTPServer(('127.0.0.1', 0), CorpusRequestHandler)
+        cls.base_url = 'http://127.0.0.1:{0}'.format(cls.server.server_port)
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Point ``CLTK_DATA_DIR`` at a temporary directory."""
+        self.data_dir = tempfile.mkdtemp()
+        patcher = mock.patch.dict(os.environ, {'CLTK_DATA_DIR': self.data_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.archive = make_tar_gz({'author/text.txt': b'arma virumque cano'})
+        CorpusRequestHandler.files['/test_corpus.tar.gz'] = self.archive
+        CorpusRequestHandler.requests = []
+        CorpusRequestHandler.accept_ranges = True
+        CorpusRequestHandler.range_error = None
+
+    def test_download_streams_to_disk(self):
+        """Test that a download is written to ``originals`` and unpacked,
+        leaving no partial file behind."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('text', 'test_corpus', url)  # pylint: disable=W0212
+        originals = os.path.join(self.data_dir, 'originals')
+        with open(os.path.join(originals, 'test_corpus.tar.gz'), 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+        self.assertFalse(os.path.exists(os.path.join(originals, 'test_corpus.tar.gz.part')))  # pylint: disable=C0301
+        text_path = os.path.join(self.data_dir, 'latin', 'text', 'test_corpus',
+                                 'author', 'text.txt')
+        self.assertTrue(os.path.isfile(text_path))
+
+    def test_import_corpora_batch(self):
+        """Test importing several corpora at once, with one failure not
+        affecting the others."""
+        CorpusRequestHandler.files['/second_corpus.tar.gz'] = \
+            make_tar_gz({'second/text.txt': b'gallia est omnis divisa'})
+        corpora = [{'name': 'test_corpus', 'location': 'remote', 'type': 'text',
+                    'path': self.base_url + '/test_corpus.tar.gz'},
+                   {'name': 'second_corpus', 'location': 'remote',
+                    'type': 'text',
+                    'path': self.base_url + '/second_corpus.tar.gz'},
+                   {'name': 'missing_corpus', 'location': 'remote',
+                    'type': 'text',
+                    'path': self.base_url + '/missing_corpus.tar.gz'}]
+        with mock.patch.object(importer, 'LATIN_CORPORA', corpora):
+            corpus_importer = CorpusImporter('latin')
+            results = corpus_importer.import_corpora(['test_corpus',
+                                                      'second_corpus',
+                                                      'missing_corpus',
+                                                      'unknown_corpus'],
+                                                     max_workers=3)
+        self.assertEqual(results['test_corpus']['status'], 'imported')
+        self.assertEqual(results['second_corpus']['status'], 'imported')
+        self.assertEqual(results['missing_corpus']['status'], 'failed')
+        self.assertEqual(results['unknown_corpus']['status'], 'failed')
+        self.assertTrue(results['missing_corpus']['error'])
+        text_path = os.path.join(self.data_dir, 'latin', 'text',
+                                 'second_corpus', 'second', 'text.txt')
+        self.assertTrue(os.path.isfile(text_path))
+
+    def test_async_import(self):
+        """Test importing corpora from an event loop, with progress
+        callbacks delivered on the loop's thread."""
+        corpora = [{'name': 'test_corpus', 'location': 'remote', 'type': 'text',
+                    'path': self.base_url + '/test_corpus.tar.gz'},
+                   {'name': 'missing_corpus', 'location': 'remote',
+                    'type': 'text',
+                    'path': self.base_url + '/missing_corpus.tar.gz'}]
+        events = []
+
+        def progress(corpus_name, stage, detail):
+            """Record a stage and the thread it was reported on."""
+            events.append((corpus_name, stage, threading.current_thread()))
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        corpus_importer = AsyncCorpusImporter('latin', max_concurrency=1,
+                                              progress=progress, loop=loop)
+        self.addCleanup(corpus_importer.close)
+        with mock.patch.object(importer, 'LATIN_CORPORA', corpora):
+            results = loop.run_until_complete(
+                corpus_importer.import_corpora(['test_corpus',
+                                                'missing_corpus']))
+            with self.assertRaises(importer.CorpusImportError):
+                loop.run_until_complete(
+                    corpus_importer.import_corpus('missing_corpus'))
+        self.assertEqual(results['test_corpus']['status'], 'imported')
+        self.assertEqual(results['missing_corpus']['status'], 'failed')
+        stages = [stage for name, stage, _ in events if name == 'test_corpus']
+        self.assertEqual(stages, ['downloading', 'downloaded', 'unpacking',
+                                  'imported'])
+        self.assertIn(('missing_corpus', 'queued'),
+                      [(name, stage) for name, stage, _ in events])
+        self.assertEqual({thread for _, _, thread in events},
+                         {threading.current_thread()})
+        text_path = os.path.join(self.data_dir, 'latin', 'text', 'test_corpus',
+                                 'author', 'text.txt')
+        self.assertTrue(os.path.isfile(text_path))
+
+    def test_reimport_unchanged_corpus(self):
+        """Test that a second import of an unchanged corpus revalidates
+        with its ``ETag`` and does not download it again."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('text', 'test_corpus', url)  # pylint: disable=W0212
+        file_path = os.path.join(self.data_dir, 'originals',
+                                 'test_corpus.tar.gz')
+        with open(file_path + '.manifest.json') as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest['sha256'],
+                         hashlib.sha256(self.archive).hexdigest())
+        self.assertEqual(manifest['size'], len(self.archive))
+        mtime = os.stat(file_path).st_mtime_ns
+        corpus_importer._download_corpus('text', 'test_corpus', url)  # pylint: disable=W0212
+        self.assertIn('If-None-Match', CorpusRequestHandler.requests[-1])
+        self.assertEqual(os.stat(file_path).st_mtime_ns, mtime)
+
+    def test_resume_interrupted_download(self):
+        """Test that an interrupted download is resumed with a range
+        request and verified against its checksum."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        originals = os.path.join(self.data_dir, 'originals')
+        os.makedirs(originals)
+        file_path = os.path.join(originals, 'test_corpus.tar.gz')
+        half = len(self.archive) // 2
+        with open(file_path + '.part', 'wb') as part_file:
+            part_file.write(self.archive[:half])
+        etag = '"{0}"'.format(hashlib.md5(self.archive).hexdigest())
+        with open(file_path + '.manifest.json', 'w') as manifest_file:
+            json.dump({'partial': {'etag': etag}}, manifest_file)
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                         hashlib.sha256(self.archive).hexdigest())  # pylint: disable=C0301
+        self.assertEqual(CorpusRequestHandler.requests[-1]['Range'],
+                         'bytes={0}-'.format(half))
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+
+    def test_resume_keeps_part_on_transient_error(self):
+        """Test that a failed range request keeps the partial download,
+        unless the server rejects the range itself."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        originals = os.path.join(self.data_dir, 'originals')
+        os.makedirs(originals)
+        file_path = os.path.join(originals, 'test_corpus.tar.gz')
+        half = len(self.archive) // 2
+        with open(file_path + '.part', 'wb') as part_file:
+            part_file.write(self.archive[:half])
+        etag = '"{0}"'.format(hashlib.md5(self.archive).hexdigest())
+        with open(file_path + '.manifest.json', 'w') as manifest_file:
+            json.dump({'partial': {'etag': etag}}, manifest_file)
+        corpus_importer = CorpusImporter('latin')
+        CorpusRequestHandler.range_error = 503
+        with self.assertRaises(importer.CorpusImportError):
+            corpus_importer._download_corpus('text', 'test_corpus', url)  # pylint: disable=W0212
+        self.assertEqual(os.path.getsize(file_path + '.part'), half)
+        CorpusRequestHandler.range_error = 416
+        corpus_importer._download_corpus('text', 'test_corpus', url)  # pylint: disable=W0212
+        self.assertNotIn('Range', CorpusRequestHandler.requests[-1])
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+
+    def test_segmented_download(self):
+        """Test downloading an archive as parallel byte ranges, and falling
+        back to a single stream when the server does not support ranges."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        file_path = os.path.join(self.data_dir, 'originals',
+                                 'test_corpus.tar.gz')
+        sha256 = hashlib.sha256(self.archive).hexdigest()
+        corpus_importer = CorpusImporter('latin')
+        with mock.patch.object(importer, 'SEGMENT_PROBE_SIZE', 16):
+            corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                             sha256, segments=4)
+        ranges = [request['Range'] for request in
+                  CorpusRequestHandler.requests]
+        self.assertEqual(len(ranges), 5)
+        self.assertEqual(ranges[0], 'bytes=0-15')
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+        self.assertFalse(os.path.exists(file_path + '.part'))
+        os.remove(file_path)
+        CorpusRequestHandler.accept_ranges = False
+        CorpusRequestHandler.requests = []
+        with mock.patch.object(importer, 'SEGMENT_PROBE_SIZE', 16):
+            corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                             sha256, segments=4)
+        self.assertEqual(len(CorpusRequestHandler.requests), 1)
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+
+    def test_segmented_download_connection_error(self):
+        """Test that a segment broken off mid-transfer falls back to a
+        single stream."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        file_path = os.path.join(self.data_dir, 'originals',
+                                 'test_corpus.tar.gz')
+        corpus_importer = CorpusImporter('latin')
+        download_file = corpus_importer._download_file  # pylint: disable=W0212
+
+        def broken_chunks(chunk_size=1):  # pylint: disable=W0613
+            """Fail as a dropped connection does."""
+            raise importer.requests.exceptions.ChunkedEncodingError('dropped')
+            yield b''  # pylint: disable=W0101
+
+        def break_segments(url, corpus_name, headers=None):
+            """Break every request for a later segment of the file."""
+            response = download_file(url, corpus_name, headers)
+            if headers and not headers.get('Range', 'bytes=0-').startswith('bytes=0-'):  # pylint: disable=C0301
+                response.iter_content = broken_chunks
+            return response
+
+        with mock.patch.object(importer, 'SEGMENT_PROBE_SIZE', 16), \
+                mock.patch.object(corpus_importer, '_download_file',
+                                  break_segments):
+            corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                             segments=4)
+        self.assertNotIn('Range', CorpusRequestHandler.requests[-1])
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+
+    def test_checksum_mismatch_fails(self):
+        """Test that an archive not matching its expected checksum is
+        rejected."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        corpus_importer = CorpusImporter('latin')
+        with self.assertRaises(importer.CorpusImportError):
+            corpus_importer._download_corpus('text', 'test_corpus', url, '0' * 64)  # pylint: disable=W0212,C0301
+
+    def test_stream_unpack(self):
+        """Test extracting an archive while it downloads, with and without
+        keeping a copy in ``originals``."""
+        url = self.base_url + '/test_corpus.tar.gz'
+        file_path = os.path.join(self.data_dir, 'originals',
+                                 'test_corpus.tar.gz')
+        text_path = os.path.join(self.data_dir, 'latin', 'text', 'test_corpus',
+                                 'author', 'text.txt')
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                         stream_unpack=True,
+                                         keep_archive=False)
+        self.assertTrue(os.path.isfile(text_path))
+        self.assertFalse(os.path.exists(file_path))
+        shutil.rmtree(os.path.join(self.data_dir, 'latin'))
+        os.remove(file_path + '.manifest.json')
+        corpus_importer._download_corpus('text', 'test_corpus', url,  # pylint: disable=W0212
+                                         stream_unpack=True)
+        self.assertTrue(os.path.isfile(text_path))
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), self.archive)
+
+    def test_sync_local_corpus(self):
+        """Test that re-importing a local corpus in sync mode copies only
+        the files that changed."""
+        source = os.path.join(self.data_dir, 'source', 'TLG_E')
+        os.makedirs(source)
+        for name in ('TLG0001.TXT', 'TLG0002.TXT', 'TLG0004.TXT'):
+            with open(os.path.join(source, name), 'w') as file:
+                file.write(name)
+        stages = []
+        corpus_importer = CorpusImporter(
+            'greek', progress=lambda name, stage, detail: stages.append(
+                (stage, detail)))
+        corpus_importer.import_corpus('tlg', source, sync=True)
+        originals = os.path.join(self.data_dir, 'originals', 'tlg')
+        inode = os.stat(os.path.join(originals, 'TLG0001.TXT')).st_ino
+        with open(os.path.join(source, 'TLG0002.TXT'), 'w') as file:
+            file.write('changed')
+        os.remove(os.path.join(source, 'TLG0004.TXT'))
+        with open(os.path.join(source, 'TLG0003.TXT'), 'w') as file:
+            file.write('new')
+        del stages[:]
+        corpus_importer.import_corpus('tlg', source, sync=True)
+        self.assertIn(('synced', {'copied': 2, 'unchanged': 1, 'removed': 1}),
+                      stages)
+        self.assertEqual(sorted(os.listdir(originals)),
+                         ['TLG0001.TXT', 'TLG0002.TXT', 'TLG0003.TXT'])
+        with open(os.path.join(originals, 'TLG0002.TXT')) as file:
+            self.assertEqual(file.read(), 'changed')
+        self.assertEqual(os.stat(os.path.join(originals, 'TLG0001.TXT')).st_ino,
+                         inode)
+        with self.assertRaises(SystemExit):
+            corpus_importer.import_corpus(
+                'tlg', os.path.join(self.data_dir, 'missing', 'TLG_E'),
+                sync=True)
+        self.assertEqual(stages[-1][0], 'failed')
+
+    def test_lazy_import(self):
+        """Test reading a pickle out of a corpus kept as an indexed archive
+        rather than extracted."""
+        CorpusRequestHandler.files['/model.tar.gz'] = make_tar_gz(
+            {'tokenizers/sentence/latin.pickle': pickle.dumps({'a': 1}),
+             'README.md': b'readme'})
+        url = self.base_url + '/model.tar.gz'
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('trained_model', 'model', url,  # pylint: disable=W0212
+                                         lazy=True)
+        unpack_dir = os.path.join(self.data_dir, 'latin', 'trained_model',
+                                  'model')
+        self.assertEqual(os.listdir(unpack_dir),
+                         [archive_index.INDEX_FILE_NAME])
+        pickle_path = os.path.join(unpack_dir, 'tokenizers', 'sentence',
+                                   'latin.pickle')
+        self.assertTrue(archive_index.member_exists(pickle_path))
+        self.assertEqual(open_pickle(pickle_path), {'a': 1})
+        self.assertFalse(archive_index.member_exists(unpack_dir + '/missing'))
+        originals = os.path.join(self.data_dir, 'originals')
+        self.assertFalse(os.path.exists(os.path.join(originals,
+                                                     'model.tar.gz')))
+        self.assertTrue(os.path.isfile(os.path.join(originals, 'model.tar')))
+        corpus_importer._download_corpus('trained_model', 'model', url,  # pylint: disable=W0212
+                                         lazy=True)
+        self.assertIn('If-None-Match', CorpusRequestHandler.requests[-1])
+
+    def test_lazy_lemmata(self):
+        """Test lemmatizing with lemmata read out of a lazily imported
+        corpus in a relocated data directory."""
+        CorpusRequestHandler.files['/lemmata.tar.gz'] = make_tar_gz(
+            {'lemmata/lemma_list.py':
+                 b"REPLACEMENT_PATTERNS = [(r'\\bamabat\\b', 'amo')]\n"})
+        url = self.base_url + '/lemmata.tar.gz'
+        corpus_importer = CorpusImporter('latin')
+        corpus_importer._download_corpus('trained_model',  # pylint: disable=W0212
+                                         'cltk_linguistic_data', url,
+                                         lazy=True)
+        lemmatizer = LemmaReplacer('latin')
+        self.assertEqual(lemmatizer.lemmatize('puella amabat'), 'puella amo')
+
+    def test_tlgu_data_dir(self):
+        """Test that TLGU looks for its source in the relocated data
+        directory, and does not import it again when it is there."""
+        tlgu_dir = os.path.join(self.data_dir, 'greek', 'software', 'tlgu')
+        os.makedirs(tlgu_dir)
+        open(os.path.join(tlgu_dir, 'tlgu.h'), 'w').close()
+        with mock.patch('cltk.corpus.greek.tlgu.CorpusImporter') as corpus_importer:  # pylint: disable=C0301
+            TLGU._check_import_source()  # pylint: disable=W0212
+        self.assertFalse(corpus_importer.called)
+
+    def test_shared_store(self):
+        """Test that a corpus imported into a shared store by one node is
+        linked, not downloaded, by another."""
+        store_dir = os.path.join(self.data_dir, 'store')
+        corpora = [{'name': 'test_corpus', 'location': 'remote', 'type': 'text',
+                    'path': self.base_url + '/test_corpus.tar.gz'}]
+        rel_path = os.path.join('latin', 'text', 'test_corpus', 'author',
+                                'text.txt')
+        with mock.patch.object(importer, 'LATIN_CORPORA', corpora):
+            CorpusImporter('latin', store=store_dir).import_corpus('test_corpus')
+            first_node = os.path.join(self.data_dir, rel_path)
+            self.assertTrue(os.path.islink(first_node))
+            second_data_dir = os.path.join(self.data_dir, 'second_node')
+            with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': second_data_dir}):
+                requests_made = len(CorpusRequestHandler.requests)
+                CorpusImporter('latin', store=store_dir).import_corpus('test_corpus')  # pylint: disable=C0301
+                self.assertEqual(len(CorpusRequestHandler.requests),
+                                 requests_made)
+        second_node = os.path.join(second_data_dir, rel_path)
+        self.assertEqual(os.path.realpath(first_node),
+                         os.path.realpath(second_node))
+        with open(second_node) as file:
+            self.assertEqual(file.read(), 'arma virumque cano')
+
+    def test_bundle_round_trip(self):
+        """Test exporting imported corpora to a bundle and importing it into
+        another, empty, data directory."""
+        corpora = [{'name': 'test_corpus', 'location': 'remote', 'type': 'text',
+                    'path': self.base_url + '/test_corpus.tar.gz'},
+                   {'name': 'phi5', 'location': 'local', 'type': 'text',
+                    'path': ''}]
+        source = os.path.join(self.data_dir, 'source', 'PHI5')
+        os.makedirs(source)
+        with open(os.path.join(source, 'LAT0474.TXT'), 'wb') as file:
+            file.write(b'cicero')
+        bundle_path = os.path.join(self.data_dir, 'bundle.tar')
+        with mock.patch.object(importer, 'LATIN_CORPORA', corpora):
+            corpus_importer = CorpusImporter('latin')
+            corpus_importer.import_corpus('test_corpus')
+            corpus_importer.import_corpus('phi5', source)
+            corpus_importer.export_bundle(['test_corpus', 'phi5'], bundle_path)
+            second_data_dir = os.path.join(self.data_dir, 'second_node')
+            with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': second_data_dir}):
+                results = CorpusImporter('latin').import_bundle(bundle_path)
+        self.assertEqual(results['test_corpus']['status'], 'imported')
+        self.assertEqual(results['phi5']['status'], 'imported')
+        for rel_path in (os.path.join('latin', 'text', 'test_corpus', 'author',
+                                      'text.txt'),
+                         os.path.join('originals', 'test_corpus.tar.gz'),
+                         os.path.join('originals', 'phi5', 'LAT0474.TXT')):
+            with open(os.path.join(self.data_dir, rel_path), 'rb') as file:
+                original = file.read()
+            with open(os.path.join(second_data_dir, rel_path), 'rb') as file:
+                self.assertEqual(file.read(), original)
+        archive_path = os.path.join('originals', 'test_corpus.tar.gz')
+        self.assertEqual(
+            os.stat(os.path.join(second_data_dir, archive_path)).st_mtime_ns,
+            os.stat(os.path.join(self.data_dir, archive_path)).st_mtime_ns)
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': second_data_dir}):
+            CorpusImporter('latin')._download_corpus(  # pylint: disable=W0212
+                'text', 'test_corpus', self.base_url + '/test_corpus.tar.gz')
+        self.assertIn('If-None-Match', CorpusRequestHandler.requests[-1])
+
+    def test_bundle_refuses_unsafe_paths(self):
+        """Test that a bundle cannot write outside the data directory."""
+        inner = make_tar_gz({'../escaped.txt': b'escaped'})
+        manifest = json.dumps({'cltk_bundle': 1, 'corpora': [
+            {'name': 'test_corpus', 'language': 'latin', 'type': 'text',
+             'member': 'corpora/latin/test_corpus.tar.gz',
+             'paths': ['../escaped.txt'],
+             'mtime_ns': {'../escaped.txt': 0}}]}).encode('utf-8')
+        bundle_path = os.path.join(self.data_dir, 'bundle.tar')
+        with tarfile.open(bundle_path, 'w') as bundle:
+            for name, data in (('manifest.json', manifest),
+                               ('corpora/latin/test_corpus.tar.gz', inner)):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                bundle.addfile(info, io.BytesIO(data))
+        second_data_dir = os.path.join(self.data_dir, 'second_node')
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': second_data_dir}):
+            results = CorpusImporter('latin').import_bundle(bundle_path)
+        self.assertEqual(results['test_corpus']['status'], 'failed')
+        self.assertFalse(os.path.exists(os.path.join(self.data_dir,
+                                                     'escaped.txt')))
+
+
+def id_string(string):
+    """Encode a string as in a TLG ID code: high bit set, ending in 0xFF."""
+    return bytes(byte | 0x80 for byte in string.encode('ascii')) + b'\xff'
+
+
+class TestTLGReader(unittest.TestCase):  # pylint: disable=R0904
+    """Test reading TLG and PHI files without ``tlgu``."""
+
+    def setUp(self):
+        """Write a TLG file of two blocks: a first work with incremented and
+        reset citations, and a second with lettered ones."""
+        block_1 = b'\xef\x80' + id_string('0001') + b'\xef\x81' + \
+            id_string('001') + b'\x91\x80LINE ONE\x80LINE TWO\x90\x80THREE\xfe'
+        block_1 += b'\x00' * (tlg_reader.BLOCK_SIZE - len(block_1))
+        block_2 = b'\xef\x80' + id_string('0001') + b'\xef\x81' + \
+            id_string('002') + b'\x8a\x0c' + id_string('a') + \
+            b'OTHER\x8e\xe2LINE\xf0'
+        self.file_path = os.path.join(tempfile.mkdtemp(), 'TLG0001.TXT')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.file_path))
+        with open(self.file_path, 'wb') as file:
+            file.write(block_1 + block_2)
+
+    def test_read_lines(self):
+        """Test reading the text and citation of a line."""
+        lines = list(tlg_reader.read_lines('cltk/tests/tlgu_test_text_beta_code.txt'))  # pylint: disable=C0301
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0].author, '1800')
+        self.assertEqual(lines[0].work, '001')
+        self.assertEqual(lines[0].citation, ('1',))
+        self.assertEqual(lines[0].text.rstrip(),
+                         "BLLON D' A)LLLOUS XALKRESIN E)GXEH|SIN.")
+
+    def test_read_works(self):
+        """Test grouping lines into works across blocks, with incremented,
+        reset, and lettered citations."""
+        works = list(tlg_reader.read_works(self.file_path))
+        self.assertEqual([work.work for work in works], ['001', '002'])
+        self.assertEqual([(line.citation, line.text) for line in works[0].lines],
+                         [(('1', '1'), 'LINE ONE'),
+                          (('1', '2'), 'LINE TWO'),
+                          (('2', '1'), 'THREE')])
+        self.assertEqual([(line.citation, line.text) for line in works[1].lines],
+                         [(('12a',), 'OTHER'), (('12b',), 'LINE')])
+
+    def test_read_malformed(self):
+        """Test that malformed ID codes are reported with their offset."""
+        block = b'TEXT\xe0\x9f'
+        cut_off = b'TEXT\x00\x88'
+        cut_off = b'\x00' * (tlg_reader.BLOCK_SIZE - len(cut_off)) + cut_off
+        for data, offset in ((block, 4), (cut_off, tlg_reader.BLOCK_SIZE - 1)):
+            with open(self.file_path, 'wb') as file:
+                file.write(data)
+            with self.assertRaisesRegex(ValueError, 'offset {0}'.format(offset)):
+                list(tlg_reader.read_lines(self.file_path))
+
+
+class TestCitationIndex(unittest.TestCase):  # pylint: disable=R0904
+    """Test looking up lines of text converted with full markup."""
+
+    def setUp(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.file_path = os.path.join(tmp_dir, 'TLG0032.TXT-006.txt')
+        with open(self.file_path, 'w', encoding='utf-8') as text_file:
+            text_file.write('1.1.1\tΔαρείου καὶ Παρυσάτιδος\n'
+                            '1.1.2\tγίγνονται παῖδες δύο\n'
+                            '\n'
+                            '1-2.1.1\tπρεσβύτερος\n'
+                            '1.2.1\tνεώτερος\n'
+                            '12b.1\tΚῦρος\n')
+
+    def test_citation_index(self):
+        """Test looking up lines and passages by citation."""
+        self.assertEqual(citation_index.build_citation_index(self.file_path),
+                         5)
+        with citation_index.CitationIndex(self.file_path) as index:
+            self.assertEqual(index.passage('1.1'),
+                             'Δαρείου καὶ Παρυσάτιδος\nγίγνονται παῖδες δύο')
+            self.assertEqual(index.lines(('1', '2')),
+                             [(('1', '2', '1'), 'νεώτερος')])
+            self.assertEqual([line[0] for line in index.lines('1')],
+                             [('1', '1', '1'), ('1', '1', '2'),
+                              ('1', '2', '1')])
+            self.assertEqual(index.passage('1-2'), 'πρεσβύτερος')
+            self.assertEqual(index.passage('12b'), 'Κῦρος')
+            self.assertEqual(index.lines('3'), [])
+
+    def test_convert_corpus_citation_index(self):
+        """Test indexing the full markup variant of a conversion."""
+        data_dir = os.path.dirname(self.file_path)
+        orig_dir = os.path.join(data_dir, 'originals', 'tlg')
+        os.makedirs(orig_dir)
+        shutil.copy(self.file_path, os.path.join(orig_dir, 'TLG0032.TXT'))
 
+        def call_tlgu(input_path, output_path, tlgu_flags):
+            """Copy the input, which is in full markup already."""
+            shutil.copy(input_path, output_path)
+        tlgu = TLGU.__new__(TLGU)
+        with mock.patch.dict(os.environ, {'CLTK_DATA_DIR': data_dir}), \
+                mock.patch.object(TLGU, '_call_tlgu', side_effect=call_tlgu):
+            results = tlgu.convert_corpus(corpus='tlg', citation_index=True)
+        self.assertEqual(results['TLG0032.TXT']['variants'],
+                         {'plaintext': 'converted', 'full': 'converted'})
+        text_dir = os.path.join(data_dir, 'greek', 'text', 'tlg')
+        with citation_index.CitationIndex(
+                os.path.join(text_dir, 'full', 'TLG0032.TXT'),
+                os.path.join(text_dir, 'citation_index', 'full',
+                             'TLG0032.TXT.cit')) as index:
+            self.assertEqual(index.passage('1.2.1'), 'νεώτερος')
 
 
 if __name__ == '__main__':
@@ -5,6 +5,8 @@ __license__ = 'MIT License. See LICENSE.'
 
 import os
 
+from cltk.utils.archive_index import member_exists
+from cltk.utils.cltk_data import get_cltk_data_dir
 from cltk.utils.file_operations import open_pickle
 
 from nltk.tokenize.punkt import PunktLanguageVars
@@ -52,12 +54,11 @@ class TokenizeSentence():  # pylint: disable=R0903
         external_punctuation = PUNCTUATION[lang]['external']
 
         file = PUNCTUATION[lang]['file']
-        rel_path = os.path.join('~/cltk_data',
-                                lang,
-                                'trained_model/cltk_linguistic_data/tokenizers/sentence')  # pylint: disable=C0301
-        path = os.path.expanduser(rel_path)
+        path = os.path.join(get_cltk_data_dir(),
+                            lang,
+                            'trained_model/cltk_linguistic_data/tokenizers/sentence')  # pylint: disable=C0301
         tokenizer_path = os.path.join(path, file)
-        assert os.path.isfile(tokenizer_path), 'CLTK linguistics data not found for language {0}'.format(lang)  # pylint: disable=C0301
+        assert os.path.isfile(tokenizer_path) or member_exists(tokenizer_path), 'CLTK linguistics data not found for language {0}'.format(lang)  # pylint: disable=C0301
         return internal_punctuation, external_punctuation, tokenizer_path
 
     def _setup_tokenizer(self, tokenizer: object):
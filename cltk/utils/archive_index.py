@@ -0,0 +1,155 @@
+"""Read single files out of a downloaded corpus archive without extracting
+the whole tree.
+
+``build_archive_index()`` decompresses a ``.tar.gz`` (or ``.bz2``, ``.xz``)
+once into a plain, seekable ``.tar``, which replaces it, and records the
+offset and size of every member. The index is written into the corpus's
+unpack directory, where the extracted files would otherwise be. Paths inside
+that directory can then be resolved with ``member_exists()`` and
+``read_member()``, which seek straight to the member's data.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import shutil
+import tarfile
+import threading
+
+from cltk.utils.cltk_logger import logger
+
+
+INDEX_FILE_NAME = '.cltk_archive_index.json'
+DECOMPRESSORS = {'.gz': gzip.open,
+                 '.tgz': gzip.open,
+                 '.bz2': bz2.open,
+                 '.xz': lzma.open}
+
+_INDICES = {}
+_INDICES_LOCK = threading.Lock()
+
+
+def _normalize_member(name: str):
+    """Make a tar member name comparable to a relative filesystem path."""
+    return os.path.normpath(name.lstrip('/'))
+
+
+def _decompress(archive_path: str):
+    """Write an uncompressed copy of ``archive_path`` beside it and return
+    its path. A plain ``.tar`` is used as is.
+    :rtype : str
+    """
+    root, ext = os.path.splitext(archive_path)
+    decompressor = DECOMPRESSORS.get(ext)
+    if decompressor is None:
+        return archive_path
+    tar_path = root if root.endswith('.tar') else root + '.tar'
+    with decompressor(archive_path, 'rb') as compressed, \
+            open(tar_path + '.tmp', 'wb') as uncompressed:
+        shutil.copyfileobj(compressed, uncompressed, 1024 * 1024)
+    os.replace(tar_path + '.tmp', tar_path)
+    return tar_path
+
+
+def build_archive_index(archive_path: str, unpack_dir: str):
+    """Index the members of an archive and write the index into
+    ``unpack_dir`` in place of the extracted files.
+    :type archive_path: str
+    :param archive_path: A tar archive, compressed or not. A compressed
+    archive is removed once its plain tar has been indexed.
+    :type unpack_dir: str
+    :param unpack_dir: Directory the archive would be extracted to.
+    :rtype : dict
+    :return: Maps member paths to ``[offset, size]`` in the plain tar.
+    """
+    tar_path = _decompress(archive_path)
+    members = {}
+    with tarfile.open(tar_path, 'r:') as tar:
+        for member in tar:
+            if member.isfile():
+                members[_normalize_member(member.name)] = [member.offset_data,
+                                                           member.size]
+    os.makedirs(unpack_dir, exist_ok=True)
+    index_path = os.path.join(unpack_dir, INDEX_FILE_NAME)
+    # relative, so that the data directory can be moved or copied whole
+    archive = os.path.relpath(os.path.abspath(tar_path),
+                              os.path.abspath(unpack_dir))
+    with open(index_path + '.tmp', 'w') as index_file:
+        json.dump({'archive': archive, 'members': members}, index_file)
+    os.replace(index_path + '.tmp', index_path)
+    with _INDICES_LOCK:
+        _INDICES.pop(os.path.abspath(unpack_dir), None)
+    if tar_path != archive_path:
+        os.remove(archive_path)
+    logger.info("Indexed %d members of '%s' at '%s'.",
+                len(members),
+                tar_path,
+                index_path)
+    return members
+
+
+def _load_index(directory: str):
+    """Return the index kept in ``directory``, or None. Indices are read
+    once and then kept in memory.
+    :rtype : dict
+    """
+    with _INDICES_LOCK:
+        if directory in _INDICES:
+            return _INDICES[directory]
+    index_path = os.path.join(directory, INDEX_FILE_NAME)
+    if not os.path.isfile(index_path):
+        return None
+    with open(index_path) as index_file:
+        index = json.load(index_file)
+    with _INDICES_LOCK:
+        _INDICES[directory] = index
+    return index
+
+
+def _find_member(path: str):
+    """Find the index covering ``path`` by looking in each parent directory.
+    :rtype : (str, list)
+    :return: The plain tar and the member's ``[offset, size]``, or Nones.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    directory = os.path.dirname(path)
+    while True:
+        index = _load_index(directory)
+        if index is not None:
+            member = index['members'].get(os.path.relpath(path, directory))
+            if member is None:
+                return None, None
+            return os.path.join(directory, index['archive']), member
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None, None
+        directory = parent
+
+
+def member_exists(path: str):
+    """Check whether ``path`` is available from an indexed archive.
+    :rtype : bool
+    """
+    return _find_member(path)[1] is not None
+
+
+def read_member(path: str):
+    """Read the file that would be at ``path`` had its archive been
+    extracted.
+    :type path: str
+    :param path: Path inside an indexed corpus directory.
+    :rtype : bytes
+    :return: The member's contents, or None if no index covers ``path``.
+    """
+    archive, member = _find_member(path)
+    if member is None:
+        return None
+    offset, size = member
+    with open(archive, 'rb') as archive_file:
+        archive_file.seek(offset)
+        return archive_file.read(size)
@@ -0,0 +1,23 @@
+"""Location of the CLTK's data directory, into which corpora, models, and
+software are imported and where caches and the log are kept.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+import os
+
+
+DEFAULT_DATA_DIR = '~/cltk_data'
+
+
+def get_cltk_data_dir():
+    """The data directory: ``~/cltk_data``, unless it has been moved, e.g.
+    to a shared or scratch disk, with the ``CLTK_DATA_DIR`` environment
+    variable. The variable is read on every call, so it may be set after the
+    CLTK has been imported.
+    :rtype : str
+    :return: The directory, with ``~`` expanded.
+    """
+    return os.path.expanduser(os.environ.get('CLTK_DATA_DIR',
+                                             DEFAULT_DATA_DIR))
@@ -8,11 +8,13 @@ import os
 import logging
 import logging.config
 
-home_dir = os.path.expanduser('~/cltk_data')
+from cltk.utils.cltk_data import get_cltk_data_dir
+
+home_dir = get_cltk_data_dir()
 log_path = os.path.join(home_dir, 'cltk.log')
 
 if not os.path.isdir(home_dir):
-    os.mkdir(home_dir)
+    os.makedirs(home_dir)
 else:
     pass
 
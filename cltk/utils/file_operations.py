@@ -3,18 +3,40 @@
 __author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
 __license__ = 'MIT License. See LICENSE.'
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
 import pickle
+import shutil
 import sys
 
+from cltk.utils.archive_index import read_member
 from cltk.utils.cltk_logger import logger
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# ioctl request number to clone (reflink) a file on Linux; from <linux/fs.h>
+FICLONE = 0x40049409
+
 
 def open_pickle(path: str):
-    """Open a pickle and return loaded pickle object.
+    """Open a pickle and return loaded pickle object. If the file is not on
+    disk, it is looked for in an indexed corpus archive.
     :type path: str
     :param : path: File path to pickle file to be opened.
     :rtype : object
     """
+    if not os.path.isfile(path):
+        data = read_member(path)
+        if data is not None:
+            try:
+                return pickle.loads(data)
+            except Exception as pickle_error:
+                logger.error(pickle_error)
+                sys.exit(1)
     try:
         with open(path, 'rb') as opened_pickle:
             try:
@@ -25,3 +47,126 @@ def open_pickle(path: str):
     except IOError as io_err:
         logger.error(io_err)
         sys.exit(1)
+
+
+def file_sha256(path: str):
+    """Return the sha256 hex digest of a file, read in 1 MB blocks.
+    :type path: str
+    :param path: File to hash.
+    :rtype : str
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _files_match(src: str, dst: str, checksum: bool):
+    """Check whether ``dst`` is already an up-to-date copy of ``src``, by
+    size and modification time and, optionally, by content hash.
+    :rtype : bool
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        return True
+    if src_stat.st_size != dst_stat.st_size or \
+            int(src_stat.st_mtime) != int(dst_stat.st_mtime):
+        return False
+    if checksum:
+        return file_sha256(src) == file_sha256(dst)
+    return True
+
+
+def _clone_file(src: str, dst: str, hardlink: bool):
+    """Put a copy of ``src`` at ``dst`` through a temporary file, so that
+    ``dst`` is never left half written. A hard link is used if requested and
+    both are on the same filesystem; otherwise a reflink (copy-on-write
+    clone) is tried before falling back to an ordinary copy.
+    """
+    tmp = dst + '.cltk-sync'
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    if hardlink and os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev:
+        os.link(src, tmp)
+        os.replace(tmp, dst)
+        return
+    cloned = False
+    if fcntl is not None:
+        with open(src, 'rb') as src_file, open(tmp, 'wb') as tmp_file:
+            try:
+                fcntl.ioctl(tmp_file.fileno(), FICLONE, src_file.fileno())
+                cloned = True
+            except OSError:
+                pass
+    if not cloned:
+        shutil.copyfile(src, tmp)
+    shutil.copystat(src, tmp)
+    os.replace(tmp, dst)
+
+
+def sync_dir(src_rel: str, dst_rel: str, checksum=False, hardlink=False,
+             max_workers=4):
+    """Make ``dst_rel`` a copy of ``src_rel``, copying only files whose size
+    or modification time (and, with ``checksum``, content) differ, and
+    removing files no longer in the source. Copies run in a pool of
+    ``max_workers`` threads.
+    :type src_rel: str
+    :param src_rel: Directory to be copied.
+    :type dst_rel: str
+    :param dst_rel: Directory to be brought up to date; created if missing.
+    :type checksum: bool
+    :param checksum: Also compare sha256 of files that look unchanged.
+    :type hardlink: bool
+    :param hardlink: Hard link rather than copy when on the same filesystem.
+    Note that the two paths then share one file, so edits show in both.
+    :type max_workers: int
+    :param max_workers: Number of files copied at once.
+    :rtype : dict
+    :return: Counts of files ``copied``, ``unchanged``, and ``removed``.
+    """
+    src = os.path.expanduser(src_rel)
+    dst = os.path.expanduser(dst_rel)
+    if not os.path.isdir(src):
+        raise NotADirectoryError(src)
+    to_copy = []
+    src_files = set()
+    unchanged = 0
+    for root, _, files in os.walk(src):
+        rel_root = os.path.relpath(root, src)
+        os.makedirs(os.path.join(dst, rel_root), exist_ok=True)
+        for name in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            src_files.add(rel_path)
+            if _files_match(os.path.join(src, rel_path),
+                            os.path.join(dst, rel_path),
+                            checksum):
+                unchanged += 1
+            else:
+                to_copy.append(rel_path)
+    removed = 0
+    for root, dirs, files in os.walk(dst, topdown=False):
+        rel_root = os.path.relpath(root, dst)
+        for name in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            if rel_path not in src_files:
+                os.remove(os.path.join(root, name))
+                removed += 1
+        for name in dirs:
+            if not os.path.isdir(os.path.join(src, rel_root, name)):
+                shutil.rmtree(os.path.join(root, name))
+
+    def copy(rel_path):
+        """Copy one file from ``src`` to ``dst``."""
+        _clone_file(os.path.join(src, rel_path), os.path.join(dst, rel_path),
+                    hardlink)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(copy, to_copy))
+    logger.info("Synced '%s' to '%s': %d copied, %d unchanged, %d removed.",
+                src, dst, len(to_copy), unchanged, removed)
+    return {'copied': len(to_copy), 'unchanged': unchanged, 'removed': removed}
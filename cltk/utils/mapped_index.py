@@ -0,0 +1,170 @@
+"""Read-only mappings kept in a file and read through a memory map.
+
+Large, static indices, such as those to the TLG, are costly as Python
+literals: importing one parses and builds every entry, and all of them stay
+in memory. A ``MappedIndex`` instead opens its file at first use and finds
+keys by binary search of a sorted table of fixed-size records, decoding only
+the values looked up.
+
+The file begins with ``MAGIC`` and the number of entries, followed by one
+``RECORD`` per entry, sorted by key: the offset of the entry's data and the
+sizes of its key and value. The data are the UTF-8 key followed by the value
+as compact JSON, compressed with zlib where that makes it smaller, as the
+high bit of the value size records.
+"""
+
+__author__ = 'Kyle P. Johnson <kyle@kyle-p-johnson.com>'
+__license__ = 'MIT License. See LICENSE.'
+
+from collections.abc import Mapping
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+
+MAGIC = b'CLTKMAP1'
+RECORD = struct.Struct('>III')
+COMPRESSED = 0x80000000
+
+
+def write_mapped_index(path, mapping):
+    """Write a mapping of strings to JSON-serializable values for
+    ``MappedIndex``.
+    :type path: str
+    :param path: File to write.
+    :type mapping: dict
+    :param mapping: Mapping to store.
+    :rtype : int
+    :return: Number of entries written.
+    """
+    entries = []
+    for key, value in mapping.items():
+        value = json.dumps(value, ensure_ascii=False,
+                           separators=(',', ':')).encode('utf-8')
+        compressed = zlib.compress(value, 9)
+        if len(compressed) < len(value):
+            entries.append((key.encode('utf-8'), compressed, True))
+        else:
+            entries.append((key.encode('utf-8'), value, False))
+    entries.sort()
+    path = os.path.expanduser(path)
+    with open(path + '.tmp', 'wb') as index_file:
+        index_file.write(MAGIC)
+        index_file.write(struct.pack('>I', len(entries)))
+        offset = 0
+        for key, value, compressed in entries:
+            value_size = len(value) | (COMPRESSED if compressed else 0)
+            index_file.write(RECORD.pack(offset, len(key), value_size))
+            offset += len(key) + len(value)
+        for key, value, _ in entries:
+            index_file.write(key)
+            index_file.write(value)
+    os.replace(path + '.tmp', path)
+    return len(entries)
+
+
+class MappedIndex(Mapping):
+    """A read-only mapping backed by a file written by
+    ``write_mapped_index()``. Nothing is read until the first lookup.
+    """
+
+    def __init__(self, path):
+        """
+        :type path: str
+        :param path: Index file.
+        """
+        self.path = os.path.expanduser(path)
+        self._map = None
+        self._count = 0
+        self._data_start = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Map the file, at first use.
+        :rtype : mmap.mmap
+        """
+        with self._lock:
+            if self._map is None:
+                with open(self.path, 'rb') as index_file:
+                    index_map = mmap.mmap(index_file.fileno(), 0,
+                                          access=mmap.ACCESS_READ)
+                header_size = len(MAGIC) + 4
+                if index_map[:len(MAGIC)] != MAGIC:
+                    index_map.close()
+                    raise ValueError("'{0}' is not a mapped index.".format(
+                        self.path))
+                self._count = struct.unpack(
+                    '>I', index_map[len(MAGIC):header_size])[0]
+                self._data_start = header_size + self._count * RECORD.size
+                self._map = index_map
+        return self._map
+
+    def _record(self, number):
+        """Read record ``number``.
+        :rtype : (int, int, int)
+        :return: Offset of the key, and sizes of the key and value.
+        """
+        offset = len(MAGIC) + 4 + number * RECORD.size
+        key_offset, key_size, value_size = RECORD.unpack(
+            self._map[offset:offset + RECORD.size])
+        return self._data_start + key_offset, key_size, value_size
+
+    def _key(self, number):
+        """Read the key of record ``number``.
+        :rtype : bytes
+        """
+        key_offset, key_size, _ = self._record(number)
+        return self._map[key_offset:key_offset + key_size]
+
+    def _find(self, key):
+        """Binary-search for ``key``.
+        :rtype : int
+        :return: Record number, or -1 if not found.
+        """
+        self._open()
+        if not isinstance(key, str):
+            return -1
+        key = key.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == key:
+            return low
+        return -1
+
+    def __getitem__(self, key):
+        number = self._find(key)
+        if number < 0:
+            raise KeyError(key)
+        key_offset, key_size, value_size = self._record(number)
+        start = key_offset + key_size
+        value = self._map[start:start + (value_size & ~COMPRESSED)]
+        if value_size & COMPRESSED:
+            value = zlib.decompress(value)
+        return json.loads(value.decode('utf-8'))
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        self._open()
+        for number in range(self._count):
+            yield self._key(number).decode('utf-8')
+
+    def __len__(self):
+        self._open()
+        return self._count
+
+    def close(self):
+        """Release the memory map; it is reopened if used again."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
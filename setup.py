@@ -33,8 +33,9 @@ setup(
     long_description="The Classical Language Toolkit (CLTK) is a framework for natural language processing for Classical languages.",  # pylint: disable=C0301
     name='cltk',
     packages=find_packages(),
+    package_data={'cltk.corpus.greek': ['data/*.map']},
     url='https://github.com/kylepjohnson/cltk',
     version='0.0.1.10',
-    zip_safe=True,
+    zip_safe=False,
     test_suite='cltk.tests.test_cltk',
 )